@@ -0,0 +1,76 @@
+"""Cost of adding a new year: full reload vs append to a partitioned dataset.
+
+A synthetic dataset (dashboard.synthetic) is split into its history and
+its last year.  The script times what a new year costs today - parsing
+the whole replaced CSV into the in-memory backend, or re-partitioning it -
+against appending the year as new fragments and reopening the dataset,
+and counts how many chart versions (dashboard.views.common.cached_chart
+keys figures on them) survive the append: every single year, and every
+year range starting at the first year.
+
+Usage: python benchmarks/bench_append.py [--countries N] [--years FIRST:LAST]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dashboard.schema import YEAR
+from dashboard.views.economy import COLUMNS
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - t0) * 1000
+
+
+def main():
+    from dashboard import loader
+    from dashboard.partitioned import append_partitioned, write_partitioned
+    from dashboard.query import load_query
+    from dashboard.synthetic import generate
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--countries', type=int, default=6000)
+    parser.add_argument('--years', type=lambda v: tuple(int(y) for y in v.split(':')), default=(2000, 2023),
+                        help='FIRST:LAST, inclusive')
+    args = parser.parse_args()
+    first, last = args.years
+
+    with tempfile.TemporaryDirectory() as tmp:
+        df = generate(args.countries, args.years, seed=0)
+        full, history, new = (os.path.join(tmp, name) for name in ('full.csv', 'history.csv', 'new.csv'))
+        df.to_csv(full, index=False, encoding='utf-8-sig')
+        df[df[YEAR] < last].to_csv(history, index=False, encoding='utf-8-sig')
+        df[df[YEAR] == last].to_csv(new, index=False, encoding='utf-8-sig')
+        print(f'{args.countries} countries, {first}-{last - 1} + {last}')
+
+        _, reload_ms = timed(lambda: load_query(full, COLUMNS, backend='pandas'))
+        loader.clear_cache()
+        _, repartition_ms = timed(lambda: write_partitioned(full, os.path.join(tmp, 'full.parts')))
+
+        parts = write_partitioned(history, os.path.join(tmp, 'dataset.parts'))
+        before = load_query(parts, COLUMNS)
+        singles = {y: before.data_version(None, y) for y in range(first, last)}
+        ranges = {y: before.data_version((first, y)) for y in range(first, last)}
+        _, append_ms = timed(lambda: append_partitioned(new, parts))
+        after, reopen_ms = timed(lambda: load_query(parts, COLUMNS))
+        assert after.year_bounds == (first, last)
+
+        print(f'{"full reload into pandas":<32} {reload_ms:>9.1f} ms')
+        print(f'{"re-partition everything":<32} {repartition_ms:>9.1f} ms')
+        print(f'{"append new year":<32} {append_ms:>9.1f} ms')
+        print(f'{"reopen after append":<32} {reopen_ms:>9.1f} ms')
+        kept = sum(after.data_version(None, y) == v for y, v in singles.items())
+        print(f'single-year versions kept: {kept}/{len(singles)}')
+        kept = sum(after.data_version((first, y)) == v for y, v in ranges.items())
+        print(f'year-range versions kept:  {kept}/{len(ranges)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""Query backends compared on the page filters, at 100x the bundled dataset.
+
+Every backend of dashboard.query.BACKENDS that can run here is opened on
+the same synthetic dataset (dashboard.synthetic, `--scale` times as many
+countries as the bundled CSV) and asked for the frames the pages request:
+year ranges for all, three and one countries, single years, and the two
+long forms.  The script reports the time to open the backend (the first
+load_query) and the median time of each request, and checks that every
+backend returns the same frame as the pandas backend.
+
+Usage: python benchmarks/bench_backends.py [--scale N] [--repeat N] [--snapshot] [--backend NAME ...]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from dashboard.derived import DERIVED
+from dashboard.query import BACKENDS, load_query
+from dashboard.schema import COUNTRY, INDICATORS, YEAR
+
+DATAPATH = os.path.join(ROOT, 'country_comparison_large_dataset_vn.csv')
+
+
+def requests(query):
+    """[(label, function of the query)] mirroring the page filters."""
+    countries = query.countries
+    lo, hi = query.year_bounds
+    return [
+        ('range/all', lambda q: q.select(countries, years=(lo, hi))),
+        ('range/three', lambda q: q.select(countries[:3], years=(lo, hi))),
+        ('last5/one', lambda q: q.select(countries[:1], years=(hi - 4, hi))),
+        ('year/all', lambda q: q.select(countries, year=hi)),
+        ('year/three', lambda q: q.select(countries[:3], year=lo)),
+        ('poverty', lambda q: q.long_form('poverty', hi, countries)),
+        ('energy_share', lambda q: q.long_form('energy_share', hi, countries)),
+    ]
+
+
+def same_frame(a, b):
+    try:
+        pd.testing.assert_frame_equal(a.reset_index(drop=True), b.reset_index(drop=True))
+    except AssertionError:
+        return False
+    return True
+
+
+def main():
+    from dashboard.loader import load_dataset
+    from dashboard.partitioned import write_partitioned
+    from dashboard.synthetic import write_dataset
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=int, default=100, help='times as many countries as the bundled CSV')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--snapshot', action='store_true', help='also write the Parquet snapshot')
+    parser.add_argument('--backend', action='append', choices=list(BACKENDS), help='backends to run (default: all)')
+    args = parser.parse_args()
+
+    bundled = load_dataset(DATAPATH, columns=[])
+    years = (int(bundled[YEAR].min()), int(bundled[YEAR].max()))
+    countries = bundled[COUNTRY].nunique() * args.scale
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'dataset.csv')
+        write_dataset(path, countries, years, seed=args.scale, snapshot=args.snapshot)
+        sources = {'partitioned': write_partitioned(path)}
+        print(f'{countries} countries x {years[1] - years[0] + 1} years, {args.repeat} repeats')
+
+        reference = None
+        results = {}
+        for backend in args.backend or BACKENDS:
+            t0 = time.perf_counter()
+            try:
+                query = load_query(sources.get(backend, path), INDICATORS + list(DERIVED), backend=backend)
+            except ImportError as e:
+                print(f'{backend}: skipped ({e})')
+                continue
+            opened = (time.perf_counter() - t0) * 1000
+            timings = {'open': [opened]}
+            frames = {}
+            for label, request in requests(query):
+                samples = []
+                for _ in range(args.repeat):
+                    t0 = time.perf_counter()
+                    frames[label] = request(query)
+                    samples.append((time.perf_counter() - t0) * 1000)
+                timings[label] = samples
+            if reference is None:
+                reference = frames
+            mismatched = [label for label in frames if not same_frame(frames[label], reference[label])]
+            results[backend] = (timings, mismatched)
+
+        labels = ['open'] + [label for label, _ in requests(query)]
+        print(f'{"request":<14}' + ''.join(f'{backend:>14}' for backend in results))
+        for label in labels:
+            print(f'{label:<14}' + ''.join(f'{statistics.median(timings[label]):>11.2f} ms'
+                                            for timings, _ in results.values()))
+        for backend, (_, mismatched) in results.items():
+            print(f'{backend}: ' + (f'differs from {next(iter(results))} on {mismatched}' if mismatched else 'identical frames'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Correlation engine at hundreds of countries: build, heatmap windows and lags.
+
+A synthetic dataset (dashboard.synthetic) is loaded with every indicator
+and handed to dashboard.correlation.  The script times building the
+engine, the full-range correlation matrices of every country, a walk of
+the year slider one year at a time (the engine updates the previous
+window when that is cheaper, see BLOCK_YEARS) against summing every
+window afresh, and the lagged cross-correlations of one pair, and checks
+a sample of countries against pandas' DataFrame.corr.  Incremental
+updates pay off on long histories, e.g. ``--years 1824:2023``.
+
+Usage: python benchmarks/bench_correlation.py [--countries N] [--years FIRST:LAST] [--max-lag N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from dashboard.schema import COUNTRY, INDICATORS, YEAR
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - t0) * 1000
+
+
+def main():
+    from dashboard.correlation import CorrelationEngine
+    from dashboard.query import load_query
+    from dashboard.synthetic import write_dataset
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--countries', type=int, default=600)
+    parser.add_argument('--years', type=lambda v: tuple(int(y) for y in v.split(':')), default=(2000, 2023),
+                        help='FIRST:LAST, inclusive')
+    parser.add_argument('--max-lag', type=int, default=5)
+    args = parser.parse_args()
+    first, last = args.years
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'dataset.csv')
+        write_dataset(path, args.countries, args.years, snapshot=False)
+        query = load_query(path, INDICATORS, backend='pandas')
+        engine, build_ms = timed(lambda: CorrelationEngine.from_query(query))
+        print(f'{args.countries} countries x {last - first + 1} years x {len(INDICATORS)} indicators')
+
+        full, full_ms = timed(lambda: engine.matrices((first, last)))
+        # The slider walked one year at a time: a narrowing window, then a sliding one
+        windows = [(first + k, last) for k in range(1, 6)] + [(first + 5 + k, last - k) for k in range(1, 6)]
+        walk_ms = [timed(lambda: engine.matrices(window))[1] for window in windows]
+        fresh_ms = []
+        for window in windows:
+            cold = CorrelationEngine.from_query(query)
+            fresh_ms.append(timed(lambda: cold.matrices(window))[1])
+            assert np.allclose(cold.matrices(window), engine.matrices(window), equal_nan=True, atol=1e-9)
+        _, mean_ms = timed(lambda: engine.matrix((first + 5, last)))
+        pair = ('GDP (nghìn tỷ USD)', 'Lượng phát thải CO2 (triệu tấn)')
+        _, lag_ms = timed(lambda: engine.lagged(*pair, (first, last), max_lag=args.max_lag))
+
+        print(f'{"build engine":<34} {build_ms:>9.1f} ms')
+        print(f'{"all matrices, full range":<34} {full_ms:>9.1f} ms')
+        print(f'{"slider step, engine":<34} {np.median(walk_ms):>9.1f} ms (median)')
+        print(f'{"slider step, from scratch":<34} {np.median(fresh_ms):>9.1f} ms (median)')
+        print(f'{"mean matrix (cached window)":<34} {mean_ms:>9.1f} ms')
+        print(f'{f"lags -{args.max_lag}..{args.max_lag}, one pair":<34} {lag_ms:>9.1f} ms')
+
+        frame = query.select(columns=[COUNTRY, YEAR] + INDICATORS)
+        for code in np.linspace(0, len(engine.countries) - 1, 5).astype(int):
+            rows = frame[frame[COUNTRY] == engine.countries[code]]
+            reference = rows[INDICATORS].astype(np.float64).corr(min_periods=3).to_numpy()
+            assert np.allclose(full[code], reference, equal_nan=True, atol=1e-9), engine.countries[code]
+        print('matrices match pandas DataFrame.corr')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Figures of the multi-chart pages built serially vs in the figure pool.
+
+A synthetic dataset (dashboard.synthetic) is opened the way final.py
+opens it, and the charts the energy and governance pages declare in their
+ChartBatch (all countries, full year range, last year) are built twice:
+one after the other on this interpreter, as the pages do without a pool,
+and as jobs of dashboard.figpool.  The pool is warmed up first (every
+worker loads the dataset once, as a long-running app's workers have), and
+every payload from a worker is checked to be byte-identical to the serial
+one.
+
+Usage: python benchmarks/bench_figpool.py [--countries N] [--years FIRST:LAST] [--workers N] [--repeat N]
+"""
+import argparse
+import importlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+APP = os.path.join(ROOT, 'final.py')
+# Pages that declare their charts in a ChartBatch: menu label -> module
+PAGES = {
+    "Năng lượng, môi trường và cơ sở hạ tầng": 'dashboard.views.energy',
+    "Quản trị": 'dashboard.views.governance',
+}
+
+
+def page_jobs(page, path):
+    """{chart_id: (build, params)} of the charts `page` declares, with its default selection."""
+    from unittest import mock
+
+    import plotly.graph_objects as go
+    from streamlit.testing.v1 import AppTest
+
+    from dashboard.views.common import ChartBatch
+
+    declared = {}
+
+    def capture(batch):
+        declared.update({chart_id: (build, params) for chart_id, (build, _, params) in batch._charts.items()})
+
+    os.environ['DASHBOARD_DATA'] = path
+    at = AppTest.from_file(APP, default_timeout=600)
+    with mock.patch('streamlit_option_menu.option_menu', return_value=page), \
+            mock.patch.object(ChartBatch, 'prefetch', capture), \
+            mock.patch.object(ChartBatch, 'figure', lambda batch, chart_id: go.Figure(layout={'title': chart_id})):
+        at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return declared
+
+
+def main():
+    import plotly.io as pio
+
+    from dashboard import figpool
+    from dashboard.sources import open_source
+    from dashboard.synthetic import write_dataset
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--countries', type=int, default=2_000)
+    parser.add_argument('--years', type=lambda v: tuple(int(y) for y in v.split(':')), default=(2000, 2023),
+                        help='FIRST:LAST, inclusive')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    figpool.WORKERS = args.workers
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'dataset.csv')
+        write_dataset(path, args.countries, args.years, snapshot=False)
+        print(f'{args.countries} countries x {args.years[1] - args.years[0] + 1} years, {args.workers} workers')
+        for page, name in PAGES.items():
+            module = importlib.import_module(name)
+            query = open_source(path).query(module.COLUMNS)
+            jobs = [(chart_id, build, params) for chart_id, (build, params) in page_jobs(page, path).items()]
+            lo, hi = query.year_bounds
+            version = query.data_version((lo, hi), hi)
+
+            def serial():
+                return [pio.to_json(build(query, **params), validate=False) for _, build, params in jobs]
+
+            def parallel():
+                futures = [figpool.submit((chart_id, i), path, module.COLUMNS, version, (lo, hi), hi, build, params)
+                           for i, (chart_id, build, params) in enumerate(jobs)]
+                return [future.result() for future in futures]
+
+            # Warm-up: start the workers and load the dataset in each of them
+            for _ in range(2):
+                parallel()
+            serial_ms, parallel_ms = [], []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                expected = serial()
+                serial_ms.append((time.perf_counter() - t0) * 1000)
+                t0 = time.perf_counter()
+                payloads = parallel()
+                parallel_ms.append((time.perf_counter() - t0) * 1000)
+                for (chart_id, _, _), a, b in zip(jobs, expected, payloads):
+                    assert a == b, f'{chart_id}: pool payload differs from the serial one'
+            name = name.rsplit('.', 1)[-1]
+            size = sum(map(len, expected)) / 1024
+            print(f'  {name:<11} {len(jobs)} charts {size:9.0f} KB   serial {statistics.median(serial_ms):8.1f} ms   '
+                  f'pool {statistics.median(parallel_ms):8.1f} ms   identical payloads')
+        figpool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Data-loading cost of one dashboard rerun, before and after the cached loader.
+
+Usage: python benchmarks/bench_loader.py [--reruns N] [--path CSV]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from dashboard import loader
+
+DATAPATH = os.path.join(ROOT, 'country_comparison_large_dataset_vn.csv')
+
+
+def timed(fn, reruns):
+    samples = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return samples
+
+
+def report(name, samples):
+    print(f'{name:<28} median {statistics.median(samples):8.3f} ms   '
+          f'p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:8.3f} ms')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--reruns', type=int, default=200)
+    parser.add_argument('--path', default=DATAPATH)
+    args = parser.parse_args()
+
+    before = timed(lambda: pd.read_csv(args.path), args.reruns)
+
+    loader.clear_cache()
+    t0 = time.perf_counter()
+    df = loader.load_dataset(args.path)
+    cold = (time.perf_counter() - t0) * 1000
+    after = timed(lambda: loader.load_dataset(args.path), args.reruns)
+
+    print(f'{args.path} ({len(df)} rows, {args.reruns} reruns)')
+    report('before: pd.read_csv', before)
+    print(f'{"after: load_dataset (cold)":<28} {cold:15.3f} ms')
+    report('after: load_dataset (warm)', after)
+    print(f'memory: {pd.read_csv(args.path).memory_usage(deep=True).sum() / 1024:.1f} KiB -> '
+          f'{df.memory_usage(deep=True).sum() / 1024:.1f} KiB')
+
+
+if __name__ == '__main__':
+    main()
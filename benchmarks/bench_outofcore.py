@@ -0,0 +1,99 @@
+"""Peak memory of one page view, in-memory vs partitioned (out-of-core) backend.
+
+For synthetic datasets of growing size (dashboard.synthetic, more countries
+over the same years) a fresh process opens the dataset the way final.py
+does for the economy page and selects one slice:
+
+* three: three countries over every year (the year-range charts),
+* year: every country in one year (the year snapshot charts).
+
+The in-memory backend loads the page's columns of the whole CSV and builds
+its index and year cube; the partitioned backend (dashboard.partitioned)
+only maps the fragments of the slice.  Peak RSS growth over the process's
+state after imports (VmHWM, reset before loading) is reported, together
+with the time to the result.
+
+Usage: python benchmarks/bench_outofcore.py [--countries N ...] [--years FIRST:LAST] [--data-dir DIR]
+"""
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+COUNTRIES = [1_000, 4_000, 16_000, 64_000]
+SLICES = ['three', 'year']
+
+
+def status_kb(field):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1])
+
+
+def worker(path, slice_name, results):
+    from dashboard.query import load_query
+    from dashboard.views.economy import COLUMNS
+
+    # Reset the high-water mark so import-time peaks are not counted
+    with open('/proc/self/clear_refs', 'w') as f:
+        f.write('5')
+    baseline = status_kb('VmRSS')
+    t0 = time.perf_counter()
+    query = load_query(path, columns=COLUMNS)
+    lo, hi = query.year_bounds
+    if slice_name == 'three':
+        frame = query.select(query.countries[:3], years=(lo, hi))
+    else:
+        frame = query.select(query.countries, year=hi)
+    elapsed = (time.perf_counter() - t0) * 1000
+    peak = status_kb('VmHWM')
+    results.put(((peak - baseline) / 1024, elapsed, len(frame)))
+
+
+def measure(path, slice_name):
+    ctx = mp.get_context('spawn')
+    results = ctx.Queue()
+    process = ctx.Process(target=worker, args=(path, slice_name, results))
+    process.start()
+    measured = results.get()
+    process.join()
+    return measured
+
+
+def main():
+    from dashboard.partitioned import write_partitioned
+    from dashboard.synthetic import write_dataset
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--countries', type=int, action='append', help=f'dataset sizes (default {COUNTRIES})')
+    parser.add_argument('--years', type=lambda v: tuple(int(y) for y in v.split(':')), default=(2000, 2023),
+                        help='FIRST:LAST, inclusive')
+    parser.add_argument('--data-dir', help='keep the generated datasets here (default: a temporary directory)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or tmp
+        print(f'{"countries":>9} {"rows":>9} {"CSV MB":>7} {"slice":>6} {"rows out":>9} '
+              f'{"memory MB":>10} {"ms":>8} {"parts MB":>9} {"ms":>8}')
+        for countries in args.countries or COUNTRIES:
+            path = os.path.join(data_dir, f'dataset_{countries}.csv')
+            if not os.path.exists(path):
+                write_dataset(path, countries, args.years, seed=countries, snapshot=False)
+            parts = write_partitioned(path)
+            size = os.path.getsize(path) / 2**20
+            rows = countries * (args.years[1] - args.years[0] + 1)
+            for slice_name in SLICES:
+                memory, memory_ms, out = measure(path, slice_name)
+                partitioned, partitioned_ms, _ = measure(parts, slice_name)
+                print(f'{countries:>9} {rows:>9} {size:>7.1f} {slice_name:>6} {out:>9} '
+                      f'{memory:>10.1f} {memory_ms:>8.1f} {partitioned:>9.1f} {partitioned_ms:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
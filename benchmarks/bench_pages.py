@@ -0,0 +1,211 @@
+"""Headless benchmark of every dashboard page.
+
+Each page of final.py is driven through Streamlit's AppTest (no browser, no
+server) in a fresh interpreter, once per dataset.  After the first render
+the script walks a matrix of country selections and year ranges, rerunning
+the page for each, and records:
+
+* wall time of the first render and of every rerun,
+* peak resident memory of the process (and its growth over the harness),
+* time spent building each chart's figure and the size of its JSON
+  payload (cache misses only).
+
+Besides the bundled CSV, the pages are run against synthetic datasets
+(dashboard.synthetic) with 10x, 100x and 1000x as many countries and the
+generator's default share of blank cells, which the pages skip.
+
+Usage: python benchmarks/bench_pages.py [--scale N ...] [--page NAME ...]
+                                        [--data-dir DIR] [--snapshot] [--json OUT]
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from dashboard.schema import COUNTRY, YEAR as YEAR_COLUMN
+from dashboard.sections import COUNTRIES, YEAR, YEAR_RANGE
+from dashboard.views import PAGES
+
+APP = os.path.join(ROOT, 'final.py')
+DATAPATH = os.path.join(ROOT, 'country_comparison_large_dataset_vn.csv')
+SCALES = [1, 10, 100, 1000]
+# Marks the worker's result line on stdout
+RESULT = '--- result ---'
+
+
+def scaled_dataset(factor, data_dir, snapshot=False):
+    """Path of a synthetic dataset `factor` times the size of the bundled CSV.
+
+    It has `factor` times as many countries over the same years, with blank
+    cells at the generator's default rate.  Files are generated once
+    (seeded by the factor) and reused.
+    """
+    if factor == 1:
+        return DATAPATH
+    path = os.path.join(data_dir, f'dataset_x{factor}.csv')
+    if not os.path.exists(path):
+        from dashboard.loader import load_dataset
+        from dashboard.synthetic import write_dataset
+
+        bundled = load_dataset(DATAPATH, columns=[])
+        years = (int(bundled[YEAR_COLUMN].min()), int(bundled[YEAR_COLUMN].max()))
+        write_dataset(path, bundled[COUNTRY].nunique() * factor, years, seed=factor, snapshot=False)
+    if snapshot:
+        from dashboard.ingest import write_snapshot
+        from dashboard.loader import snapshot_path
+
+        if not os.path.exists(snapshot_path(path)):
+            write_snapshot(path)
+    return path
+
+
+def selection_matrix(countries, year_bounds):
+    """[(label, session state)] rerun after the first render of a page."""
+    min_year, max_year = year_bounds
+    selections = {
+        'all': list(countries),
+        'three': list(countries[:3]),
+        'one': list(countries[:1]),
+    }
+    ranges = {
+        'full': (min_year, max_year),
+        'last5': (max(min_year, max_year - 4), max_year),
+    }
+    matrix = []
+    for c_label, selected in selections.items():
+        for r_label, year_range in ranges.items():
+            matrix.append((f'{c_label}/{r_label}', {
+                COUNTRIES: selected,
+                YEAR_RANGE: year_range,
+                YEAR: year_range[0],
+            }))
+    return matrix
+
+
+def run_worker(page, path):
+    """Benchmark `page` on `path` in this process and return the measurements."""
+    from unittest import mock
+
+    from streamlit.testing.v1 import AppTest
+
+    from dashboard.query import load_query
+    from dashboard.sections import SectionRuntime
+
+    from dashboard.figcache import FigureCache
+
+    builds = defaultdict(list)
+    payloads = defaultdict(list)
+    figure = SectionRuntime.figure
+    put = FigureCache.put
+
+    def timed_figure(self, section_id, reads, build, version=None):
+        def timed_build():
+            t0 = time.perf_counter()
+            fig = build()
+            builds[section_id].append((time.perf_counter() - t0) * 1000)
+            return fig
+        return figure(self, section_id, reads, timed_build, version)
+
+    def sized_put(self, key, payload):
+        # figure_key() puts the chart id second
+        payloads[key[1]].append(len(payload))
+        return put(self, key, payload)
+
+    def run(at):
+        t0 = time.perf_counter()
+        at.run()
+        elapsed = (time.perf_counter() - t0) * 1000
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        return elapsed
+
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    at = AppTest.from_file(APP, default_timeout=600)
+    with mock.patch('streamlit_option_menu.option_menu', return_value=page), \
+            mock.patch.object(SectionRuntime, 'figure', timed_figure), \
+            mock.patch.object(FigureCache, 'put', sized_put):
+        first = run(at)
+        query = load_query(path, columns=[])
+        reruns = {}
+        for label, state in selection_matrix(query.countries, query.year_bounds):
+            for key, value in state.items():
+                at.session_state[key] = value
+            reruns[label] = run(at)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        'first_ms': first,
+        'reruns_ms': reruns,
+        # ru_maxrss is in KiB on Linux
+        'peak_mb': peak / 1024,
+        'growth_mb': (peak - baseline) / 1024,
+        'builds_ms': dict(builds),
+        'payload_bytes': dict(payloads),
+    }
+
+
+def bench(page, path):
+    """Run the worker for `page` on `path` in a fresh interpreter."""
+    env = dict(os.environ, DASHBOARD_DATA=path)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', page, path],
+                          cwd=ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(f'{page}: {proc.stderr.strip().splitlines()[-1]}')
+    out = proc.stdout.splitlines()
+    return json.loads(out[out.index(RESULT) + 1])
+
+
+def report(page, result):
+    reruns = list(result['reruns_ms'].values())
+    print(f'  {page}')
+    print(f'    first render {result["first_ms"]:9.1f} ms   '
+          f'rerun median {statistics.median(reruns):9.1f} ms   max {max(reruns):9.1f} ms')
+    print(f'    peak RSS     {result["peak_mb"]:9.1f} MB   growth {result["growth_mb"]:9.1f} MB')
+    for chart, samples in sorted(result['builds_ms'].items(), key=lambda i: -statistics.median(i[1])):
+        size = statistics.median(result['payload_bytes'].get(chart, [0])) / 1024
+        print(f'      {statistics.median(samples):8.1f} ms  {size:7.1f} KB  x{len(samples):<3} {chart}')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=int, action='append', help=f'dataset size factor (default {SCALES})')
+    parser.add_argument('--page', choices=list(PAGES), action='append')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'dashboard-bench'))
+    parser.add_argument('--snapshot', action='store_true', help='also write Parquet snapshots of the datasets')
+    parser.add_argument('--json', help='write all measurements to this file')
+    parser.add_argument('--worker', nargs=2, metavar=('PAGE', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_worker(*args.worker)
+        print(RESULT)
+        print(json.dumps(result))
+        return
+
+    results = {}
+    for factor in args.scale or SCALES:
+        path = scaled_dataset(factor, args.data_dir, args.snapshot)
+        rows = len(pd.read_csv(path, usecols=[COUNTRY], encoding='utf-8-sig'))
+        print(f'x{factor}: {path} ({rows} rows)')
+        for page in args.page or list(PAGES):
+            result = bench(page, path)
+            results.setdefault(f'x{factor}', {})[page] = result
+            report(page, result)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""SVG vs WebGL cost of the bubble charts, on the server and in the browser.
+
+For each point count a bubble chart styled like the dashboard's (size by
+population, one trace per country, DarkSlateGrey outlines) is built twice,
+with render_mode 'svg' and 'webgl'.  The points are rows of a synthetic
+dataset with the default share of blank cells, keeping only those whose
+plotted values are valid, as the page does.  The script prints the build
+time and JSON payload size of both, and writes a self-contained HTML page
+(plotly.js inlined, no network needed) that renders every figure in turn
+and reports how long the browser took to draw it.  Open the page in the browser to
+compare; results are shown in a table and kept in ``#results`` as JSON.
+
+Usage: python benchmarks/bench_scatter_render.py [--points N ...] [--countries N]
+                                                 [-o HTML]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import plotly.express as px
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+from dashboard.clean import valid_rows
+from dashboard.synthetic import generate
+from dashboard.views.common import color_palette, get_chart_layout
+
+POINTS = [100, 1_000, 10_000, 100_000]
+# x, y and size of the chart
+PLOTTED = ['Tiêu thụ năng lượng (TWh)', 'Lượng phát thải CO2 (triệu tấn)', 'Dân số (triệu người)']
+
+PAGE = '''<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>scatter render benchmark</title>
+<script>{plotlyjs}</script></head>
+<body>
+<table id="table" border="1" cellpadding="4"><tr><th>points</th><th>mode</th><th>render ms</th></tr></table>
+<pre id="results"></pre>
+<div id="chart" style="width: 560px; height: 450px"></div>
+<script>
+const figures = {figures};
+const nextFrame = () => new Promise(resolve => requestAnimationFrame(() => resolve()));
+(async () => {{
+  const results = [];
+  for (const [points, mode, figure] of figures) {{
+    const div = document.getElementById('chart');
+    Plotly.purge(div);
+    await nextFrame();
+    const t0 = performance.now();
+    await Plotly.newPlot(div, figure.data, figure.layout);
+    // Wait for the frame that actually shows the chart
+    await nextFrame();
+    const ms = performance.now() - t0;
+    results.push({{points, mode, ms}});
+    document.getElementById('table').insertAdjacentHTML(
+      'beforeend', `<tr><td>${{points}}</td><td>${{mode}}</td><td>${{ms.toFixed(1)}}</td></tr>`);
+  }}
+  document.getElementById('results').textContent = JSON.stringify(results);
+  document.title = 'done';
+}})();
+</script>
+</body></html>
+'''
+
+
+def bubble_data(points, countries):
+    """`points` synthetic rows (default missing rate) whose plotted columns are valid, as the page selects them."""
+    years = -(-points // countries)
+    while True:
+        data = generate(countries, (2000, 2000 + years - 1), seed=0)
+        data = data[valid_rows(data, PLOTTED)]
+        if len(data) >= points:
+            return data.head(points)
+        years += 1
+
+
+def bubble_figure(data, render_mode):
+    """A bubble chart set up like the dashboard's CO2 vs energy chart."""
+    x, y, size = PLOTTED
+    fig = px.scatter(data, x=x, y=y, size=size, color='Quốc gia', hover_name='Quốc gia',
+                     color_discrete_sequence=color_palette, size_max=20, render_mode=render_mode)
+    fig.update_layout(**get_chart_layout(), showlegend=False)
+    fig.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--points', type=int, action='append', help=f'points per chart (default {POINTS})')
+    parser.add_argument('--countries', type=int, default=200)
+    parser.add_argument('-o', '--output', default=os.path.join(tempfile.gettempdir(), 'bench_scatter_render.html'))
+    args = parser.parse_args()
+
+    figures = []
+    print(f'{"points":>8} {"mode":>6} {"build ms":>10} {"json KB":>10}')
+    for points in args.points or POINTS:
+        data = bubble_data(points, args.countries)
+        for mode in ('svg', 'webgl'):
+            t0 = time.perf_counter()
+            fig = bubble_figure(data, mode)
+            payload = pio.to_json(fig, validate=False)
+            elapsed = (time.perf_counter() - t0) * 1000
+            print(f'{len(data):>8} {mode:>6} {elapsed:>10.1f} {len(payload) / 1024:>10.1f}')
+            figures.append([len(data), mode, json.loads(payload)])
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(PAGE.format(plotlyjs=get_plotlyjs(), figures=json.dumps(figures)))
+    print(f'wrote {args.output}; open it in a browser for client render times')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Memory of the indicators as a wide pandas frame vs the delta-encoded series store.
+
+A synthetic dataset (dashboard.synthetic) is held three ways: as
+pd.read_csv parses it (float64), as the pandas backend holds it (the
+float32 frame of dashboard.loader) and as dashboard.series encodes it.
+The year-range selections of the economy page are then timed on the
+pandas and the series backends, and every frame of the series backend is
+checked to equal the pandas one.
+
+Usage: python benchmarks/bench_series.py [--countries N] [--years FIRST:LAST] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from dashboard.loader import load_dataset
+from dashboard.query import load_query
+from dashboard.schema import COUNTRY
+from dashboard.series import SeriesDataset
+from dashboard.synthetic import write_dataset
+from dashboard.views import economy
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples), result
+
+
+def same(a, b):
+    a, b = a.reset_index(drop=True), b.reset_index(drop=True)
+    a[COUNTRY], b[COUNTRY] = a[COUNTRY].astype(str), b[COUNTRY].astype(str)
+    pd.testing.assert_frame_equal(a, b)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--countries', type=int, default=1_000)
+    parser.add_argument('--years', type=lambda v: tuple(int(y) for y in v.split(':')), default=(1960, 2023),
+                        help='FIRST:LAST, inclusive')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'dataset.csv')
+        write_dataset(path, args.countries, args.years, snapshot=False)
+        wide = pd.read_csv(path).memory_usage(deep=True).sum()
+        typed = load_dataset(path).memory_usage(deep=True).sum()
+        t0 = time.perf_counter()
+        store = SeriesDataset.open(path)
+        encode_ms = (time.perf_counter() - t0) * 1000
+        print(f'{args.countries} countries x {args.years[1] - args.years[0] + 1} years, {store.rows} rows')
+        print(f'  pd.read_csv (float64)    {wide / 2**20:8.2f} MB')
+        print(f'  pandas backend (float32) {typed / 2**20:8.2f} MB   {wide / typed:5.1f}x smaller')
+        print(f'  series store             {store.nbytes / 2**20:8.2f} MB   {wide / store.nbytes:5.1f}x smaller'
+              f'   (encoded in {encode_ms:.0f} ms)')
+        scaled = [series for series in store.series.values() if series.decimals is not None]
+        bits = sum(series.widths.mean() for series in scaled) / max(1, len(scaled))
+        print(f'    {len(scaled)} indicators as deltas of {bits:.1f} bits on average, '
+              f'{len(store.series) - len(scaled)} as float32')
+
+        # The year-range selections of one page, with its indicators
+        pandas = load_query(path, economy.COLUMNS, backend='pandas')
+        series = load_query(path, economy.COLUMNS, backend='series')
+        lo, hi = pandas.year_bounds
+        countries = list(pandas.countries)
+        selections = {
+            'all countries, all years': (None, (lo, hi)),
+            'all countries, last 10 years': (None, (hi - 9, hi)),
+            '10 countries, all years': (countries[::max(1, len(countries) // 10)][:10], (lo, hi)),
+            'all countries, one year': (None, (hi, hi)),
+        }
+        print(f'  {"selection":<30} {"pandas":>10} {"series":>10}')
+        for name, (selected, years) in selections.items():
+            pandas_ms, expected = timed(lambda: pandas.select(selected, years), args.repeat)
+            series_ms, frame = timed(lambda: series.select(selected, years), args.repeat)
+            same(expected, frame)
+            print(f'  {name:<30} {pandas_ms:7.2f} ms {series_ms:7.2f} ms')
+        print('  series frames equal the pandas ones')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""SQL data source against a local SQLite stand-in: cold, cached and prefetched selections.
+
+A synthetic dataset (dashboard.synthetic) is copied into a SQLite table and
+opened as a SQLSource.  The script walks the year selectbox and slider the
+way a user does (one year, then the next; a range, then one year wider)
+and times every step, telling apart selections fetched from the database,
+served from the TTL cache, and served from blocks the background prefetch
+fetched in the meantime.  Every frame is checked against the file source
+on the CSV.
+
+Usage: python benchmarks/bench_sources.py [--countries N] [--latency MS]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from dashboard.sources import FileSource, SQLSource
+from dashboard.views.economy import COLUMNS
+
+
+def main():
+    from dashboard.sources import write_table
+    from dashboard.synthetic import write_dataset
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--countries', type=int, default=600)
+    parser.add_argument('--latency', type=float, default=20,
+                        help='simulated round trip per statement in ms, as to a remote warehouse')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'dataset.csv')
+        write_dataset(path, args.countries, snapshot=False)
+        url = f'sqlite:///{os.path.join(tmp, "indicators.db")}?order_by=rowid'
+        write_table(path, url)
+        source = SQLSource.from_url(url)
+        fetch = source._fetch
+
+        def remote_fetch(sql, params=()):
+            time.sleep(args.latency / 1000)
+            return fetch(sql, params)
+
+        source._fetch = remote_fetch
+        expected = FileSource(path).query(COLUMNS)
+        query = source.query(COLUMNS)
+        countries = query.countries[:3]
+        lo, hi = query.year_bounds
+
+        steps = [('year', lo), ('year', lo), ('year', lo + 1), ('year', lo + 2),
+                 ('range', (lo, hi - 10)), ('range', (lo, hi - 9)), ('range', (lo, hi - 8))]
+        print(f'{args.countries} countries, {args.latency:.0f} ms per statement')
+        print(f'{"step":<22} {"ms":>8}  frame')
+        for kind, value in steps:
+            # Give the prefetch of the previous step time to land, as a user's think time would
+            time.sleep(3 * args.latency / 1000)
+            t0 = time.perf_counter()
+            if kind == 'year':
+                frame = query.select(countries, year=value)
+                reference = expected.select(countries, year=value)
+            else:
+                frame = query.select(countries, years=value)
+                reference = expected.select(countries, years=value)
+            elapsed = (time.perf_counter() - t0) * 1000
+            try:
+                pd.testing.assert_frame_equal(frame.reset_index(drop=True), reference.reset_index(drop=True))
+                status = 'identical'
+            except AssertionError:
+                status = 'DIFFERENT'
+            print(f'{kind + " " + str(value):<22} {elapsed:>8.1f}  {status}')
+        source.close()
+
+
+if __name__ == '__main__':
+    main()
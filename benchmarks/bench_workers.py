@@ -0,0 +1,94 @@
+"""Memory and startup cost of N dashboard workers on one node, CSV vs shared file.
+
+Every worker is a separate process that loads the dataset and builds the
+query structures (index and year cube) for every column, as a Streamlit
+worker does once all pages have been visited.  Memory is read from
+/proc/<pid>/smaps_rollup while all workers are alive: PSS splits shared
+pages between the processes mapping them, so the PSS total is what the
+node actually pays.
+
+The dataset is synthetic (dashboard.synthetic) and written to a temporary
+directory.  The CSV mode runs first; then the shared Arrow file is
+published and the same workers attach to it instead.
+
+Usage: python benchmarks/bench_workers.py [--workers N ...] [--countries N] [--years FIRST:LAST]
+"""
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+WORKERS = [1, 2, 4, 8]
+
+
+def memory_kb():
+    """{'Rss': kB, 'Pss': kB, ...} of this process."""
+    with open('/proc/self/smaps_rollup') as f:
+        fields = (line.split() for line in f if line.endswith('kB\n'))
+        return {parts[0].rstrip(':'): int(parts[1]) for parts in fields}
+
+
+def worker(path, barrier, results):
+    from dashboard.query import load_query
+
+    barrier.wait()
+    before = memory_kb()
+    barrier.wait()
+    t0 = time.perf_counter()
+    load_query(path)
+    startup = (time.perf_counter() - t0) * 1000
+    barrier.wait()
+    after = memory_kb()
+    results.put((before, after, startup))
+    # Stay alive until every worker has measured, so shared pages are shared
+    barrier.wait()
+
+
+def run(path, workers):
+    ctx = mp.get_context('spawn')
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(path, barrier, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    measured = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    pss = sum(after['Pss'] - before['Pss'] for before, after, _ in measured) / 1024
+    rss = sum(after['Rss'] - before['Rss'] for before, after, _ in measured) / 1024
+    startup = max(s for _, _, s in measured)
+    return pss, rss, startup
+
+
+def main():
+    from dashboard.ingest import write_shared
+    from dashboard.synthetic import write_dataset
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, action='append', help=f'worker counts (default {WORKERS})')
+    parser.add_argument('--countries', type=int, default=6000)
+    parser.add_argument('--years', type=lambda v: tuple(int(y) for y in v.split(':')), default=(2000, 2023),
+                        help='FIRST:LAST, inclusive')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'dataset.csv')
+        write_dataset(path, args.countries, args.years, snapshot=False)
+        print(f'{path}: {args.countries} countries, {os.path.getsize(path) / 2**20:.1f} MB CSV')
+        print(f'{"mode":>7} {"workers":>8} {"PSS MB":>9} {"RSS MB":>9} {"startup ms":>11}')
+        modes = [('csv', None), ('shared', write_shared)]
+        for mode, publish in modes:
+            if publish:
+                publish(path)
+            for n in args.workers or WORKERS:
+                pss, rss, startup = run(path, n)
+                print(f'{mode:>7} {n:>8} {pss:>9.1f} {rss:>9.1f} {startup:>11.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Import-time report for a cold start of each dashboard page.
+
+Every page is rendered once through Streamlit's AppTest in a fresh
+interpreter started with ``python -X importtime``.  Only the imports that
+happen while the page renders are counted, not the ones pulled in by the
+test harness itself.
+
+Usage: python benchmarks/importtime.py [--page NAME] [--top N] [--check]
+
+With --check the script exits non-zero when the landing page imports one of
+LAZY_MODULES, so heavy plotting libraries or another page's code creeping
+back into the startup path fail CI.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dashboard.views import PAGES
+
+APP = os.path.join(ROOT, 'final.py')
+LANDING = next(iter(PAGES))
+# Modules that must not be imported before a chart page is opened: the
+# plotting libraries, the other pages and the analysis code they pull in
+LAZY_MODULES = ['plotly.express', 'plotly.graph_objects', 'matplotlib', 'seaborn', 'altair', 'dashboard.correlation']
+LAZY_MODULES += [module for name, (module, _) in PAGES.items() if name != LANDING]
+
+BEGIN = '--- render begin ---'
+END = '--- render end ---'
+
+RUNNER = f'''
+import sys
+from unittest import mock
+from streamlit.testing.v1 import AppTest
+
+at = AppTest.from_file({APP!r}, default_timeout=120)
+with mock.patch('streamlit_option_menu.option_menu', return_value=sys.argv[1]):
+    print({BEGIN!r}, file=sys.stderr, flush=True)
+    at.run()
+    print({END!r}, file=sys.stderr, flush=True)
+if at.exception:
+    sys.exit(at.exception[0].message)
+'''
+
+
+def page_imports(page):
+    """[(module, self_us, cumulative_us)] imported while rendering `page`."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', RUNNER, page],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(f'{page}: {proc.stderr.strip().splitlines()[-1]}')
+    lines = proc.stderr.splitlines()
+    lines = lines[lines.index(BEGIN) + 1:lines.index(END)]
+    imports = []
+    for line in lines:
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        imports.append((name.strip(), int(self_us), int(cumulative_us), len(name) - len(name.lstrip())))
+    return imports
+
+
+def report(page, imports, top):
+    # Top-level entries (smallest indentation) add up to the total import cost
+    depth = min((i[3] for i in imports), default=0)
+    total = sum(i[2] for i in imports if i[3] == depth)
+    print(f'{page}: {len(imports)} modules, {total / 1000:.1f} ms')
+    for name, _, cumulative, _ in sorted(imports, key=lambda i: -i[2])[:top]:
+        print(f'    {cumulative / 1000:8.1f} ms  {name}')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--page', choices=list(PAGES), action='append')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--check', action='store_true')
+    args = parser.parse_args()
+
+    if args.check:
+        imported = {i[0] for i in page_imports(LANDING)}
+        leaked = [m for m in LAZY_MODULES if m in imported]
+        if leaked:
+            sys.exit(f'{LANDING} imports {", ".join(leaked)} at startup')
+        print(f'{LANDING}: no eager imports of {", ".join(LAZY_MODULES)}')
+        return
+
+    for page in args.page or PAGES:
+        report(page, page_imports(page), args.top)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""Streaming validation and cleaning of country-comparison CSV exports.
+
+read_chunks() parses a CSV a bounded number of rows at a time and turns
+every chunk into the dataset types: values that are not numbers become
+missing, rows without a country or a whole year are dropped.  clean()
+then brings the bounded indicators (shares in percent, RANGES) into range
+according to POLICY.  Both tally what they changed in a Report, so a
+multi-GB export can be checked or converted in the memory of one chunk.
+Everything that turns a CSV into data - the loader, dashboard.ingest,
+dashboard.partitioned and dashboard.sources - reads it through here, so
+every backend serves the same values.
+
+Validity keeps one packed bitmap per indicator, computed once per version
+of the data: a bit is set where the value is present and, with the flag
+policy, within its range.  Pages ask for valid rows (``select(...,
+valid=True)``) instead of masking NaNs on every rerun.
+
+Usage: python -m dashboard.clean CSV [--chunk-rows N]
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from dashboard.schema import COLUMNS, COUNTRY, INDICATORS, YEAR
+
+# What happens to a value outside its range: 'clamp' it to the range, 'flag' it
+# invalid in the validity bitmaps but keep it, or 'null' it (make it missing)
+POLICIES = ('clamp', 'flag', 'null')
+POLICY = os.environ.get('DASHBOARD_OUT_OF_RANGE', 'clamp')
+if POLICY not in POLICIES:
+    raise ValueError(f'DASHBOARD_OUT_OF_RANGE must be one of {", ".join(POLICIES)}, not {POLICY!r}')
+CHUNK_ROWS = 500_000
+
+# Rates that can be negative or above 100; every other indicator in percent is a share
+UNBOUNDED_PERCENT = ['Tỷ lệ lạm phát (%)', 'Tỷ lệ tăng trưởng dân số (%)']
+# Bounded indicators: name -> (lowest, highest) plausible value
+RANGES = {c: (0, 100) for c in INDICATORS if '%' in c and c not in UNBOUNDED_PERCENT}
+
+
+class Report:
+    """What reading and cleaning changed, counted over every chunk of a file."""
+
+    def __init__(self):
+        self.rows = 0
+        self.dropped = 0
+        self.coerced = {}
+        self.out_of_range = {}
+
+    @staticmethod
+    def count(counts, column, n):
+        if n:
+            counts[column] = counts.get(column, 0) + int(n)
+
+    def __str__(self):
+        lines = [f'{self.rows} rows kept, {self.dropped} dropped (no country or year)']
+        lines += [f'{c}: {n} values that are not numbers, now missing' for c, n in self.coerced.items()]
+        action = {'clamp': 'clamped to', 'flag': 'flagged outside', 'null': 'set missing outside'}[POLICY]
+        lines += [f'{c}: {n} values {action} {RANGES[c][0]}-{RANGES[c][1]}' for c, n in self.out_of_range.items()]
+        return '\n'.join(lines)
+
+
+def read_chunks(path, columns=None, chunk_rows=CHUNK_ROWS, report=None):
+    """Typed frames of at most `chunk_rows` rows of the CSV at `path`, in file order.
+
+    `columns` restricts the columns read (all of COLUMNS if None, which
+    must then all be present).  Countries are categorical with the
+    categories of the chunk in order of appearance.
+    """
+    report = report if report is not None else Report()
+    chunks = pd.read_csv(path, encoding='utf-8-sig', usecols=columns, chunksize=chunk_rows,
+                         dtype={COUNTRY: 'category'})
+    for chunk in chunks:
+        if columns is None:
+            missing = [c for c in COLUMNS if c not in chunk.columns]
+            if missing:
+                raise ValueError(f'{path} is missing columns: {missing}')
+        yield coerce(chunk, report)
+
+
+def coerce(chunk, report):
+    """`chunk` in the dataset types, without the rows lacking a country or a whole year."""
+    typed = {}
+    for c in chunk.columns:
+        values = chunk[c]
+        if c != COUNTRY and not pd.api.types.is_numeric_dtype(values):
+            numbers = pd.to_numeric(values, errors='coerce')
+            report.count(report.coerced, c, (numbers.isna() & values.notna()).sum())
+            values = numbers
+        typed[c] = values
+    keep = np.ones(len(chunk), dtype=bool)
+    if COUNTRY in typed:
+        keep &= typed[COUNTRY].notna().to_numpy()
+    if YEAR in typed:
+        years = typed[YEAR].to_numpy(np.float64)
+        keep &= years == np.floor(years)
+    report.dropped += int((~keep).sum())
+    report.rows += int(keep.sum())
+    frame = pd.DataFrame({c: values.array[keep] for c, values in typed.items()}, columns=chunk.columns)
+    if COUNTRY in frame:
+        # Categories in order of appearance, and only those the chunk still has
+        frame[COUNTRY] = frame[COUNTRY].cat.set_categories(pd.unique(frame[COUNTRY]).tolist())
+    if YEAR in frame:
+        frame[YEAR] = frame[YEAR].astype(np.int16)
+    for c in frame.columns:
+        if c in INDICATORS:
+            frame[c] = frame[c].astype(np.float32)
+    return frame
+
+
+def clean(frame, report=None):
+    """Apply POLICY to the values of `frame` outside RANGES, in place; returns `frame`."""
+    for c, (lo, hi) in RANGES.items():
+        if c not in frame:
+            continue
+        values = frame[c].to_numpy()
+        outside = (values < lo) | (values > hi)
+        n = int(outside.sum())
+        if report is not None:
+            report.count(report.out_of_range, c, n)
+        if n and POLICY == 'clamp':
+            frame[c] = np.clip(values, lo, hi)
+        elif n and POLICY == 'null':
+            frame[c] = np.where(outside, np.float32(np.nan), values)
+    return frame
+
+
+def stream(path, columns=None, chunk_rows=CHUNK_ROWS, report=None):
+    """read_chunks() with every chunk cleaned."""
+    for chunk in read_chunks(path, columns, chunk_rows, report):
+        yield clean(chunk, report)
+
+
+def read_frame(path, columns=None, chunk_rows=CHUNK_ROWS, report=None):
+    """The whole cleaned CSV as one frame, countries categorical in order of first appearance."""
+    chunks = list(stream(path, columns, chunk_rows, report))
+    if len(chunks) == 1:
+        return chunks[0]
+    if COUNTRY in chunks[0]:
+        # Categories of the later chunks are appended after the ones already seen
+        countries = pd.api.types.union_categoricals([chunk[COUNTRY] for chunk in chunks])
+        frames = [chunk.drop(columns=COUNTRY) for chunk in chunks]
+        frame = pd.concat(frames, ignore_index=True)
+        frame.insert(chunks[0].columns.get_loc(COUNTRY), COUNTRY, countries)
+        return frame
+    return pd.concat(chunks, ignore_index=True)
+
+
+def is_valid(values, column):
+    """Where `values` of `column` are present and, with the flag policy, within range."""
+    valid = ~np.isnan(values)
+    if POLICY == 'flag' and column in RANGES:
+        lo, hi = RANGES[column]
+        valid &= (values >= lo) & (values <= hi)
+    return valid
+
+
+class Validity:
+    """One packed bitmap per indicator of a frame (see is_valid), 1 bit per row."""
+
+    def __init__(self, bitmaps):
+        self._bitmaps = bitmaps
+
+    @classmethod
+    def from_frame(cls, frame):
+        return cls({c: np.packbits(is_valid(frame[c].to_numpy(), c)) for c in INDICATORS if c in frame})
+
+    def __contains__(self, column):
+        return column in self._bitmaps
+
+    def bits(self, column, positions):
+        """Validity of `column` at the row `positions`, as booleans."""
+        return (self._bitmaps[column][positions >> 3] >> (7 - (positions & 7)) & 1).astype(bool)
+
+
+def valid_rows(frame, columns=None, validity=None, positions=None):
+    """Rows of `frame` whose `columns` (all if None) are all valid, as a boolean mask.
+
+    Indicators `validity` covers are read from its bitmaps at `positions`,
+    the rows' positions in the frame it was built from; anything else
+    (derived columns, scanned rows) is checked on the values.
+    """
+    columns = frame.columns if columns is None else columns
+    keep = np.ones(len(frame), dtype=bool)
+    for c in columns:
+        if c in (COUNTRY, YEAR):
+            continue
+        if validity is not None and c in validity:
+            keep &= validity.bits(c, positions)
+        else:
+            keep &= is_valid(frame[c].to_numpy(), c)
+    return keep
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check a country-comparison CSV chunk by chunk and report what cleaning changes.')
+    parser.add_argument('csv')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+    report = Report()
+    for _ in stream(args.csv, chunk_rows=args.chunk_rows, report=report):
+        pass
+    print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+"""Indicator correlation and lag analysis, batched over countries.
+
+The dataset is laid out once as a dense (country, year, indicator) array,
+each series centred on its own mean.  A year window is summarised per
+country by the pairwise sums Pearson's r needs (counts, sums, sums of
+squares and cross products over the years where both indicators are
+present), computed for every country at once with batched matrix
+products.  Moving the year slider does not start over: the window is
+derived from the closest one already summarised by adding the years that
+entered and subtracting the years that left.  Lagged cross-correlations
+stack every lag of a pair into one array and correlate all countries and
+lags in one pass.
+"""
+import os
+import threading
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from dashboard.schema import COUNTRY, INDICATORS, YEAR
+
+# Year windows whose sums are kept per engine, and engines kept per process
+WINDOW_STATES = int(os.environ.get('DASHBOARD_CORRELATION_WINDOWS', 4))
+ENGINES = 2
+# Fewer common years than this give no correlation
+MIN_PERIODS = 3
+# Summing a block of years, or adding one window's sums to another, costs about as much as
+# summing this many more years: the (country, indicator, indicator) output dominates short blocks
+BLOCK_YEARS = 50
+# Variances below this fraction of the sum of squares are rounding error: the series is constant
+VARIANCE_TOLERANCE = 1e-9
+
+_lock = threading.Lock()
+# (path, data version, columns) -> CorrelationEngine
+_engines = OrderedDict()
+
+
+def _variance(n, sx, sxx):
+    """n² times the variance from pairwise sums, and where that is zero up to rounding."""
+    scale = n * sxx
+    var = scale - sx * sx
+    return var, var <= VARIANCE_TOLERANCE * scale
+
+
+def _pearson(n, sx, sy, sxx, syy, sxy, var_x=None, var_y=None):
+    """Pearson's r from pairwise sums, NaN below MIN_PERIODS or without variance."""
+    var_x, constant_x = var_x or _variance(n, sx, sxx)
+    var_y, constant_y = var_y or _variance(n, sy, syy)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = (n * sxy - sx * sy) / np.sqrt(var_x * var_y)
+    r[(n < MIN_PERIODS) | constant_x | constant_y] = np.nan
+    return np.clip(r, -1, 1, out=r)
+
+
+class _WindowSums:
+    """Per-country pairwise sums over a set of years: every array is (country, indicator, indicator).
+
+    ``sx[c, i, j]`` sums indicator i over the years where j is present too,
+    so a pair only counts the years both have.
+    """
+
+    def __init__(self, n, sx, sxx, sxy):
+        self.n = n
+        self.sx = sx
+        self.sxx = sxx
+        self.sxy = sxy
+
+    @classmethod
+    def of(cls, values, squares, mask):
+        """Sums over the years of `values`, `squares` and `mask` (country, indicator, year; 0 where missing)."""
+        columns = mask.transpose(0, 2, 1)
+        return cls(mask @ columns, values @ columns, squares @ columns, values @ values.transpose(0, 2, 1))
+
+    def __add__(self, other):
+        return _WindowSums(self.n + other.n, self.sx + other.sx, self.sxx + other.sxx, self.sxy + other.sxy)
+
+    def __sub__(self, other):
+        return _WindowSums(self.n - other.n, self.sx - other.sx, self.sxx - other.sxx, self.sxy - other.sxy)
+
+    def take(self, rows):
+        return _WindowSums(self.n[rows], self.sx[rows], self.sxx[rows], self.sxy[rows])
+
+    def correlation(self):
+        # n and the cross products are symmetric, so the y side is the transpose of the x side
+        var, constant = _variance(self.n, self.sx, self.sxx)
+        return _pearson(self.n, self.sx, self.sx.transpose(0, 2, 1), self.sxx, None, self.sxy,
+                        (var, constant), (var.transpose(0, 2, 1), constant.transpose(0, 2, 1)))
+
+
+class CorrelationEngine:
+    """Correlation matrices and lagged cross-correlations of `columns` per country.
+
+    `values` is the dense (country, year, indicator) array, NaN where a
+    row or value is missing, for `countries` and the consecutive `years`.
+    """
+
+    def __init__(self, countries, years, columns, values):
+        self.countries = countries
+        self.years = years
+        self.columns = columns
+        self._codes = {name: code for code, name in enumerate(countries)}
+        self._mask = ~np.isnan(values)
+        # Centring changes no correlation but keeps the sums of squares well conditioned
+        counts = self._mask.sum(axis=1, keepdims=True)
+        with np.errstate(invalid='ignore'):
+            means = np.where(self._mask, values, 0).sum(axis=1, keepdims=True) / counts
+        centred = np.where(self._mask, values - np.nan_to_num(means), 0)
+        # (country, year, indicator) for the lags; (country, indicator, year) for the window sums
+        self._values = centred
+        self._rows = np.ascontiguousarray(centred.transpose(0, 2, 1))
+        self._squares = self._rows * self._rows
+        self._mask = self._mask.astype(np.float64)
+        self._present = np.ascontiguousarray(self._mask.transpose(0, 2, 1))
+        # (lo, hi) -> _WindowSums, least recently used first
+        self._windows = OrderedDict()
+        self._windows_lock = threading.Lock()
+
+    @classmethod
+    def from_query(cls, query, columns=INDICATORS):
+        """Engine over every country and year `query` serves."""
+        frame = query.select(columns=[COUNTRY, YEAR] + list(columns))
+        countries = list(query.countries)
+        lo, hi = query.year_bounds
+        codes = pd.Categorical(frame[COUNTRY], categories=countries).codes
+        keep = codes >= 0
+        values = np.full((len(countries), hi - lo + 1, len(columns)), np.nan)
+        values[codes[keep], frame[YEAR].to_numpy()[keep] - lo] = frame[list(columns)].to_numpy(np.float64)[keep]
+        return cls(countries, (lo, hi), list(columns), values)
+
+    def _positions(self, countries):
+        if countries is None:
+            return np.arange(len(self.countries))
+        return np.array([self._codes[c] for c in countries if c in self._codes], dtype=np.int64)
+
+    def _clip(self, years):
+        first, last = self.years
+        lo, hi = years if years is not None else self.years
+        return max(first, lo) - first, min(last, hi) - first
+
+    def _sums(self, lo, hi):
+        """_WindowSums of the year offsets lo..hi, from the nearest cached window when that is cheaper."""
+        with self._windows_lock:
+            if (lo, hi) in self._windows:
+                self._windows.move_to_end((lo, hi))
+                return self._windows[(lo, hi)]
+            # Adding and subtracting the years that moved from a cached window, against summing afresh
+            best, cost = None, BLOCK_YEARS + hi - lo + 1
+            for a, b in self._windows:
+                blocks = [stop - start + 1 for start, stop in _moved(lo, hi, a, b) if start <= stop]
+                moved = sum(2 * BLOCK_YEARS + length for length in blocks)
+                if moved < cost:
+                    best, cost = (a, b), moved
+            base = self._windows[best] if best is not None else None
+        if base is None:
+            sums = self._of(lo, hi)
+        else:
+            a, b = best
+            sums = base
+            blocks = _moved(lo, hi, a, b)
+            entered, left = blocks[:2], blocks[2:]
+            for start, stop in entered:
+                if start <= stop:
+                    sums = sums + self._of(start, stop)
+            for start, stop in left:
+                if start <= stop:
+                    sums = sums - self._of(start, stop)
+        with self._windows_lock:
+            self._windows[(lo, hi)] = sums
+            while len(self._windows) > WINDOW_STATES:
+                self._windows.popitem(last=False)
+        return sums
+
+    def _of(self, lo, hi):
+        years = np.s_[:, :, lo:hi + 1]
+        return _WindowSums.of(self._rows[years], self._squares[years], self._present[years])
+
+    def matrices(self, years=None, countries=None):
+        """(country, indicator, indicator) correlations within the inclusive `years` range."""
+        rows = self._positions(countries)
+        lo, hi = self._clip(years)
+        if lo > hi:
+            return np.full((len(rows), len(self.columns), len(self.columns)), np.nan)
+        sums = self._sums(lo, hi)
+        return (sums if countries is None else sums.take(rows)).correlation()
+
+    def matrix(self, years=None, countries=None):
+        """Indicator x indicator frame: the correlations of one country, or their mean over several."""
+        with warnings.catch_warnings():
+            # Pairs without a correlation in any country stay NaN
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            mean = np.nanmean(self.matrices(years, countries), axis=0)
+        return pd.DataFrame(mean, index=self.columns, columns=self.columns)
+
+    def lagged(self, x, y, years=None, countries=None, max_lag=5):
+        """Correlation of `x` in year t with `y` in year t + lag, for lag in -max_lag..max_lag.
+
+        Both years have to fall within `years`.  Returns a (country, lag)
+        frame; positive lags mean `x` leads `y`.
+        """
+        rows = self._positions(countries)
+        lo, hi = self._clip(years)
+        lags = np.arange(-max_lag, max_lag + 1)
+        i, j = self.columns.index(x), self.columns.index(y)
+        window = np.s_[rows, lo:hi + 1]
+        xv, xm = self._values[window][..., i], self._mask[window][..., i]
+        # (lag, country, year): y of year t + lag at position t
+        yv, ym = _shifted(self._values[window][..., j], lags), _shifted(self._mask[window][..., j], lags)
+        both = xm * ym
+        xv, yv = xv * both, yv * both
+        r = _pearson(both.sum(-1), xv.sum(-1), yv.sum(-1), (xv * xv).sum(-1), (yv * yv).sum(-1), (xv * yv).sum(-1))
+        return pd.DataFrame(r.T, index=[self.countries[row] for row in rows], columns=lags)
+
+
+def _moved(lo, hi, a, b):
+    """Year blocks entering (lo..hi but not a..b) and then leaving (a..b but not lo..hi) the window."""
+    return [(lo, min(a - 1, hi)), (max(b + 1, lo), hi), (a, min(lo - 1, b)), (max(hi + 1, a), b)]
+
+
+def _shifted(values, lags):
+    """(lag, country, year) stack of `values` moved back by each lag along the years, zero-padded."""
+    span = values.shape[-1]
+    stacked = np.zeros((len(lags),) + values.shape)
+    for k, lag in enumerate(lags):
+        if lag >= 0:
+            stacked[k, :, :max(span - lag, 0)] = values[:, lag:]
+        else:
+            stacked[k, :, min(-lag, span):] = values[:, :max(span + lag, 0)]
+    return stacked
+
+
+def correlation_engine(query, columns=INDICATORS):
+    """The CorrelationEngine of the data `query` serves, built once per version of it."""
+    key = (query.path, query.data_version(), tuple(columns))
+    with _lock:
+        engine = _engines.get(key)
+        if engine is not None:
+            _engines.move_to_end(key)
+            return engine
+    engine = CorrelationEngine.from_query(query, columns)
+    with _lock:
+        engine = _engines.setdefault(key, engine)
+        while len(_engines) > ENGINES:
+            _engines.popitem(last=False)
+    return engine
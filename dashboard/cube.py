@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from dashboard.schema import COUNTRY, YEAR
+
+def poverty_long_form(table):
+    """Poverty and unemployment per country, long form, by ascending poverty rate."""
+    data = table[[COUNTRY, 'Tỷ lệ nghèo (%)', 'Tỷ lệ thất nghiệp (%)']].dropna()
+    data = data.sort_values(by='Tỷ lệ nghèo (%)', ascending=True, kind='stable')
+    data = data.rename(columns={
+        'Tỷ lệ nghèo (%)': 'Hộ nghèo',
+        'Tỷ lệ thất nghiệp (%)': 'Thất nghiệp'
+    })
+    return pd.melt(data,
+                   id_vars=[COUNTRY],
+                   value_vars=['Thất nghiệp', 'Hộ nghèo'],
+                   var_name='Metric',
+                   value_name='Value (%)').astype({'Metric': 'category'})
+
+
+def energy_share_long_form(table):
+    """Renewable and non-renewable share of energy per country, long form."""
+    data = table[[COUNTRY, YEAR, 'Tiêu thụ năng lượng (TWh)', 'Tỷ lệ năng lượng tái tạo (%)',
+                  'Tỉ lệ năng lượng không tái tạo (%)']]
+    return pd.melt(data,
+                   id_vars=[COUNTRY, YEAR],
+                   value_vars=['Tỷ lệ năng lượng tái tạo (%)', 'Tỉ lệ năng lượng không tái tạo (%)'],
+                   var_name='Loại năng lượng',
+                   value_name='Phần trăm').astype({'Loại năng lượng': 'category'})
+
+
+# Long-form frames: name -> (source columns, function of a per-year table).
+# The melted name columns are categorical: one code per row instead of a string.
+LONG_FORMS = {
+    'poverty': (['Tỷ lệ nghèo (%)', 'Tỷ lệ thất nghiệp (%)'], poverty_long_form),
+    'energy_share': (['Tiêu thụ năng lượng (TWh)', 'Tỷ lệ năng lượng tái tạo (%)', 'Tỉ lệ năng lượng không tái tạo (%)'],
+                     energy_share_long_form),
+}
+
+
+class YearCube:
+    """Per-year, per-country tables precomputed from the dataset.
+
+    Each year maps to the rows of that year (countries in data order), with
+    the derived columns (dashboard.derived) the frame carries, plus the
+    long-form frames the year snapshot charts plot.  Anything that only exists for the columns actually loaded
+    is built; the rest is skipped.
+    """
+
+    def __init__(self, tables, long_forms, empty):
+        self._tables = tables
+        self._long_forms = long_forms
+        # Zero-row table with every column, served for years without data
+        self._empty = empty
+
+    @classmethod
+    def from_frame(cls, df):
+        # Rows by year, and within a year in the country order of the data.
+        # A frame already in that order (a shared file) is sliced, not copied.
+        order = np.lexsort((df[COUNTRY].cat.codes.to_numpy(), df[YEAR].to_numpy()))
+        if not np.array_equal(order, np.arange(len(df))):
+            df = df.iloc[order]
+        years = df[YEAR].to_numpy()
+        starts = np.r_[0, np.flatnonzero(np.diff(years)) + 1]
+        stops = np.r_[starts[1:], len(df)]
+        tables = {int(years[start]): df.iloc[start:stop]
+                  for start, stop in zip(starts, stops) if stop > start}
+        empty = df.iloc[:0]
+        long_forms = {}
+        for name, (sources, fn) in LONG_FORMS.items():
+            if all(c in df.columns for c in sources):
+                long_forms[name] = {year: fn(table) for year, table in tables.items()}
+                long_forms[name][None] = fn(empty)
+        return cls(tables, long_forms, empty)
+
+    @property
+    def years(self):
+        return list(self._tables)
+
+    def table(self, year, countries=None):
+        return _filter_countries(self._tables.get(int(year), self._empty), countries)
+
+    def long_form(self, name, year, countries=None):
+        frames = self._long_forms[name]
+        return _filter_countries(frames.get(int(year), frames[None]), countries)
+
+
+def _filter_countries(frame, countries):
+    if countries is None:
+        return frame
+    return frame[frame[COUNTRY].isin(countries)]
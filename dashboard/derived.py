@@ -0,0 +1,188 @@
+"""Derived indicators, declared once and computed in one vectorized pass.
+
+Every entry of DERIVED names a column built from dataset columns: a
+row-wise expression (Complement, Ratio) or a per-country series over the
+years (Growth on the previous year, Indexed to the base year).  compute()
+evaluates all the entries a frame has the sources for with NumPy, locating
+each row's previous-year and base-year row once for all of them; the same
+entries render themselves as SQL for dashboard.duckdb_backend.  A page
+lists the derived columns it plots in its COLUMNS and selects them like
+any other indicator; only those are computed (see requested()).
+"""
+import os
+
+import numpy as np
+
+from dashboard.schema import COUNTRY, YEAR
+
+# Year the Indexed columns are 100 in; the first year of the dataset if unset
+BASE_YEAR = int(os.environ['DASHBOARD_BASE_YEAR']) if os.environ.get('DASHBOARD_BASE_YEAR') else None
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _divide(numerator, denominator):
+    """numerator / denominator in float64, NaN where the denominator is 0 (NULLIF in SQL)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        quotient = np.asarray(numerator, dtype=np.float64) / denominator
+    quotient[np.asarray(denominator) == 0] = np.nan
+    return quotient
+
+
+def _take(values, positions):
+    """values[positions], NaN where the position is -1."""
+    taken = np.asarray(values, dtype=np.float64)[positions]
+    taken[positions < 0] = np.nan
+    return taken
+
+
+class Complement:
+    """`total` minus a share, e.g. the non-renewable part of a percentage."""
+
+    previous = base = False
+
+    def __init__(self, source, total=100):
+        self.sources = [source]
+        self.total = total
+
+    def compute(self, values, rows):
+        return self.total - values[self.sources[0]]
+
+    def sql(self, base_year):
+        return f'{self.total} - {_quote(self.sources[0])}'
+
+
+class Ratio:
+    """numerator / denominator * scale, row by row."""
+
+    previous = base = False
+
+    def __init__(self, numerator, denominator, scale=1):
+        self.sources = [numerator, denominator]
+        self.scale = scale
+
+    def compute(self, values, rows):
+        numerator, denominator = self.sources
+        return (_divide(values[numerator], values[denominator]) * self.scale).astype(np.float32)
+
+    def sql(self, base_year):
+        numerator, denominator = map(_quote, self.sources)
+        return f'CAST(CAST({numerator} AS DOUBLE) / NULLIF({denominator}, 0) * {self.scale} AS FLOAT)'
+
+
+class Growth:
+    """Change on the same country's previous year, in percent; NaN without that year."""
+
+    previous, base = True, False
+
+    def __init__(self, source):
+        self.sources = [source]
+
+    def compute(self, values, rows):
+        current = values[self.sources[0]]
+        return ((_divide(current, _take(current, rows.previous)) - 1) * 100).astype(np.float32)
+
+    def sql(self, base_year):
+        source, year = _quote(self.sources[0]), _quote(YEAR)
+        window = f'OVER (PARTITION BY code ORDER BY {year})'
+        return (f'CASE WHEN lag({year}) {window} = {year} - 1 THEN CAST((CAST({source} AS DOUBLE) '
+                f'/ NULLIF(lag({source}) {window}, 0) - 1) * 100 AS FLOAT) END')
+
+
+class Indexed:
+    """The same country's series rescaled to 100 in the base year; NaN without that year."""
+
+    previous, base = False, True
+
+    def __init__(self, source):
+        self.sources = [source]
+
+    def compute(self, values, rows):
+        current = values[self.sources[0]]
+        return (_divide(current, _take(current, rows.base)) * 100).astype(np.float32)
+
+    def sql(self, base_year):
+        source, year = _quote(self.sources[0]), _quote(YEAR)
+        return (f'CAST(CAST({source} AS DOUBLE) / NULLIF(max(CASE WHEN {year} = {int(base_year)} '
+                f'THEN {source} END) OVER (PARTITION BY code), 0) * 100 AS FLOAT)')
+
+
+# Derived indicators: name -> spec
+DERIVED = {
+    'Tỉ lệ năng lượng không tái tạo (%)': Complement('Tỷ lệ năng lượng tái tạo (%)'),
+    # million tonnes per million people = tonnes per person
+    'Phát thải CO2 bình quân đầu người (tấn)': Ratio('Lượng phát thải CO2 (triệu tấn)', 'Dân số (triệu người)'),
+    # billions over trillions of USD, in percent
+    'Chi tiêu quân sự (% GDP)': Ratio('Chi tiêu quân sự (tỷ USD)', 'GDP (nghìn tỷ USD)', scale=0.1),
+    'Tăng trưởng GDP (%)': Growth('GDP (nghìn tỷ USD)'),
+    'Tăng trưởng GDP bình quân đầu người (%)': Growth('GDP bình quân đầu người (USD)'),
+    'Chỉ số GDP (năm gốc = 100)': Indexed('GDP (nghìn tỷ USD)'),
+    'Chỉ số phát thải CO2 (năm gốc = 100)': Indexed('Lượng phát thải CO2 (triệu tấn)'),
+}
+
+
+def base_year(year_bounds):
+    return BASE_YEAR if BASE_YEAR is not None else year_bounds[0]
+
+
+def requested(columns):
+    """Names of DERIVED among `columns` (all of them if None), in declaration order."""
+    if columns is None:
+        return list(DERIVED)
+    return [name for name in DERIVED if name in columns]
+
+
+def dataset_columns(columns):
+    """`columns` with each derived name replaced by the dataset columns it is computed from (None stays None)."""
+    if columns is None:
+        return None
+    stored = [c for c in columns if c not in DERIVED]
+    for name in requested(columns):
+        stored += [c for c in DERIVED[name].sources if c not in stored]
+    return stored
+
+
+def history(names):
+    """(needs the previous year, needs the base year) of the derived columns `names`."""
+    return (any(DERIVED[name].previous for name in names),
+            any(DERIVED[name].base for name in names))
+
+
+class _Rows:
+    """Position of each row's previous-year and base-year row of the same country (-1 if none)."""
+
+    def __init__(self, frame, base_year):
+        codes = frame[COUNTRY].cat.codes.to_numpy().astype(np.int64)
+        years = frame[YEAR].to_numpy().astype(np.int64)
+        order = np.lexsort((years, codes))
+        self.previous = np.full(len(frame), -1, dtype=np.int64)
+        before, after = order[:-1], order[1:]
+        follows = (codes[before] == codes[after]) & (years[before] == years[after] - 1) & (codes[after] >= 0)
+        self.previous[after[follows]] = before[follows]
+        at_base = np.flatnonzero((years == base_year) & (codes >= 0))
+        by_code = np.full(len(frame[COUNTRY].cat.categories) + 1, -1, dtype=np.int64)
+        by_code[codes[at_base]] = at_base
+        # Code -1 (no country) reads the trailing -1
+        self.base = by_code[codes]
+
+
+def compute(frame, base_year, names):
+    """{name: values} of the derived columns `names`, aligned with `frame`.
+
+    Growth and Indexed columns only see the years present in `frame`, so
+    it has to hold the previous and the base year of the rows they are read
+    for (see history()).
+    """
+    if not names:
+        return {}
+    values = {c: frame[c].to_numpy() for name in names for c in DERIVED[name].sources}
+    previous, base = history(names)
+    rows = _Rows(frame, base_year) if previous or base else None
+    return {name: DERIVED[name].compute(values, rows) for name in names}
+
+
+def add_derived(frame, base_year, names):
+    """`frame` with the derived columns `names` appended."""
+    return frame.assign(**compute(frame, base_year, names))
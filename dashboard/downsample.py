@@ -0,0 +1,134 @@
+"""Server-side downsampling of the year-range charts.
+
+A line chart cannot show more distinct points than it is wide in pixels,
+so sending more only grows the payload.  Before a figure is built each
+series is cut down to a point budget derived from the chart's width,
+with largest-triangle-three-buckets (keeps the visual shape) or min/max
+per bucket (keeps the extremes).  Series within budget pass through
+untouched, so narrowing the year range - the dashboard's way of zooming
+in - gets back to full resolution as soon as the selection fits.
+
+Series are processed in batches: all series of the same length are
+stacked into one 2-D array and reduced together, so the cost grows with
+the number of buckets rather than the number of countries.
+"""
+import os
+
+import numpy as np
+
+from dashboard.schema import COUNTRY
+
+# Width of the main content area in CSS pixels (the app uses the wide layout)
+CONTENT_WIDTH = int(os.environ.get('DASHBOARD_CONTENT_WIDTH', 1400))
+# Below this many points per series a chart is never downsampled
+MIN_POINTS = 50
+
+
+def column_width(spec, index, total=CONTENT_WIDTH):
+    """Pixel width of column `index` of ``st.columns(spec)``."""
+    return int(total * spec[index] / sum(spec))
+
+
+def max_points(width):
+    """Point budget per series for a chart `width` pixels wide (one point per pixel)."""
+    return max(MIN_POINTS, int(width))
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-triangle-three-buckets over the rows of `x` and `y` (series x points).
+
+    Returns an (series, n_out) array of the kept positions, first and last
+    point included.
+    """
+    n_series, n = y.shape
+    if n <= n_out:
+        return np.tile(np.arange(n), (n_series, 1))
+    rows = np.arange(n_series)
+    # Bucket boundaries over the interior points 1 .. n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    kept = np.empty((n_series, n_out), dtype=np.intp)
+    kept[:, 0] = 0
+    kept[:, -1] = n - 1
+    a = np.zeros(n_series, dtype=np.intp)
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[:, edges[i + 1]:edges[i + 2]].mean(axis=1)
+            next_y = y[:, edges[i + 1]:edges[i + 2]].mean(axis=1)
+        else:
+            next_x, next_y = x[:, -1], y[:, -1]
+        ax, ay = x[rows, a], y[rows, a]
+        bx, by = x[:, start:stop], y[:, start:stop]
+        area = np.abs((ax - next_x)[:, None] * (by - ay[:, None])
+                      - (ax[:, None] - bx) * (next_y - ay)[:, None])
+        a = start + area.argmax(axis=1)
+        kept[:, i + 1] = a
+    return kept
+
+
+def minmax_indices(y, n_out):
+    """Positions of the minimum and maximum of each of n_out // 2 buckets, in order.
+
+    Where a bucket's minimum and maximum are the same point (a flat
+    bucket), its first or last point stands in for one of them, so no
+    position is returned twice.
+    """
+    n_series, n = y.shape
+    if n <= n_out:
+        return np.tile(np.arange(n), (n_series, 1))
+    # Every bucket holds at least 2 points, since n > n_out
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(int)
+    kept = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        bucket = y[:, start:stop]
+        low, high = bucket.argmin(axis=1), bucket.argmax(axis=1)
+        last = stop - start - 1
+        high = np.where(low != high, high, np.where(low == last, 0, last))
+        kept.append(start + low)
+        kept.append(start + high)
+    return np.sort(np.stack(kept, axis=1), axis=1)
+
+
+def _reduce(x, y, n_out, method):
+    if method == 'lttb':
+        return lttb_indices(x, y, n_out)
+    if method == 'minmax':
+        return minmax_indices(y, n_out)
+    raise ValueError(f'unknown downsampling method: {method!r}')
+
+
+def downsample(frame, x, y, n_out, by=COUNTRY, method='lttb', align=False):
+    """Rows of `frame` with every `by` series of `y` over `x` cut to at most `n_out` points.
+
+    Rows are expected in series order, sorted by `x` within a series (as
+    DatasetQuery.select returns them).  Series that fit the budget are kept
+    whole, missing values included; longer ones drop their missing values
+    and are reduced.  With `align`, the kept x values are chosen once from
+    the total across series and applied to all of them, which stacked
+    charts need.
+    """
+    if align:
+        totals = frame.groupby(x, sort=True)[y].sum()
+        if len(totals) <= n_out:
+            return frame
+        picked = _reduce(totals.index.to_numpy(float)[None, :], totals.to_numpy(float)[None, :], n_out, method)
+        return frame[frame[x].isin(totals.index[picked[0]])]
+
+    groups = frame.groupby(by, sort=False, observed=True).indices
+    if all(len(positions) <= n_out for positions in groups.values()):
+        return frame
+    xs = frame[x].to_numpy(float)
+    ys = frame[y].to_numpy(float)
+    keep = []
+    batches = {}
+    for positions in groups.values():
+        if len(positions) <= n_out:
+            keep.append(positions)
+            continue
+        positions = positions[~np.isnan(ys[positions])]
+        batches.setdefault(len(positions), []).append(positions)
+    for members in batches.values():
+        positions = np.stack(members)
+        picked = _reduce(xs[positions], ys[positions], n_out, method)
+        keep.append(np.take_along_axis(positions, picked, axis=1).ravel())
+    return frame.iloc[np.sort(np.concatenate(keep))]
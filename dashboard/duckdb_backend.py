@@ -0,0 +1,228 @@
+"""Query backend running the page filters inside an embedded DuckDB database.
+
+The CSV is loaded into an in-process DuckDB table once per version of the
+file, cleaned in SQL the way dashboard.clean cleans it for the other
+backends; a Parquet snapshot (see dashboard.ingest, already cleaned) is
+queried in place without loading it.  Every selection is one SQL statement - country and year
+predicates, the derived columns (dashboard.derived, rendered as SQL and
+window functions) and the long-form melts all run in the engine - and only the chart-ready rows are converted to a
+pandas frame, with the same dtypes and row order as DatasetQuery returns.
+
+DuckDB is optional: select the backend with DASHBOARD_BACKEND=duckdb once
+it is installed (``pip install duckdb``).
+"""
+import importlib.util
+import os
+import threading
+
+import pandas as pd
+
+from dashboard.clean import POLICY, RANGES, valid_rows
+from dashboard.derived import DERIVED, base_year, dataset_columns, history, requested
+from dashboard.loader import file_digest, is_snapshot, resolve_source
+from dashboard.schema import COUNTRY, INDICATORS, YEAR
+
+HAVE_DUCKDB = importlib.util.find_spec('duckdb') is not None
+
+# Long forms of dashboard.cube.LONG_FORMS as a UNION ALL of one SELECT per melted value:
+# name -> (source columns, id columns, name column, value column, [(label, expression)], filter, sort key)
+LONG_FORMS_SQL = {
+    'poverty': (
+        ['Tỷ lệ nghèo (%)', 'Tỷ lệ thất nghiệp (%)'],
+        [COUNTRY], 'Metric', 'Value (%)',
+        [('Thất nghiệp', '"Tỷ lệ thất nghiệp (%)"'), ('Hộ nghèo', '"Tỷ lệ nghèo (%)"')],
+        '"Tỷ lệ nghèo (%)" IS NOT NULL AND "Tỷ lệ thất nghiệp (%)" IS NOT NULL',
+        '"Tỷ lệ nghèo (%)"',
+    ),
+    'energy_share': (
+        ['Tiêu thụ năng lượng (TWh)', 'Tỷ lệ năng lượng tái tạo (%)'],
+        [COUNTRY, YEAR], 'Loại năng lượng', 'Phần trăm',
+        [('Tỷ lệ năng lượng tái tạo (%)', '"Tỷ lệ năng lượng tái tạo (%)"'),
+         ('Tỉ lệ năng lượng không tái tạo (%)', DERIVED['Tỉ lệ năng lượng không tái tạo (%)'].sql(None))],
+        None,
+        None,
+    ),
+}
+
+_lock = threading.Lock()
+# resolved source path -> _Database
+_databases = {}
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value):
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _cleaned(column):
+    """SQL for `column` of a CSV read as text, typed and cleaned as dashboard.clean does."""
+    value = f'TRY_CAST({_quote(column)} AS DOUBLE)'
+    if column == YEAR:
+        return f'CAST({value} AS SMALLINT)'
+    value = f'CAST({value} AS FLOAT)'
+    if column in RANGES and POLICY != 'flag':
+        lo, hi = RANGES[column]
+        low, high = (lo, hi) if POLICY == 'clamp' else ('NULL', 'NULL')
+        value = f'CAST(CASE WHEN {value} < {lo} THEN {low} WHEN {value} > {hi} THEN {high} ELSE {value} END AS FLOAT)'
+    return value
+
+
+class _Database:
+    """One version of the dataset loaded into (or attached to) a DuckDB connection."""
+
+    def __init__(self, source, key):
+        import duckdb
+
+        self.source = source
+        self.key = key
+        self.version = file_digest(source)
+        self.connection = duckdb.connect()
+        if is_snapshot(source):
+            self.connection.execute(
+                f'CREATE VIEW raw AS SELECT file_row_number AS rn, * EXCLUDE (file_row_number) '
+                f'FROM read_parquet({_literal(source)}, file_row_number = true)')
+        else:
+            # Rows without a country or a whole year are dropped, values that are not numbers are missing
+            year = f'TRY_CAST({_quote(YEAR)} AS DOUBLE)'
+            columns = ', '.join(f'{_cleaned(c)} AS {_quote(c)}' for c in [YEAR] + INDICATORS)
+            self.connection.execute(
+                f'CREATE TABLE raw AS SELECT row_number() OVER () AS rn, {_quote(COUNTRY)}, {columns} '
+                f'FROM read_csv({_literal(source)}, header = true, all_varchar = true) '
+                f'WHERE {_quote(COUNTRY)} IS NOT NULL AND {year} = floor({year})')
+        # Countries are coded in order of first appearance, as the loader orders its categories
+        self.connection.execute(
+            f'CREATE TABLE countries AS SELECT {_quote(COUNTRY)} AS name, '
+            f'CAST(row_number() OVER (ORDER BY min(rn)) - 1 AS INTEGER) AS code '
+            f'FROM raw WHERE {_quote(COUNTRY)} IS NOT NULL GROUP BY ALL')
+        # A loaded CSV keeps the country codes in its table; a snapshot joins them on the fly
+        kind = 'VIEW' if is_snapshot(source) else 'TABLE'
+        self.connection.execute(
+            f'CREATE {kind} data AS SELECT countries.code, raw.* EXCLUDE (rn) '
+            f'FROM raw JOIN countries ON raw.{_quote(COUNTRY)} = countries.name')
+        self.countries = [name for name, in self.connection.execute(
+            'SELECT name FROM countries ORDER BY code').fetchall()]
+        self.codes = {name: code for code, name in enumerate(self.countries)}
+        lo, hi = self.connection.execute(f'SELECT min({_quote(YEAR)}), max({_quote(YEAR)}) FROM data').fetchone()
+        self.year_bounds = (int(lo), int(hi)) if lo is not None else (0, 0)
+        self.columns = [name for name, in self.connection.execute(
+            "SELECT column_name FROM (DESCRIBE data) WHERE column_name <> 'code'").fetchall()]
+        self.shape = (self.connection.execute('SELECT count(*) FROM raw').fetchone()[0], len(self.columns))
+
+    def execute(self, sql, params=()):
+        # A cursor is a connection of its own, so concurrent sessions do not share state
+        return self.connection.cursor().execute(sql, params).df()
+
+    @classmethod
+    def open(cls, path):
+        """The database for the data currently served for `path`, rebuilt when the file changes."""
+        source = resolve_source(path)
+        if not is_snapshot(source):
+            # DuckDB reads CSV and Parquet; a shared Arrow file falls back to its CSV
+            source = os.path.abspath(path)
+        st = os.stat(source)
+        key = (st.st_mtime_ns, st.st_size)
+        database = _databases.get(source)
+        if database is None or database.key != key:
+            with _lock:
+                database = _databases.get(source)
+                if database is None or database.key != key:
+                    database = _databases[source] = cls(source, key)
+        return database
+
+
+class DuckDBQuery:
+    """DatasetQuery answered by SQL against a DuckDB database."""
+
+    def __init__(self, database, path, columns=None):
+        self.database = database
+        self.path = path
+        self.version = database.version
+        self.derived = requested(columns)
+        columns = dataset_columns(columns)
+        columns = INDICATORS if columns is None else [c for c in columns if c not in (COUNTRY, YEAR)]
+        unknown = [c for c in columns if c not in database.columns]
+        if unknown:
+            raise KeyError(f'Unknown columns: {unknown}')
+        self.columns = columns
+
+    @property
+    def countries(self):
+        return self.database.countries
+
+    @property
+    def year_bounds(self):
+        return self.database.year_bounds
+
+    @property
+    def shape(self):
+        return self.database.shape
+
+    def data_version(self, years=None, year=None):
+        return self.version
+
+    def select(self, countries=None, years=None, year=None, columns=None, valid=False):
+        """Rows for `countries` within the `years` range and/or the single `year`, as DatasetQuery.select."""
+        if year is not None:
+            lo, hi = years if years is not None else (year, year)
+            years = (year, year) if lo <= year <= hi else (max(lo, year), min(hi, year))
+        lo, hi = years if years is not None else self.year_bounds
+        base = base_year(self.year_bounds)
+        expressions = ([_quote(YEAR)] + [_quote(c) for c in self.columns]
+                       + [f'{DERIVED[name].sql(base)} AS {_quote(name)}' for name in self.derived])
+        previous, indexed = history(self.derived)
+        if previous or indexed:
+            # The windows read the previous and the base year, so the selected years are kept after them
+            years = [lo, hi] + ([lo - 1] if previous else []) + ([base] if indexed else [])
+            where, params = self._where(countries, min(years), max(years))
+            sql = (f'SELECT * FROM (SELECT code, {", ".join(expressions)} FROM data WHERE {where}) '
+                   f'WHERE {_quote(YEAR)} BETWEEN ? AND ?')
+            params += [lo, hi]
+        else:
+            where, params = self._where(countries, lo, hi)
+            sql = f'SELECT code, {", ".join(expressions)} FROM data WHERE {where}'
+        frame = self._frame(f'{sql} ORDER BY code, {_quote(YEAR)}', params)
+        if valid:
+            frame = frame[valid_rows(frame, columns)]
+        return frame[columns] if columns is not None else frame
+
+    def long_form(self, name, year, countries=None):
+        """Long-form frame `name` (see dashboard.cube.LONG_FORMS) for one year, melted in SQL."""
+        sources, ids, name_column, value_column, melted, condition, sort = LONG_FORMS_SQL[name]
+        missing = [c for c in sources if c not in self.columns]
+        if missing:
+            raise KeyError(f'Long form {name!r} needs columns {missing}')
+        where, params = self._where(countries, year, year)
+        if condition:
+            where += f' AND {condition}'
+        # Parts stack in melt order; within a part rows keep the sort key, then data order
+        keys = ['code'] + [_quote(c) for c in ids if c != COUNTRY]
+        selects = [f'SELECT {part} AS part, {sort or "NULL"} AS sort, {", ".join(keys)}, '
+                   f'{_literal(label)} AS {_quote(name_column)}, CAST({expression} AS FLOAT) AS {_quote(value_column)} '
+                   f'FROM data WHERE {where}'
+                   for part, (label, expression) in enumerate(melted)]
+        frame = self._frame(f'SELECT * EXCLUDE (part, sort) FROM ({" UNION ALL ".join(selects)}) '
+                            f'ORDER BY part, sort, code', params * len(melted))
+        return frame.astype({name_column: 'category'})
+
+    def _where(self, countries, lo, hi):
+        where = f'{_quote(YEAR)} BETWEEN ? AND ?'
+        params = [lo, hi]
+        if countries is not None:
+            where += ' AND list_contains(?::INTEGER[], code)'
+            params.append([self.database.codes[c] for c in countries if c in self.database.codes])
+        return where, params
+
+    def _frame(self, sql, params):
+        frame = self.database.execute(sql, params)
+        codes = frame.pop('code').to_numpy()
+        frame.insert(0, COUNTRY, pd.Categorical.from_codes(codes, categories=self.database.countries))
+        return frame
+
+
+def load_duckdb_query(path, columns=None):
+    if not HAVE_DUCKDB:
+        raise ImportError('the duckdb backend needs the duckdb package (pip install duckdb)')
+    return DuckDBQuery(_Database.open(path), path, columns)
@@ -0,0 +1,121 @@
+"""Pre-render the charts of every page into a figure store (dashboard.figstore).
+
+Each page is rendered headlessly (Streamlit's AppTest) the way final.py
+renders it, first in its default state and then in every state of its
+year filters, one filter at a time: each year range with --ranges (the
+full range otherwise), then each single year.  The country selection
+stays at its default, every country.  The payload of every figure built along the way
+is written to the store, and the app started with DASHBOARD_STATIC_DIR
+serves them instead of building; other selections are built on demand as
+before.  Export again when the data, the code or the settings change: a
+stale store is ignored.
+
+Usage: python -m dashboard.export DATA -o DIR [--page NAME ...] [--ranges]
+"""
+import argparse
+import time
+
+from dashboard.figcache import figure_cache
+from dashboard.figstore import FigureStore, fingerprint
+from dashboard.sections import YEAR, YEAR_RANGE
+from dashboard.sources import open_source
+from dashboard.views import PAGES
+
+
+def _page_script(page, path):
+    """Body of final.py for one page, without the menu and the styles (run by AppTest)."""
+    import streamlit as st
+
+    from dashboard.sections import SectionRuntime
+    from dashboard.sources import open_source
+    from dashboard.views import load_page
+
+    module = load_page(page)
+    query = open_source(path).query(module.COLUMNS)
+    SectionRuntime.for_session(st.session_state).begin_run()
+    module.render(query)
+
+
+def year_ranges(year_bounds, ranges=False):
+    """Year ranges walked: every (first, last) within `year_bounds` with `ranges`, else the full one."""
+    lo, hi = year_bounds
+    if not ranges:
+        return [(lo, hi)]
+    return [(first, last) for last in range(lo, hi + 1) for first in range(lo, last + 1)]
+
+
+def _widget(at, kind, key):
+    try:
+        return getattr(at, kind)(key=key)
+    except KeyError:
+        return None
+
+
+def _flush(store):
+    """Move the figures built since the last flush from the figure cache to `store`."""
+    added = 0
+    for key, payload in figure_cache.items():
+        if key not in store:
+            store.put(key, payload)
+            added += 1
+    figure_cache.clear()
+    return added
+
+
+def export_page(page, path, store, ranges=False):
+    """Render the states of `page` on the data at `path` into `store`; (states, figures added)."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_function(_page_script, args=(page, path), default_timeout=600)
+
+    def run():
+        at.run()
+        if at.exception:
+            raise RuntimeError(f'{page}: {at.exception[0].message}')
+        return _flush(store)
+
+    added = run()
+    walked = 1
+    has_range, has_year = _widget(at, 'slider', YEAR_RANGE) is not None, _widget(at, 'selectbox', YEAR) is not None
+    if not has_range and not has_year:
+        return walked, added
+    lo, hi = open_source(path).query([]).year_bounds
+    # Walk the ranges with the year at its default, then the years over the full range,
+    # so the states add up instead of multiplying.  Charts reading both widgets (the
+    # governance bubbles) are stored for those combinations; others are built on demand.
+    if has_range:
+        for years in year_ranges((lo, hi), ranges):
+            at.slider(key=YEAR_RANGE).set_value(years)
+            added += run()
+            walked += 1
+        at.slider(key=YEAR_RANGE).set_value((lo, hi))
+    if has_year:
+        for year in range(lo, hi + 1):
+            at.selectbox(key=YEAR).set_value(year)
+            added += run()
+            walked += 1
+    return walked, added
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pre-render the charts of the dashboard for the common filter states.')
+    parser.add_argument('data', help='dataset, as DASHBOARD_DATA would name it')
+    parser.add_argument('-o', '--output', required=True, help='figure store directory (DASHBOARD_STATIC_DIR)')
+    parser.add_argument('--page', choices=list(PAGES), action='append', help='pages to export (default: all)')
+    parser.add_argument('--ranges', action='store_true', help='walk every year range, not only the full one')
+    args = parser.parse_args()
+
+    store = FigureStore.open(args.output, fingerprint())
+    # Figures already in the store are read back instead of built again
+    figure_cache.store = store
+    for page in args.page or list(PAGES):
+        t0 = time.perf_counter()
+        walked, added = export_page(page, args.data, store, args.ranges)
+        print(f'{page}: {walked} states, {added} new figures in {time.perf_counter() - t0:.1f} s')
+        store.save()
+    print(f'{args.output}: {len(store)} figures, {len(store.objects())} distinct payloads, '
+          f'{store.nbytes() / 2**20:.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from dashboard import profiling
+from dashboard.figstore import static_store
+
+DEFAULT_MAX_BYTES = int(float(os.environ.get('FIGURE_CACHE_MAX_MB', 64)) * 1024 * 1024)
+
+
+def figure_key(chart_id, version, countries=None, years=None, year=None, **options):
+    """Normalized cache key for a chart and the filter selection it was built from.
+
+    Charts list countries in data order whatever order they were picked in,
+    so the country selection is keyed as a set.  `options` are any other
+    widget values the chart reads.
+    """
+    if countries is not None:
+        countries = tuple(sorted(countries))
+    if years is not None:
+        years = (int(years[0]), int(years[1]))
+    if year is not None:
+        year = int(year)
+    if options:
+        return (version, chart_id, countries, years, year, tuple(sorted(options.items())))
+    return (version, chart_id, countries, years, year)
+
+
+class FigureCache:
+    """Process-wide LRU cache of serialized Plotly figures with a memory cap.
+
+    Figures are stored as their JSON payload, which is immutable and can be
+    handed to any session.  Entries are evicted least-recently-used first
+    once the payloads add up to more than `max_bytes`.  A miss is looked up
+    in `store` (a dashboard.figstore.FigureStore of pre-rendered figures)
+    before the figure is built.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, store=None):
+        self.max_bytes = max_bytes
+        self.store = store
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.loaded = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def items(self):
+        """(key, payload) of every entry, least recently used first."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def available(self, key):
+        """Whether payload() would find `key` without building."""
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self.store is not None and key in self.store
+
+    def get(self, key):
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key, payload):
+        size = len(payload)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= len(old)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = payload
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= len(evicted)
+
+    def payload(self, key, build):
+        """JSON payload for `key`, calling ``build()`` for the figure on a miss."""
+        payload = self.get(key)
+        if payload is None and self.store is not None:
+            payload = self.store.get(key)
+            if payload is not None:
+                self.loaded += 1
+                profiling.mark('static')
+                self.put(key, payload)
+                return payload
+        if payload is None:
+            import plotly.io as pio
+
+            self.misses += 1
+            profiling.mark('built')
+            fig = build()
+            with profiling.phase('encode'):
+                payload = pio.to_json(fig, validate=False)
+            self.put(key, payload)
+        else:
+            self.hits += 1
+            profiling.mark('cache')
+        return payload
+
+    def figure(self, key, build):
+        """Figure for `key`, decoded from the cached payload without re-validation."""
+        import plotly.graph_objects as go
+
+        payload = self.payload(key, build)
+        with profiling.phase('decode'):
+            return go.Figure(json.loads(payload), _validate=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+figure_cache = FigureCache(store=static_store())
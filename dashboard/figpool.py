@@ -0,0 +1,110 @@
+"""Figure construction in a pool of worker processes.
+
+A page whose figures are missing from every cache can have them built side
+by side instead of one after the other on the interpreter running the
+page.  A job is data: the dataset's path and the page's columns, the data
+version the page saw, a module-level builder and its keyword arguments.
+The worker opens the same source (once per process, like the app does),
+calls ``build(query, **params)`` and returns the figure as the JSON
+payload the figure cache stores, so a figure built here is exactly the
+one the page would have built itself.  A worker that sees another version
+of the data returns nothing and the page builds the figure as usual.
+
+DASHBOARD_FIGURE_WORKERS sets the pool size; 0 (the default) builds every
+figure on the page's own interpreter.
+"""
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from dashboard.figcache import figure_cache
+
+WORKERS = int(os.environ.get('DASHBOARD_FIGURE_WORKERS', 0))
+
+_lock = threading.Lock()
+_executor = None
+
+
+def _pool():
+    global _executor
+    with _lock:
+        if _executor is None and WORKERS > 0:
+            # The app runs threads, which fork would copy mid-flight
+            _executor = ProcessPoolExecutor(max_workers=WORKERS, mp_context=mp.get_context('spawn'))
+        return _executor
+
+
+def _discard(executor):
+    global _executor
+    if executor is None:
+        return
+    with _lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def build_payload(path, columns, version, years, year, build, params):
+    """JSON payload of ``build(query, **params)`` on the source at `path`, None if its version moved on."""
+    import plotly.io as pio
+
+    from dashboard.sources import open_source
+
+    query = open_source(path).query(columns)
+    if query.data_version(years, year) != version:
+        return None
+    return pio.to_json(build(query, **params), validate=False)
+
+
+def submit(key, path, columns, version, years, year, build, params):
+    """Build the figure for cache `key` on a worker; a Future of its payload, or None without a pool.
+
+    The payload is stored in the figure cache as soon as it arrives, also
+    when nobody waits for it any more.
+    """
+    executor = _pool()
+    if executor is None:
+        return None
+    try:
+        future = executor.submit(build_payload, path, columns, version, years, year, build, params)
+    except BrokenProcessPool:
+        _discard(executor)
+        return None
+    future.add_done_callback(lambda done: _store(key, done))
+    return future
+
+
+def _store(key, future):
+    if future.cancelled() or future.exception() is not None:
+        return
+    payload = future.result()
+    if payload is not None:
+        figure_cache.put(key, payload)
+
+
+def collect(key, future):
+    """Wait for `future` from submit() and make sure its payload is in the figure cache.
+
+    A failed job is left to the page, which builds the figure itself and
+    raises the error there.
+    """
+    if future is None:
+        return
+    try:
+        future.result()
+    except BrokenProcessPool:
+        _discard(_executor)
+        return
+    except Exception:
+        return
+    _store(key, future)
+
+
+def shutdown():
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,138 @@
+"""Content-addressed store of pre-rendered figure payloads on disk.
+
+dashboard.export renders the charts of every page for the common filter
+states and writes their JSON payloads here.  A payload is stored once,
+under the SHA-256 of its bytes (objects/ab/cdef....json); index.json maps
+each figure cache key (see dashboard.figcache.figure_key, which holds the
+data version) to the digest of its payload, so states that draw the same
+figure share a file.
+
+Besides the data, a figure depends on the dashboard's code, the Plotly
+version and a few settings (SETTINGS).  The store records a fingerprint of
+them, and the app ignores a store written under another fingerprint.
+
+DASHBOARD_STATIC_DIR points the app at a store; the figure cache serves
+its payloads before building anything.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import warnings
+
+STATIC_DIR = os.environ.get('DASHBOARD_STATIC_DIR') or None
+# Environment variables that change how figures come out
+SETTINGS = ('DASHBOARD_BASE_YEAR', 'DASHBOARD_CONTENT_WIDTH', 'DASHBOARD_OUT_OF_RANGE', 'DASHBOARD_WEBGL_POINTS')
+INDEX = 'index.json'
+
+
+def fingerprint():
+    """Digest of the dashboard's sources, the Plotly version and SETTINGS."""
+    import plotly
+
+    h = hashlib.sha256()
+    package = os.path.dirname(os.path.abspath(__file__))
+    for dirpath, dirnames, filenames in os.walk(package):
+        dirnames[:] = sorted(d for d in dirnames if d != '__pycache__')
+        for name in sorted(filenames):
+            if name.endswith('.py'):
+                path = os.path.join(dirpath, name)
+                h.update(os.path.relpath(path, package).encode())
+                with open(path, 'rb') as f:
+                    h.update(f.read())
+    h.update(f'plotly {plotly.__version__}\n'.encode())
+    for name in SETTINGS:
+        h.update(f'{name}={os.environ.get(name, "")}\n'.encode())
+    return h.hexdigest()
+
+
+def key_digest(key):
+    return hashlib.sha256(json.dumps(key, ensure_ascii=False).encode()).hexdigest()
+
+
+def _write_atomic(path, data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class FigureStore:
+    """Payloads under `root`, looked up by figure cache key."""
+
+    def __init__(self, root, fingerprint, index=None):
+        self.root = root
+        self.fingerprint = fingerprint
+        self._index = index if index is not None else {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, root, fingerprint):
+        """The store at `root`, empty if it does not exist or was written under another fingerprint."""
+        try:
+            with open(os.path.join(root, INDEX), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return cls(root, fingerprint)
+        if manifest['fingerprint'] != fingerprint:
+            return cls(root, fingerprint)
+        return cls(root, fingerprint, manifest['figures'])
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key_digest(key) in self._index
+
+    def _object(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest[2:] + '.json')
+
+    def get(self, key):
+        """The payload stored for `key`, or None."""
+        digest = self._index.get(key_digest(key))
+        if digest is None:
+            return None
+        with open(self._object(digest), encoding='utf-8') as f:
+            return f.read()
+
+    def put(self, key, payload):
+        data = payload.encode()
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _write_atomic(path, data)
+        with self._lock:
+            self._index[key_digest(key)] = digest
+
+    def objects(self):
+        """Digests of the distinct payloads the index refers to."""
+        with self._lock:
+            return set(self._index.values())
+
+    def nbytes(self):
+        return sum(os.path.getsize(self._object(digest)) for digest in self.objects())
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        with self._lock:
+            manifest = {'fingerprint': self.fingerprint, 'figures': self._index}
+            data = json.dumps(manifest, sort_keys=True).encode()
+        _write_atomic(os.path.join(self.root, INDEX), data)
+
+
+def static_store():
+    """The store at DASHBOARD_STATIC_DIR, or None if unset, missing or stale."""
+    if STATIC_DIR is None:
+        return None
+    store = FigureStore.open(STATIC_DIR, fingerprint())
+    if not len(store):
+        warnings.warn(f'{STATIC_DIR} holds no figures for this version of the dashboard; '
+                      'run python -m dashboard.export again')
+        return None
+    return store
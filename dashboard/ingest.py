@@ -0,0 +1,113 @@
+"""Convert the country-comparison CSV into a columnar Parquet snapshot.
+
+Usage: python -m dashboard.ingest [CSV] [-o SNAPSHOT] [--shared | --partitioned | --append DATASET]
+
+The snapshot keeps the typed schema (category country, int16 year, float32
+indicators) in its metadata, so loading it skips CSV parsing entirely.
+dashboard.loader picks it up automatically when it sits next to the CSV.
+Every mode reads the CSV through dashboard.clean and prints what cleaning
+changed.
+
+With --shared an uncompressed Arrow file is published instead, for
+deployments running several Streamlit workers on one node: each worker
+memory-maps it rather than holding its own copy of the data (see
+dashboard.loader.read_shared).  Set DASHBOARD_SHARED_DIR=/dev/shm to keep
+it in RAM; workers must see the same value.
+
+With --partitioned the CSV is streamed into a directory of memory-mapped
+fragments for datasets larger than RAM (see dashboard.partitioned), and
+--append adds the rows of a CSV holding new years to such a directory
+without rewriting the years it already has.
+"""
+import argparse
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dashboard.clean import Report, read_frame
+from dashboard.loader import file_digest, shared_path, snapshot_path
+from dashboard.schema import COLUMNS, COUNTRY, YEAR
+
+
+def _typed_frame(csv_path, report=None):
+    # read_frame checks that every column is there
+    return read_frame(csv_path, report=report)[COLUMNS]
+
+
+def _write_atomic(out, write):
+    # Write next to the target and rename so readers never see a partial file
+    tmp = out + '.tmp'
+    write(tmp)
+    os.replace(tmp, out)
+    return out
+
+
+def write_snapshot(csv_path, out=None, report=None):
+    out = out or snapshot_path(os.path.abspath(csv_path))
+    table = pa.Table.from_pandas(_typed_frame(csv_path, report), preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b'source_sha256'] = file_digest(csv_path).encode()
+    table = table.replace_schema_metadata(metadata)
+    return _write_atomic(out, lambda tmp: pq.write_table(table, tmp, compression='zstd'))
+
+
+def write_shared(csv_path, out=None, report=None):
+    """Publish the typed columns of `csv_path` as an Arrow file workers can map zero-copy.
+
+    Rows are ordered by year, then country, so the per-year tables of the
+    year cube are plain slices of the mapped columns.  Missing values stay
+    NaN rather than Arrow nulls: a column without a validity bitmap is what
+    lets pandas use the mapped buffer as is.
+    """
+    out = out or shared_path(os.path.abspath(csv_path))
+    df = _typed_frame(csv_path, report)
+    codes = df[COUNTRY].cat.codes.to_numpy()
+    df = df.iloc[np.lexsort((codes, df[YEAR].to_numpy()))]
+    arrays = {}
+    for col in COLUMNS:
+        values = df[col]
+        if col == COUNTRY:
+            arrays[col] = pa.DictionaryArray.from_arrays(
+                pa.array(values.cat.codes.to_numpy()), pa.array(values.cat.categories.to_numpy()))
+        else:
+            arrays[col] = pa.array(values.to_numpy(), from_pandas=False)
+    table = pa.table(arrays, metadata={b'source_sha256': file_digest(csv_path).encode()})
+
+    def write(tmp):
+        with pa.OSFile(tmp, 'wb') as f, pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    return _write_atomic(out, write)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('csv', nargs='?', default='country_comparison_large_dataset_vn.csv')
+    parser.add_argument('-o', '--output', help='output path (default: derived from the CSV path)')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--shared', action='store_true', help='publish a memory-mappable Arrow file for multi-worker deployments')
+    mode.add_argument('--partitioned', action='store_true', help='write an out-of-core dataset partitioned by year and country')
+    mode.add_argument('--append', metavar='DATASET', help='add the new years in CSV to a partitioned dataset')
+    args = parser.parse_args()
+    report = Report()
+    if args.append:
+        from dashboard.partitioned import append_partitioned
+
+        years = append_partitioned(args.csv, args.append, report=report)
+        print(f'appended {", ".join(map(str, years))} to {args.append}')
+        print(report)
+        return
+    if args.partitioned:
+        from dashboard.partitioned import write_partitioned as write
+    else:
+        write = write_shared if args.shared else write_snapshot
+    out = write(args.csv, args.output, report=report)
+    print(f'wrote {out}')
+    print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+import hashlib
+import importlib.util
+import os
+import threading
+
+import pandas as pd
+
+from dashboard.clean import read_frame
+from dashboard.schema import COLUMNS, COUNTRY, YEAR
+
+# Snapshots are optional, the CSV is always readable.  pyarrow is imported
+# only once a snapshot or shared file is actually read.
+HAVE_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# Sessions share one parsed frame per file.  Writes on a shared frame must
+# never leak into other sessions, so copy-on-write is required (default
+# from pandas 3 onwards).
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+SNAPSHOT_SUFFIX = '.parquet'
+# Uncompressed Arrow IPC file that worker processes memory-map (see read_shared)
+SHARED_SUFFIX = '.arrow'
+# Publish shared files here instead of next to the CSV, e.g. /dev/shm
+SHARED_DIR = os.environ.get('DASHBOARD_SHARED_DIR')
+KEY_COLUMNS = [COUNTRY, YEAR]
+
+_lock = threading.Lock()
+# resolved source path -> _Entry
+_cache = {}
+# shared file or snapshot path -> ((its stat key, the CSV's stat key), written from that CSV)
+_origins = {}
+
+
+class _Entry:
+    def __init__(self, key, digest, frame):
+        self.key = key
+        self.digest = digest
+        self.frame = frame
+        # Artifacts built from this version of the data, see derive()
+        self.derived = {}
+        self.lock = threading.Lock()
+
+
+def _stat_key(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def file_digest(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def snapshot_path(path):
+    return os.path.splitext(path)[0] + SNAPSHOT_SUFFIX
+
+
+def shared_path(path):
+    base = os.path.splitext(path)[0] + SHARED_SUFFIX
+    if SHARED_DIR:
+        return os.path.join(SHARED_DIR, os.path.basename(base))
+    return base
+
+
+def resolve_source(path):
+    """Pick the shared file or columnar snapshot for `path` if one exists and was written from the CSV.
+
+    It must not be older than the CSV and its ``source_sha256`` must match
+    the CSV's content: an mtime tie, or a CSV copied in with an older
+    mtime, does not prove that the CSV is unchanged.  A shared file wins
+    over a snapshot: it is attached without reading anything, where a
+    snapshot still has to be decoded.
+    """
+    path = os.path.abspath(path)
+    if HAVE_PYARROW:
+        for candidate in (shared_path(path), snapshot_path(path)):
+            if not os.path.exists(candidate):
+                continue
+            if candidate == path or not os.path.exists(path):
+                return candidate
+            if _stat_key(candidate)[0] >= _stat_key(path)[0] and _written_from(candidate, path):
+                return candidate
+    return path
+
+
+def _written_from(candidate, path):
+    """Whether the shared file or snapshot `candidate` holds the current content of the CSV `path`.
+
+    Hashing the CSV is done once per version of the two files.
+    """
+    key = (_stat_key(candidate), _stat_key(path))
+    cached = _origins.get(candidate)
+    if cached is None or cached[0] != key:
+        cached = _origins[candidate] = (key, _source_digest(candidate) == file_digest(path))
+    return cached[1]
+
+
+def _source_digest(candidate):
+    """``source_sha256`` dashboard.ingest stored in `candidate`, or None."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if is_shared(candidate):
+        with pa.memory_map(candidate) as f:
+            metadata = pa.ipc.open_file(f).schema.metadata
+    else:
+        metadata = pq.read_schema(candidate).metadata
+    digest = (metadata or {}).get(b'source_sha256')
+    return digest.decode() if digest is not None else None
+
+
+def is_snapshot(path):
+    return path.endswith(SNAPSHOT_SUFFIX)
+
+
+def is_shared(path):
+    return path.endswith(SHARED_SUFFIX)
+
+
+def parse_csv(path, columns=None):
+    """The CSV at `path` typed and cleaned chunk by chunk (see dashboard.clean).
+
+    Countries are categorical in file order rather than alphabetical order.
+    """
+    return read_frame(path, columns)
+
+
+def read_snapshot(path, columns=None):
+    import pyarrow.parquet as pq
+
+    return pq.read_table(path, columns=columns).to_pandas()
+
+
+def read_shared(path, columns=None):
+    """Frame over a memory-mapped shared file, without copying the columns.
+
+    Numeric columns are stored without a validity bitmap (missing values
+    are NaN), so pandas wraps the mapped buffers directly; only the country
+    dictionary is materialised.  Every process attaching the same file
+    shares its pages through the OS page cache.  The buffers are read-only,
+    which copy-on-write makes safe: a write copies the column first.
+    """
+    import pyarrow as pa
+
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas(split_blocks=True)
+
+
+def _read(source, columns):
+    if is_shared(source):
+        # Attaching costs nothing per column, so map them all at once
+        return read_shared(source)
+    if is_snapshot(source):
+        return read_snapshot(source, columns)
+    # A CSV has to be tokenised in full anyway, so parse every column once
+    return parse_csv(source)
+
+
+def _projection(columns):
+    if columns is None:
+        return None
+    wanted = KEY_COLUMNS + [c for c in columns if c not in KEY_COLUMNS]
+    unknown = [c for c in wanted if c not in COLUMNS]
+    if unknown:
+        raise KeyError(f'Unknown columns: {unknown}')
+    return wanted
+
+
+def load_dataset(path, columns=None):
+    """Return the typed dataset at `path`, parsed at most once per process.
+
+    A shared file or columnar snapshot of the CSV (see dashboard.ingest) is
+    preferred when present.  `columns` projects the frame onto the given indicators
+    (the country and year keys are always included); with a snapshot only
+    columns not read before are fetched from disk.
+
+    The cache is keyed on the source file's mtime and content hash: an
+    unchanged mtime is served straight from memory, a changed mtime re-hashes
+    the file and only re-reads when the content actually differs.  Every
+    caller gets a copy-on-write view of the shared frame, so nothing is
+    duplicated and any write stays local to the caller.
+    """
+    source = resolve_source(path)
+    wanted = _projection(columns)
+    key = _stat_key(source)
+    entry = _cache.get(source)
+    missing = _missing(entry, wanted)
+    if entry is None or entry.key != key or missing:
+        with _lock:
+            entry = _cache.get(source)
+            if entry is None or entry.key != key:
+                digest = file_digest(source)
+                if entry is not None and entry.digest == digest:
+                    previous, entry = entry, _Entry(key, digest, entry.frame)
+                    entry.derived = previous.derived
+                else:
+                    entry = _Entry(key, digest, _read(source, wanted))
+                _cache[source] = entry
+            missing = _missing(entry, wanted)
+            if missing:
+                extra = _read(source, missing)
+                entry.frame = pd.concat([entry.frame, extra], axis=1)
+    return entry.frame[wanted if wanted is not None else COLUMNS]
+
+
+def read_source(path, columns=None):
+    """The typed dataset at `path`, read afresh instead of through load_dataset's cache.
+
+    For representations that replace the frame (see dashboard.series) and
+    must not keep it alive.
+    """
+    return _read(resolve_source(path), _projection(columns))
+
+
+def _missing(entry, wanted):
+    if entry is None:
+        return []
+    if wanted is None:
+        wanted = COLUMNS
+    return [c for c in wanted if c not in entry.frame.columns]
+
+
+def derive(path, name, build, columns=None):
+    """Return ``build(frame)`` computed once per version of the dataset at `path`.
+
+    `frame` is ``load_dataset(path, columns)``.  The result is cached next to
+    the parsed data and dropped together with it when the file changes.
+    """
+    frame = load_dataset(path, columns)
+    entry = _cache[resolve_source(path)]
+    key = (name, tuple(columns) if columns is not None else None)
+    if key not in entry.derived:
+        with entry.lock:
+            if key not in entry.derived:
+                entry.derived[key] = build(frame)
+    return entry.derived[key]
+
+
+def dataset_version(path):
+    """Content hash of the data currently served for `path`."""
+    load_dataset(path, [])
+    return _cache[resolve_source(path)].digest
+
+
+def dataset_shape(path):
+    """(rows, columns) of the full dataset, without loading every column of a snapshot."""
+    if os.path.isdir(path):
+        from dashboard.partitioned import PartitionedDataset
+
+        return PartitionedDataset.open(path).shape
+    source = resolve_source(path)
+    if is_shared(source):
+        return read_shared(source).shape
+    if is_snapshot(source):
+        import pyarrow.parquet as pq
+
+        meta = pq.read_metadata(source)
+        return meta.num_rows, meta.num_columns
+    return load_dataset(path).shape
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
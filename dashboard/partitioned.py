@@ -0,0 +1,318 @@
+"""Out-of-core backend: the dataset as memory-mapped Arrow files partitioned by year and country.
+
+A partitioned dataset is a directory holding a ``manifest.json`` and one
+uncompressed Arrow IPC file per fragment.  Every fragment holds the rows of
+one year for one block of countries (countries are numbered in order of
+first appearance and stored as those codes), so a selection only opens the
+fragments whose year and code range can match - predicate pushdown on
+'Quốc gia' and 'Năm' - and of those only maps the columns a page asked for.
+Nothing is read up front: the manifest is all that is loaded, and peak
+memory follows the size of the slice being viewed, not of the dataset.
+
+Point DASHBOARD_DATA at the directory to run the dashboard on it;
+dashboard.query.load_query returns a ScanQuery over it, which answers
+the same calls as DatasetQuery.
+
+Usage: python -m dashboard.ingest CSV --partitioned [-o DIR]
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from dashboard.schema import COLUMNS, COUNTRY, DTYPES, INDICATORS, YEAR
+
+MANIFEST = 'manifest.json'
+PARTITIONED_SUFFIX = '.parts'
+# Countries per fragment; with the year this bounds how much one selection maps
+BLOCK_COUNTRIES = 256
+# CSV rows parsed at a time while writing; each chunk adds at most one fragment per partition
+CHUNK_ROWS = 1_000_000
+
+# Per-year tables (all countries, some columns) kept across manifest versions
+YEAR_TABLES = 64
+
+_lock = threading.Lock()
+# manifest path -> (mtime and size, PartitionedDataset)
+_datasets = {}
+# (dataset path, year version, columns) -> {column: values}, least recently used first
+_year_tables = OrderedDict()
+
+
+def partitioned_path(path):
+    return os.path.splitext(os.path.abspath(path))[0] + PARTITIONED_SUFFIX
+
+
+def _write_fragments(chunk, codes, directory, tag, block):
+    """Write the rows of `chunk` as one fragment per (year, country block) under `directory`.
+
+    `codes` maps country names to codes and gains the countries seen for
+    the first time.  Returns the manifest entries of the new fragments.
+    """
+    import pyarrow as pa
+
+    names = chunk[COUNTRY]
+    for name in pd.unique(names.dropna()):
+        codes.setdefault(name, len(codes))
+    lookup = np.array([codes.get(name, -1) for name in names.cat.categories] + [-1], dtype=np.int32)
+    # Missing countries have category code -1, which picks the trailing -1
+    code = lookup[names.cat.codes.to_numpy()]
+    year = chunk[YEAR].to_numpy()
+    valid = np.flatnonzero(code >= 0)
+    order = valid[np.lexsort((code[valid], code[valid] // block, year[valid]))]
+    code, year = code[order], year[order]
+    values = {c: chunk[c].to_numpy()[order] for c in INDICATORS}
+    partition = year.astype(np.int64) * (len(codes) // block + 1) + code // block
+    bounds = np.r_[0, np.flatnonzero(np.diff(partition)) + 1, len(order)]
+    fragments = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if stop == start:
+            continue
+        name = f'year={year[start]}/block={code[start] // block:05d}/part-{tag}.arrow'
+        batch = pa.record_batch(
+            [pa.array(code[start:stop]), pa.array(year[start:stop])]
+            + [pa.array(values[c][start:stop], from_pandas=False) for c in INDICATORS],
+            names=COLUMNS)
+        os.makedirs(os.path.dirname(os.path.join(directory, name)), exist_ok=True)
+        with pa.OSFile(os.path.join(directory, name), 'wb') as f, pa.ipc.new_file(f, batch.schema) as writer:
+            writer.write_batch(batch)
+        fragments.append({'file': name, 'year': int(year[start]), 'rows': int(stop - start),
+                          'codes': [int(code[start]), int(code[stop - 1])]})
+    return fragments
+
+
+def _write_manifest(directory, manifest):
+    # Replace atomically: a reader sees the old or the new manifest, never a partial one
+    tmp = os.path.join(directory, MANIFEST + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp, os.path.join(directory, MANIFEST))
+
+
+def write_partitioned(csv_path, out=None, block=BLOCK_COUNTRIES, chunk_rows=CHUNK_ROWS, report=None):
+    """Split the CSV at `csv_path` into a partitioned dataset, streaming it chunk by chunk.
+
+    The CSV never has to fit in memory; every chunk is typed and cleaned on
+    the way (see dashboard.clean, which tallies into `report`).  Missing
+    values are stored as NaN without a validity bitmap, so fragment columns
+    map zero-copy.  The directory is built next to `out` and swapped in once
+    complete.
+    """
+    from dashboard.clean import stream
+    from dashboard.loader import file_digest
+
+    out = os.path.abspath(out or partitioned_path(csv_path))
+    tmp = out + '.tmp'
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    digest = file_digest(csv_path)
+    codes = {}
+    fragments = []
+    for chunk_no, chunk in enumerate(stream(csv_path, chunk_rows=chunk_rows, report=report)):
+        fragments += _write_fragments(chunk, codes, tmp, f'{digest[:12]}-{chunk_no:05d}', block)
+
+    _write_manifest(tmp, {
+        'columns': COLUMNS,
+        'countries': list(codes),
+        'rows': sum(fragment['rows'] for fragment in fragments),
+        'source_sha256': digest,
+        'appends': [],
+        'fragments': fragments,
+    })
+    # Swap the finished directory in; readers keep the old one until they reopen
+    old = out + '.old'
+    shutil.rmtree(old, ignore_errors=True)
+    if os.path.exists(out):
+        os.replace(out, old)
+    os.replace(tmp, out)
+    shutil.rmtree(old, ignore_errors=True)
+    return out
+
+
+def append_partitioned(csv_path, path, block=BLOCK_COUNTRIES, report=None):
+    """Add the rows of the CSV at `csv_path` (new years) to the partitioned dataset at `path`.
+
+    The rows must have exactly the dataset's columns, a country and a year
+    each, no duplicate (country, year) pairs, and only years the dataset
+    does not have yet; values are cleaned as dashboard.clean does.  They are written as new fragments next to the
+    existing ones, which are never rewritten, and become visible when the
+    manifest is replaced.  Running readers pick the new manifest up on
+    their next query.  Returns the years added.
+    """
+    from dashboard.clean import Report, read_frame
+    from dashboard.loader import file_digest
+
+    path = os.path.abspath(path)
+    with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+    report = report if report is not None else Report()
+    df = read_frame(csv_path, report=report)
+    unexpected = [c for c in df.columns if c not in manifest['columns']]
+    if unexpected:
+        raise ValueError(f'{csv_path} does not match the dataset columns: unexpected {unexpected}')
+    if report.dropped:
+        raise ValueError(f'{csv_path} has {report.dropped} rows without a country or a whole year')
+    duplicated = df[df.duplicated([COUNTRY, YEAR])]
+    if len(duplicated):
+        raise ValueError(f'{csv_path} repeats (country, year) pairs: {duplicated[[COUNTRY, YEAR]].values.tolist()[:5]}')
+    years = sorted(int(y) for y in df[YEAR].unique())
+    present = sorted({fragment['year'] for fragment in manifest['fragments']} & set(years))
+    if present:
+        raise ValueError(f'{csv_path} has years already in the dataset: {present}')
+
+    digest = file_digest(csv_path)
+    codes = {name: code for code, name in enumerate(manifest['countries'])}
+    fragments = _write_fragments(df[manifest['columns']], codes, path, f'{digest[:12]}-00000', block)
+    manifest['countries'] = list(codes)
+    manifest['rows'] += sum(fragment['rows'] for fragment in fragments)
+    manifest['fragments'] += fragments
+    manifest.setdefault('appends', []).append({'source_sha256': digest, 'years': years, 'rows': len(df)})
+    _write_manifest(path, manifest)
+    return years
+
+
+class PartitionedDataset:
+    """The manifest of a partitioned dataset, and scans over its fragments."""
+
+    def __init__(self, path, manifest, version):
+        self.path = path
+        self.version = version
+        self.columns = manifest['columns']
+        self.countries = manifest['countries']
+        self.rows = manifest['rows']
+        self._codes = {name: code for code, name in enumerate(self.countries)}
+        fragments = manifest['fragments']
+        self._files = [os.path.join(path, fragment['file']) for fragment in fragments]
+        self._years = np.array([fragment['year'] for fragment in fragments], dtype=np.int64)
+        self._code_ranges = np.array([fragment['codes'] for fragment in fragments], dtype=np.int64).reshape(-1, 2)
+        # A year's rows are identified by the names of its fragments, which are never rewritten
+        files = {}
+        for fragment in fragments:
+            files.setdefault(fragment['year'], []).append(fragment['file'])
+        self._year_versions = {year: hashlib.sha256('\n'.join(sorted(names)).encode()).hexdigest()
+                               for year, names in files.items()}
+        if len(fragments):
+            self.year_bounds = (int(self._years.min()), int(self._years.max()))
+        else:
+            self.year_bounds = (0, 0)
+
+    @classmethod
+    def open(cls, path):
+        """The dataset at `path`, opened once per version of its manifest."""
+        path = os.path.abspath(path)
+        manifest_path = os.path.join(path, MANIFEST)
+        st = os.stat(manifest_path)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _datasets.get(manifest_path)
+        if cached is None or cached[0] != key:
+            with _lock:
+                cached = _datasets.get(manifest_path)
+                if cached is None or cached[0] != key:
+                    with open(manifest_path, 'rb') as f:
+                        raw = f.read()
+                    dataset = cls(path, json.loads(raw), hashlib.sha256(raw).hexdigest())
+                    cached = _datasets[manifest_path] = (key, dataset)
+        return cached[1]
+
+    @property
+    def shape(self):
+        return self.rows, len(self.columns)
+
+    def scan(self, countries=None, years=None, columns=None):
+        """Rows for `countries` (all if None) within the inclusive `years` range.
+
+        Only fragments that can hold matching rows are opened, and of those
+        only the key columns and `columns` (every indicator if None) are
+        touched.  Rows come out grouped by country in data order, years
+        ascending, with the dtypes of dashboard.loader.load_dataset.  Single
+        years are served from per-year tables cached until that year's
+        fragments change.
+        """
+        columns = INDICATORS if columns is None else [c for c in columns if c not in (COUNTRY, YEAR)]
+        unknown = [c for c in columns if c not in self.columns]
+        if unknown:
+            raise KeyError(f'Unknown columns: {unknown}')
+        names = [COUNTRY, YEAR] + columns
+        lo, hi = self.year_bounds
+        if years is not None:
+            lo, hi = max(lo, years[0]), min(hi, years[1])
+        selected = (self._years >= lo) & (self._years <= hi)
+        wanted = None
+        if countries is not None:
+            wanted = np.zeros(len(self.countries), dtype=bool)
+            wanted[[self._codes[c] for c in countries if c in self._codes]] = True
+            # A fragment matches when any wanted code falls in its range
+            hits = np.r_[0, np.cumsum(wanted)]
+            selected &= hits[self._code_ranges[:, 1] + 1] > hits[self._code_ranges[:, 0]]
+
+        if lo == hi and lo in self._year_versions:
+            # One year: gather all its countries once, then pick the wanted ones
+            data = self._year_table(lo, names)
+            if wanted is not None:
+                rows = wanted[data[COUNTRY]]
+                data = {c: values[rows] for c, values in data.items()}
+        else:
+            data = self._gather(np.flatnonzero(selected), wanted, names)
+        return pd.DataFrame({**data, COUNTRY: pd.Categorical.from_codes(data[COUNTRY], categories=self.countries)},
+                            columns=names)
+
+    def data_version(self, years=None, year=None):
+        """Version of the rows within the `years` range and the single `year` (all rows if neither).
+
+        It only changes when fragments of those years change, so anything
+        built from other years stays valid across an append.
+        """
+        if years is None and year is None:
+            return self.version
+        wanted = set(range(years[0], years[1] + 1)) if years is not None else set()
+        if year is not None:
+            wanted.add(year)
+        parts = [f'{y}:{self._year_versions[y]}' for y in sorted(wanted) if y in self._year_versions]
+        return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+    def _year_table(self, year, names):
+        key = (self.path, self._year_versions[year], tuple(names))
+        with _lock:
+            data = _year_tables.get(key)
+            if data is not None:
+                _year_tables.move_to_end(key)
+                return data
+        data = self._gather(np.flatnonzero(self._years == year), None, names)
+        with _lock:
+            _year_tables[key] = data
+            while len(_year_tables) > YEAR_TABLES:
+                _year_tables.popitem(last=False)
+        return data
+
+    def _gather(self, fragments, wanted, names):
+        """{column: values} of the `wanted` rows (all if None) of `fragments`, by country code then year."""
+        import pyarrow as pa
+
+        parts = {c: [] for c in names}
+        for i in fragments:
+            reader = pa.ipc.open_file(pa.memory_map(self._files[i]))
+            for b in range(reader.num_record_batches):
+                batch = reader.get_batch(b)
+                rows = slice(None) if wanted is None else wanted[batch.column(COUNTRY).to_numpy()]
+                for c in names:
+                    parts[c].append(batch.column(c).to_numpy()[rows])
+
+        dtypes = {COUNTRY: np.int32, YEAR: DTYPES[YEAR]}
+        # Concatenating copies the rows out of the mapped files
+        data = {c: np.concatenate(parts[c]) if parts[c] else np.empty(0, dtype=dtypes.get(c, DTYPES.get(c)))
+                for c in names}
+        order = np.lexsort((data[YEAR], data[COUNTRY]))
+        if not np.array_equal(order, np.arange(len(order))):
+            data = {c: values[order] for c, values in data.items()}
+        return data
+
+
+def load_partitioned_query(path, columns=None):
+    from dashboard.query import ScanQuery
+
+    return ScanQuery(PartitionedDataset.open(path), columns)
@@ -0,0 +1,239 @@
+"""Opt-in timing of the chart sections of a page run.
+
+With DASHBOARD_PROFILE=1 every chart section of a rerun, from its
+cached_chart() call to the end of its st.plotly_chart, is timed and split
+into phases:
+
+* select: filtering the dataset (the query's select and long_form),
+* px: building the figure with plotly.express,
+* layout: the page's update_layout, update_traces and axis updates,
+* encode, decode: the figure cache's JSON round trip,
+* serialize: st.plotly_chart turning the figure into the message for the browser,
+
+together with the size of that message.  Only the outermost phase counts
+(px's own layout updates are px), and time in no phase, the page's own
+reshaping for instance, is reported as other.  The last run is shown in a
+sidebar overlay; DASHBOARD_PROFILE_LOG=path appends one JSON line per
+section to a file instead of, or with, the overlay.
+
+Disabled, nothing is patched: the hooks in the figure cache and the
+section runtime look up a thread-local and return.
+"""
+import contextlib
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+
+OVERLAY = os.environ.get('DASHBOARD_PROFILE', '') not in ('', '0')
+LOG_PATH = os.environ.get('DASHBOARD_PROFILE_LOG') or None
+ENABLED = OVERLAY or LOG_PATH is not None
+
+PHASES = ('select', 'px', 'layout', 'encode', 'decode', 'serialize')
+# What install() wraps, and in which phase
+PX_FUNCTIONS = ('area', 'bar', 'box', 'histogram', 'imshow', 'line', 'pie', 'scatter')
+LAYOUT_METHODS = ('update_layout', 'update_traces', 'update_xaxes', 'update_yaxes', 'add_hline')
+QUERY_METHODS = ('select', 'long_form')
+
+_local = threading.local()
+_lock = threading.Lock()
+_installed = False
+_NO_PHASE = contextlib.nullcontext()
+
+
+class Section:
+    """Timings of one chart section; phases in milliseconds."""
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.ms = None
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.bytes = 0
+        # 'memo' (this session's previous render), 'cache' (another session's),
+        # 'static' (pre-rendered, see dashboard.figstore) or 'built'
+        self.source = None
+
+    def record(self):
+        record = {'section': self.name, 'ms': round(self.ms, 3)}
+        record.update({f'{p}_ms': round(ms, 3) for p, ms in self.phases.items()})
+        record['other_ms'] = round(self.ms - sum(self.phases.values()), 3)
+        record['bytes'] = self.bytes
+        record['source'] = self.source
+        return record
+
+
+class Run:
+    """The sections of one rerun of a page, in render order."""
+
+    def __init__(self, page):
+        self.page = page
+        self.time = datetime.datetime.now().isoformat(timespec='milliseconds')
+        self.started = time.perf_counter()
+        self.ms = None
+        self.sections = []
+        # The open section and its open phase
+        self.section = None
+        self.phase = None
+
+    def open(self, name):
+        self.close()
+        self.section = Section(name)
+        self.sections.append(self.section)
+
+    def close(self):
+        if self.section is not None:
+            self.section.ms = (time.perf_counter() - self.section.started) * 1000
+            self.section = self.phase = None
+
+    def records(self):
+        """One dict per section, with the page and the time of the whole run."""
+        head = {'time': self.time, 'page': self.page, 'run_ms': round(self.ms, 3)}
+        return [dict(head, **section.record()) for section in self.sections]
+
+
+class _Phase:
+    def __init__(self, name):
+        self.name = name
+        self.run = None
+
+    def __enter__(self):
+        run = getattr(_local, 'run', None)
+        if run is not None and run.section is not None and run.phase is None:
+            self.run, self.section = run, run.section
+            run.phase = self.name
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.run is not None:
+            self.section.phases[self.name] += (time.perf_counter() - self.started) * 1000
+            self.run.phase = None
+            self.run = None
+
+
+def phase(name):
+    """Context manager adding the time spent in it to phase `name` of the open section."""
+    return _Phase(name) if ENABLED else _NO_PHASE
+
+
+def section(name):
+    """Start timing chart section `name`; it ends at its st.plotly_chart or the next section."""
+    run = getattr(_local, 'run', None)
+    if run is not None:
+        run.open(name)
+
+
+def mark(source):
+    """Record where the open section's figure came from (see Section.source)."""
+    run = getattr(_local, 'run', None)
+    if run is not None and run.section is not None and run.section.source is None:
+        run.section.source = source
+
+
+def _timed(name, fn):
+    @functools.wraps(fn)
+    def timed(*args, **kwargs):
+        with _Phase(name):
+            return fn(*args, **kwargs)
+    return timed
+
+
+def _sized(to_json):
+    @functools.wraps(to_json)
+    def sized(*args, **kwargs):
+        payload = to_json(*args, **kwargs)
+        run = getattr(_local, 'run', None)
+        if run is not None and run.phase == 'serialize':
+            run.section.bytes += len(payload)
+        return payload
+    return sized
+
+
+def _plotted(plotly_chart):
+    @functools.wraps(plotly_chart)
+    def plotted(*args, **kwargs):
+        with _Phase('serialize'):
+            element = plotly_chart(*args, **kwargs)
+        run = getattr(_local, 'run', None)
+        if run is not None:
+            run.close()
+        return element
+    return plotted
+
+
+def install():
+    """Wrap plotly.express, the figure update methods and st.plotly_chart, once per process."""
+    global _installed
+    with _lock:
+        if _installed:
+            return
+        import plotly.express as px
+        import plotly.graph_objects as go
+        import plotly.io
+        import streamlit as st
+
+        for name in PX_FUNCTIONS:
+            setattr(px, name, _timed('px', getattr(px, name)))
+        for name in LAYOUT_METHODS:
+            setattr(go.Figure, name, _timed('layout', getattr(go.Figure, name)))
+        plotly.io.to_json = _sized(plotly.io.to_json)
+        st.plotly_chart = _plotted(st.plotly_chart)
+        _installed = True
+
+
+class _TimedQuery:
+    """`query` with its filtering methods timed as the select phase."""
+
+    def __init__(self, query):
+        self._query = query
+
+    def __getattr__(self, name):
+        value = getattr(self._query, name)
+        return _timed('select', value) if name in QUERY_METHODS else value
+
+
+def timed_query(query):
+    """`query`, with select and long_form timed when profiling is enabled."""
+    return _TimedQuery(query) if ENABLED else query
+
+
+def start(page):
+    """Begin timing a run of `page` in this thread; None when profiling is disabled."""
+    if not ENABLED:
+        return None
+    install()
+    run = Run(page)
+    _local.run = run
+    return run
+
+
+def finish(run):
+    """End `run`: write it to the log and show it in the sidebar as configured."""
+    if run is None:
+        return
+    run.close()
+    run.ms = (time.perf_counter() - run.started) * 1000
+    _local.run = None
+    if LOG_PATH is not None:
+        lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in run.records())
+        with _lock, open(LOG_PATH, 'a', encoding='utf-8') as f:
+            f.write(lines)
+    if OVERLAY:
+        overlay(run)
+
+
+def overlay(run):
+    """Table of the sections of `run` in the sidebar."""
+    import pandas as pd
+    import streamlit as st
+
+    charts = sum(section.ms for section in run.sections)
+    with st.sidebar.expander('Thời gian dựng trang', expanded=True):
+        st.caption(f'{run.page}: {run.ms:.0f} ms, trong đó {charts:.0f} ms cho {len(run.sections)} biểu đồ')
+        if run.sections:
+            table = pd.DataFrame([section.record() for section in run.sections]).set_index('section')
+            table['KB'] = table.pop('bytes') / 1024
+            st.dataframe(table.round(1), width='stretch')
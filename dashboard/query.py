@@ -0,0 +1,262 @@
+import importlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from dashboard.clean import Validity, valid_rows
+from dashboard.cube import LONG_FORMS, YearCube
+from dashboard.derived import add_derived, base_year, compute, dataset_columns, history, requested
+from dashboard.loader import dataset_shape, dataset_version, derive
+from dashboard.schema import COUNTRY, YEAR
+
+# Query backends: name -> (module, function(path, columns)), imported on first use.
+# Every backend returns an object with the interface of DatasetQuery: countries,
+# year_bounds, shape, path, version, data_version(), select() and long_form(),
+# with the same frames.
+BACKENDS = {
+    'pandas': ('dashboard.query', 'load_pandas_query'),
+    'partitioned': ('dashboard.partitioned', 'load_partitioned_query'),
+    'duckdb': ('dashboard.duckdb_backend', 'load_duckdb_query'),
+    'series': ('dashboard.series', 'load_series_query'),
+}
+BACKEND = os.environ.get('DASHBOARD_BACKEND', 'auto')
+
+
+class CountryYearIndex:
+    """Row positions of the dataset sorted by (country, year).
+
+    Every country owns one contiguous block of the sort order with its years
+    ascending, so a country-set x year-range selection is a couple of binary
+    searches plus a gather of exactly the k matching rows, instead of a full
+    boolean mask over the N rows of the frame.
+    """
+
+    def __init__(self, countries, order, keys, year_bounds):
+        self.countries = countries
+        self.year_bounds = year_bounds
+        self._codes = {name: code for code, name in enumerate(countries)}
+        self._order = order
+        self._keys = keys
+
+    @classmethod
+    def from_frame(cls, df):
+        country = df[COUNTRY]
+        if not isinstance(country.dtype, pd.CategoricalDtype):
+            country = country.astype(pd.CategoricalDtype(pd.unique(country.dropna())))
+        codes = country.cat.codes.to_numpy().astype(np.int64)
+        years = df[YEAR].to_numpy().astype(np.int64)
+        valid = np.flatnonzero(codes >= 0)
+        order = valid[np.lexsort((years[valid], codes[valid]))]
+        if len(order):
+            year_bounds = (int(years[order].min()), int(years[order].max()))
+        else:
+            year_bounds = (0, 0)
+        # Drop categories without rows so codes stay dense
+        used = np.unique(codes[valid])
+        countries = [country.cat.categories[code] for code in used]
+        code_map = np.full(len(country.cat.categories), -1, dtype=np.int64)
+        code_map[used] = np.arange(len(used))
+        keys = cls._key(code_map[codes[order]], years[order], year_bounds)
+        return cls(countries, order, keys, year_bounds)
+
+    @staticmethod
+    def _key(codes, years, year_bounds):
+        span = year_bounds[1] - year_bounds[0] + 1
+        return codes * span + (years - year_bounds[0])
+
+    def positions(self, countries=None, years=None):
+        """Row positions for `countries` (all if None) within the inclusive `years` range."""
+        lo, hi = self.year_bounds
+        if years is not None:
+            lo, hi = max(lo, years[0]), min(hi, years[1])
+        if countries is None:
+            codes = np.arange(len(self.countries), dtype=np.int64)
+        else:
+            codes = np.array(sorted({self._codes[c] for c in countries if c in self._codes}), dtype=np.int64)
+        if lo > hi or not len(codes):
+            return np.empty(0, dtype=np.int64)
+        start = np.searchsorted(self._keys, self._key(codes, lo, self.year_bounds), side='left')
+        stop = np.searchsorted(self._keys, self._key(codes, hi, self.year_bounds), side='right')
+        lengths = stop - start
+        # Concatenate the ranges [start, stop) without a Python loop
+        offsets = np.repeat(start - np.cumsum(lengths) + lengths, lengths)
+        return self._order[offsets + np.arange(lengths.sum())]
+
+
+class DatasetQuery:
+    """Filter engine for one page: a (projected) dataset frame plus the shared index.
+
+    Single-year selections are served from the precomputed `cube` when one
+    is given, and valid rows are picked with the bitmaps of `validity`
+    (see dashboard.clean).  `path` and `version` identify the data the
+    frame was loaded from, the latter for keying anything derived from
+    query results.
+    """
+
+    def __init__(self, frame, index, path=None, version=None, cube=None, validity=None):
+        self.frame = frame
+        self.index = index
+        self.path = path
+        self.version = version
+        self.cube = cube
+        self.validity = validity
+
+    @property
+    def countries(self):
+        return self.index.countries
+
+    @property
+    def year_bounds(self):
+        return self.index.year_bounds
+
+    @property
+    def shape(self):
+        """(rows, columns) of the full dataset."""
+        return dataset_shape(self.path)
+
+    def data_version(self, years=None, year=None):
+        """Version of the rows of the `years` range and the single `year`; the whole file here."""
+        return self.version
+
+    def select(self, countries=None, years=None, year=None, columns=None, valid=False):
+        """Rows for `countries` within the `years` range and/or the single `year`.
+
+        Rows come out grouped by country (in data order) with years ascending.
+        With `valid`, only rows whose `columns` (all if None) are all valid
+        are kept, as dropna() would for missing values.
+        """
+        if year is not None:
+            lo, hi = years if years is not None else (year, year)
+            if self.cube is not None and lo <= year <= hi:
+                frame = self.cube.table(year, countries)
+                # Cube tables keep the row labels of the frame, which are its positions
+                return self._project(frame, columns, valid, frame.index.to_numpy())
+            years = (max(lo, year), min(hi, year))
+        positions = self.index.positions(countries, years)
+        return self._project(self.frame.take(positions), columns, valid, positions)
+
+    def _project(self, frame, columns, valid, positions):
+        if valid:
+            frame = frame[valid_rows(frame, columns, self.validity, positions)]
+        return frame[columns] if columns is not None else frame
+
+    def long_form(self, name, year, countries=None):
+        """Precomputed long-form frame `name` (see dashboard.cube.LONG_FORMS) for one year."""
+        return self.cube.long_form(name, year, countries)
+
+
+class ScanQuery:
+    """DatasetQuery over a dataset that is scanned for every selection.
+
+    `dataset` provides countries, year_bounds, shape, path, version and
+    ``scan(countries, years, columns)`` returning rows grouped by country
+    with years ascending (see dashboard.partitioned and dashboard.sources).
+    Selections get the derived columns (dashboard.derived) and single years
+    the long forms of the year cube, computed for the selected rows only.
+    """
+
+    def __init__(self, dataset, columns=None):
+        self.dataset = dataset
+        # Scanned columns: the derived ones are computed from their sources
+        self.columns = dataset_columns(columns)
+        self.path = dataset.path
+        self.version = dataset.version
+        self.derived = requested(columns)
+
+    @property
+    def countries(self):
+        return self.dataset.countries
+
+    @property
+    def year_bounds(self):
+        return self.dataset.year_bounds
+
+    @property
+    def shape(self):
+        return self.dataset.shape
+
+    def data_version(self, years=None, year=None):
+        version = self.dataset.data_version(years, year)
+        if years is None and year is None:
+            return version
+        # Growth and indexed columns also read the previous and the base year
+        previous, base = history(self.derived)
+        related = set()
+        if previous:
+            related.update(y - 1 for y in (years[0] if years is not None else None, year) if y is not None)
+        if base:
+            related.add(base_year(self.year_bounds))
+        versions = [version] + [self.dataset.data_version(None, y) for y in sorted(related)]
+        return '+'.join(dict.fromkeys(versions))
+
+    def select(self, countries=None, years=None, year=None, columns=None, valid=False):
+        """Rows for `countries` within the `years` range and/or the single `year`, as DatasetQuery.select."""
+        if year is not None:
+            lo, hi = years if years is not None else (year, year)
+            years = (year, year) if lo <= year <= hi else (max(lo, year), min(hi, year))
+        frame = self._scan(countries, years)
+        if valid:
+            frame = frame[valid_rows(frame, columns)]
+        return frame[columns] if columns is not None else frame
+
+    def long_form(self, name, year, countries=None):
+        """Long-form frame `name` (see dashboard.cube.LONG_FORMS) for one year."""
+        sources, build = LONG_FORMS[name]
+        if self.columns is not None:
+            missing = [c for c in sources if c not in self.columns and c not in self.derived]
+            if missing:
+                raise KeyError(f'Long form {name!r} needs columns {missing}')
+        return build(self._year_table(year, countries))
+
+    def _year_table(self, year, countries):
+        return self._scan(countries, (year, year))
+
+    def _scan(self, countries, years):
+        """dataset.scan with the derived columns, reading the previous and base year they need as single years."""
+        frame = self.dataset.scan(countries, years, self.columns)
+        if not self.derived:
+            return frame
+        first, last = self.year_bounds
+        lo, hi = (max(first, years[0]), min(last, years[1])) if years is not None else (first, last)
+        previous, indexed = history(self.derived)
+        base = base_year(self.year_bounds)
+        extra = sorted({y for y in (lo - 1 if previous else None, base if indexed else None)
+                        if y is not None and lo <= hi and not lo <= y <= hi and first <= y <= last})
+        context = frame
+        if extra:
+            # Single years hit the per-year caches of the dataset
+            context = pd.concat([self.dataset.scan(countries, (y, y), self.columns) for y in extra] + [frame],
+                                ignore_index=True)
+        start = len(context) - len(frame)
+        derived = {name: values[start:] for name, values in compute(context, base, self.derived).items()}
+        return frame.assign(**derived)
+
+
+def load_pandas_query(path, columns=None):
+    index = derive(path, 'country_year_index', CountryYearIndex.from_frame, columns=[])
+    # Derived columns are computed once per version of the file, over the full history
+    base = base_year(index.year_bounds)
+    names = requested(columns)
+    columns = dataset_columns(columns)
+    df = derive(path, ('derived_frame', tuple(names)), lambda frame: add_derived(frame, base, names), columns=columns)
+    cube = derive(path, ('year_cube', tuple(names)), lambda frame: YearCube.from_frame(add_derived(frame, base, names)),
+                  columns=columns)
+    validity = derive(path, 'validity', Validity.from_frame, columns=columns)
+    return DatasetQuery(df, index, path, dataset_version(path), cube, validity)
+
+
+def load_query(path, columns=None, backend=None):
+    """Query engine for the dataset at `path`, projected onto `columns`.
+
+    `backend` names an entry of BACKENDS (default: DASHBOARD_BACKEND).  With
+    'auto' a directory is a partitioned dataset (see dashboard.partitioned)
+    and is queried out of core; anything else is loaded into pandas.
+    """
+    backend = backend or BACKEND
+    if backend == 'auto':
+        backend = 'partitioned' if os.path.isdir(path) else 'pandas'
+    if backend not in BACKENDS:
+        raise ValueError(f'unknown query backend: {backend!r} (choose from {", ".join(BACKENDS)})')
+    module, function = BACKENDS[backend]
+    return getattr(importlib.import_module(module), function)(path, columns)
@@ -0,0 +1,49 @@
+import numpy as np
+
+# Key columns of country_comparison_large_dataset_vn.csv
+COUNTRY = 'Quốc gia'
+YEAR = 'Năm'
+
+# Indicator columns, in file order
+INDICATORS = [
+    'GDP (nghìn tỷ USD)',
+    'GDP bình quân đầu người (USD)',
+    'Tỷ lệ lạm phát (%)',
+    'Dân số (triệu người)',
+    'Tỷ lệ tăng trưởng dân số (%)',
+    'Dân số đô thị (%)',
+    'Tuổi thọ (năm)',
+    'Chi tiêu y tế bình quân đầu người (USD)',
+    'Tỷ lệ bác sĩ-bệnh nhân',
+    'Tỷ lệ biết chữ (%)',
+    'Chi tiêu giáo dục (% GDP)',
+    'Tỷ lệ sử dụng Internet (%)',
+    'Tỷ lệ sử dụng điện thoại thông minh (%)',
+    'Tiêu thụ năng lượng (TWh)',
+    'Tỷ lệ năng lượng tái tạo (%)',
+    'Chi tiêu quân sự (tỷ USD)',
+    'Số lượng quân nhân tại ngũ',
+    'Lượng phát thải CO2 (triệu tấn)',
+    'Diện tích rừng che phủ (%)',
+    'Số lượng sân bay',
+    'Chiều dài mạng lưới đường bộ (km)',
+    'Sử dụng phương tiện công cộng (%)',
+    'Chỉ số phát triển con người (HDI)',
+    'Chỉ số bình đẳng giới',
+    'Tỷ lệ nghèo (%)',
+    'Số lượng khách quốc tế (triệu người)',
+    'Doanh thu du lịch (tỷ USD)',
+    'Diện tích đất nông nghiệp (%)',
+    'Tỷ lệ thất nghiệp (%)',
+    'Tỷ lệ tham gia lực lượng lao động (%)',
+    'Tỷ lệ tội phạm (trên 100,000 người)',
+    'Chỉ số cảm nhận tham nhũng',
+    'Chỉ số tự do báo chí',
+    'Tỷ lệ tham gia bầu cử (%)',
+]
+
+COLUMNS = [COUNTRY, YEAR] + INDICATORS
+
+# Explicit dtypes used when parsing the dataset
+DTYPES = {COUNTRY: 'category', YEAR: np.int16}
+DTYPES.update({col: np.float32 for col in INDICATORS})
@@ -0,0 +1,84 @@
+from dashboard import profiling
+from dashboard.figcache import figure_cache, figure_key
+
+# Widget keys shared by the chart pages
+COUNTRIES = "Quốc gia_selection"
+YEAR = "Năm_selection"
+YEAR_RANGE = "Năm_range"
+# Widget keys of the correlation page
+FOCUS_COUNTRY = "Tương quan_country"
+LAG_X = "Độ trễ_x"
+LAG_Y = "Độ trễ_y"
+MAX_LAG = "Độ trễ_max"
+
+# How each widget value feeds the figure cache key (see dashboard.figcache.figure_key)
+_KEY_ARGS = {COUNTRIES: 'countries', YEAR: 'year', YEAR_RANGE: 'years',
+             FOCUS_COUNTRY: 'focus', LAG_X: 'lag_x', LAG_Y: 'lag_y', MAX_LAG: 'max_lag'}
+
+_STATE_KEY = '_section_runtime'
+
+
+class SectionRuntime:
+    """Per-session memo of chart sections keyed by the widget values they read.
+
+    Every section declares the widget keys it depends on.  When none of them
+    changed since the previous rerun of the same session, the figure from
+    that render is served again as is; otherwise it comes from the shared
+    figure cache, and is only built when no session has built it yet.
+    """
+
+    def __init__(self, state):
+        self._state = state
+        self._memo = {}
+        self.reused = []
+        self.rebuilt = []
+
+    @classmethod
+    def for_session(cls, state):
+        """The runtime stored in `state` (a session state mapping), created on first use."""
+        if _STATE_KEY not in state:
+            state[_STATE_KEY] = cls(state)
+        return state[_STATE_KEY]
+
+    def begin_run(self):
+        self.reused = []
+        self.rebuilt = []
+
+    def inputs(self, reads):
+        return {key: _freeze(self._state.get(key)) for key in reads}
+
+    def _memo_of(self, section_id, inputs, version):
+        memo = self._memo.get(section_id)
+        if memo is not None and memo[0] == version and memo[1] == inputs:
+            return memo
+
+    def key(self, section_id, inputs, version=None):
+        """Figure cache key of `section_id` built from the widget values `inputs` (see inputs())."""
+        return figure_key(section_id, version, **{_KEY_ARGS[k]: v for k, v in inputs.items()})
+
+    def missing(self, section_id, reads, version=None):
+        """The figure cache key figure() would have to build for, or None if it has the figure."""
+        inputs = self.inputs(reads)
+        if self._memo_of(section_id, inputs, version) is not None:
+            return None
+        key = self.key(section_id, inputs, version)
+        return None if figure_cache.available(key) else key
+
+    def figure(self, section_id, reads, build, version=None):
+        inputs = self.inputs(reads)
+        memo = self._memo_of(section_id, inputs, version)
+        if memo is not None:
+            self.reused.append(section_id)
+            profiling.mark('memo')
+            return memo[2]
+        key = self.key(section_id, inputs, version)
+        fig = figure_cache.figure(key, build)
+        self._memo[section_id] = (version, inputs, fig)
+        self.rebuilt.append(section_id)
+        return fig
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value
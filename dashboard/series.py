@@ -0,0 +1,270 @@
+"""Compressed store of the indicators as one delta-encoded series per (country, indicator).
+
+The indicators are yearly and move slowly, so a country's series is kept
+as the change from one year to the next rather than the values.  Every
+indicator is laid out as a (country, year) grid and scaled to integers
+with the fewest decimals that give back each of its float32 values
+exactly (dashboard.clean types them).  A country's year-to-year deltas
+are small and are bit-packed in as few bits as their spread needs (see
+Series).  Every BLOCK years the scaled value itself is kept as an
+anchor, so a year range decodes with one cumulative sum from the anchor
+before it, for all selected countries at once.  An
+indicator no number of decimals represents exactly stays plain float32.
+Missing values and country-years without a row are packed bitmaps; a
+missing cell repeats the value before it, so it costs a zero delta.
+
+SeriesDataset plugs into dashboard.query.ScanQuery like a partitioned
+dataset: DASHBOARD_BACKEND=series serves the pages from it, with the
+frames of the pandas backend.  The parsed frame is dropped once encoded.
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from dashboard.loader import file_digest, read_source, resolve_source
+from dashboard.schema import COUNTRY, INDICATORS, YEAR
+
+# Years between two anchors
+BLOCK = 8
+# Most decimals tried before an indicator is kept as float32
+MAX_DECIMALS = 6
+INT_DTYPES = (np.int8, np.int16, np.int32, np.int64)
+
+_lock = threading.Lock()
+# resolved source path -> ((mtime, size), SeriesDataset)
+_datasets = {}
+
+
+def _forward_fill(grid):
+    """`grid` with each NaN replaced by the last value before it in its row (0 before the first)."""
+    blank = np.isnan(grid)
+    if not blank.any():
+        return grid
+    last = np.where(blank, 0, np.arange(grid.shape[1]))
+    np.maximum.accumulate(last, axis=1, out=last)
+    filled = np.take_along_axis(grid, last, axis=1)
+    return np.where(np.isnan(filled), np.float32(0), filled)
+
+
+def _decimals(values):
+    """Fewest decimals (up to MAX_DECIMALS) giving back every float32 of `values` exactly, or None."""
+    wide = values.astype(np.float64)
+    for decimals in range(MAX_DECIMALS + 1):
+        scale = 10.0 ** decimals
+        scaled = np.round(wide * scale)
+        if np.all(np.abs(scaled) < 2 ** 53) and np.array_equal((scaled / scale).astype(np.float32), values):
+            return decimals
+    return None
+
+
+def _int_dtype(values):
+    """Narrowest of INT_DTYPES holding every value of `values`."""
+    lo, hi = (values.min(), values.max()) if values.size else (0, 0)
+    return next(dtype for dtype in INT_DTYPES if np.iinfo(dtype).min <= lo and hi <= np.iinfo(dtype).max)
+
+
+def _pack(offsets, width):
+    """Rows of non-negative `offsets` as `width`-bit fields, most significant bit first, packed per row."""
+    bits = (offsets[:, :, None] >> np.arange(width - 1, -1, -1)) & 1
+    return np.packbits(bits.astype(np.uint8).reshape(len(offsets), -1), axis=1)
+
+
+def _unpack(packed, width, start, stop):
+    """Fields `start`..`stop` - 1 of the rows `_pack` wrote, as int64.
+
+    Each field is cut out of the big-endian word that starts at the byte it
+    starts in; the word is the narrowest that holds 7 + `width` bits.  Past
+    the end of a row the last byte is repeated: bytes after a field's last
+    one only hold bits below it, which are shifted out.
+    """
+    size = 2 if width <= 9 else 4 if width <= 25 else 8
+    dtype = np.dtype(f'>u{size}')
+    bits = np.arange(start, stop) * width
+    columns = np.minimum((bits >> 3)[:, None] + np.arange(size), packed.shape[1] - 1)
+    window = np.ascontiguousarray(packed[:, columns])
+    words = window.view(dtype)[..., 0]
+    words = words << (bits & 7).astype(dtype) >> dtype.type(8 * size - width)
+    return words.astype(np.int64)
+
+
+class Series:
+    """One indicator over the (country, year) grid; `present` marks the cells that have a row.
+
+    A scaled series is stored as its anchors plus, per country, the
+    deltas minus their minimum (`bases`) in the fewest bits that hold
+    them: countries of the same bit width share one packed array.
+    """
+
+    def __init__(self, grid, present):
+        self.years = grid.shape[1]
+        missing = np.isnan(grid) & present
+        self.missing = np.packbits(missing, axis=1) if missing.any() else None
+        filled = _forward_fill(grid)
+        self.decimals = _decimals(filled)
+        if self.decimals is None:
+            self.values = filled
+            return
+        self.values = None
+        scaled = np.round(filled.astype(np.float64) * 10.0 ** self.decimals).astype(np.int64)
+        self.anchors = scaled[:, ::BLOCK].astype(_int_dtype(scaled))
+        deltas = np.diff(scaled, axis=1, prepend=scaled[:, :1])
+        # The first delta is 0 and never read: the first year is always an anchor
+        bases = deltas[:, 1:].min(axis=1) if self.years > 1 else np.zeros(len(deltas), dtype=np.int64)
+        offsets = np.maximum(deltas - bases[:, None], 0)
+        self.bases = bases.astype(_int_dtype(bases))
+        self.widths = np.zeros(len(offsets), dtype=np.uint8)
+        spread = offsets.max(axis=1, initial=0)
+        nonzero = spread > 0
+        self.widths[nonzero] = np.floor(np.log2(spread[nonzero])).astype(np.uint8) + 1
+        # Row of each country within the packed array of its width
+        self.slots = np.zeros(len(offsets), dtype=np.int32)
+        self.packed = {}
+        for width in np.unique(self.widths).tolist():
+            rows = np.flatnonzero(self.widths == width)
+            self.slots[rows] = np.arange(len(rows))
+            if width:
+                self.packed[width] = _pack(offsets[rows], width)
+
+    @property
+    def nbytes(self):
+        if self.decimals is None:
+            arrays = [self.values]
+        else:
+            arrays = [self.anchors, self.bases, self.widths, self.slots, *self.packed.values()]
+        if self.missing is not None:
+            arrays.append(self.missing)
+        return sum(a.nbytes for a in arrays)
+
+    def decode(self, codes, lo, hi):
+        """float32 values of the countries `codes` in grid columns `lo`..`hi`, one row per country."""
+        if self.decimals is None:
+            values = self.values[codes, lo:hi + 1]
+        else:
+            block = lo // BLOCK
+            start = block * BLOCK
+            steps = np.zeros((len(codes), hi + 1 - start), dtype=np.int64)
+            widths = self.widths[codes]
+            for width in np.unique(widths).tolist():
+                rows = np.flatnonzero(widths == width)
+                if width:
+                    packed = self.packed[width][self.slots[codes[rows]]]
+                    steps[rows] = _unpack(packed, width, start, hi + 1)
+            steps += self.bases[codes].astype(np.int64)[:, None]
+            steps[:, 0] = self.anchors[codes, block]
+            scaled = np.cumsum(steps, axis=1)[:, lo - start:]
+            values = (scaled / 10.0 ** self.decimals).astype(np.float32)
+        if self.missing is not None:
+            missing = np.unpackbits(self.missing[codes], axis=1, count=self.years)[:, lo:hi + 1].astype(bool)
+            values = np.where(missing, np.float32(np.nan), values)
+        return values
+
+
+class SeriesDataset:
+    """The indicators of a dataset as Series over one (country, year) grid, scanned like dashboard.partitioned."""
+
+    def __init__(self, frame, path=None, version=None):
+        self.path = path
+        self.version = version
+        country = frame[COUNTRY]
+        if not isinstance(country.dtype, pd.CategoricalDtype):
+            country = country.astype(pd.CategoricalDtype(pd.unique(country.dropna())))
+        codes = country.cat.codes.to_numpy().astype(np.int64)
+        rows = codes >= 0
+        # Countries in data order, only those with rows
+        used = np.unique(codes[rows])
+        self.countries = [country.cat.categories[code] for code in used]
+        self._codes = {name: code for code, name in enumerate(self.countries)}
+        self._country_dtype = pd.CategoricalDtype(self.countries)
+        code_map = np.full(len(country.cat.categories), -1, dtype=np.int64)
+        code_map[used] = np.arange(len(used))
+        codes = code_map[codes[rows]]
+        years = frame[YEAR].to_numpy().astype(np.int64)[rows]
+        self.year_bounds = (int(years.min()), int(years.max())) if len(years) else (0, 0)
+        span = self.year_bounds[1] - self.year_bounds[0] + 1
+        cells = codes * span + (years - self.year_bounds[0])
+        if len(np.unique(cells)) < len(cells):
+            raise ValueError('the series store needs at most one row per country and year')
+        present = np.zeros(len(self.countries) * span, dtype=bool)
+        present[cells] = True
+        present = present.reshape(-1, span)
+        self.rows = len(cells)
+        self._present = None if present.all() else np.packbits(present, axis=1)
+        self.series = {}
+        for c in INDICATORS:
+            if c not in frame:
+                continue
+            grid = np.full(present.size, np.nan, dtype=np.float32)
+            grid[cells] = frame[c].to_numpy()[rows]
+            self.series[c] = Series(grid.reshape(present.shape), present)
+
+    @classmethod
+    def open(cls, path):
+        """The store of the dataset at `path`, encoded once per version of the file."""
+        source = resolve_source(path)
+        st = os.stat(source)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _datasets.get(source)
+        if cached is None or cached[0] != key:
+            with _lock:
+                cached = _datasets.get(source)
+                if cached is None or cached[0] != key:
+                    dataset = cls(read_source(path), path, file_digest(source))
+                    cached = _datasets[source] = (key, dataset)
+        return cached[1]
+
+    @property
+    def shape(self):
+        return self.rows, len(self.series) + 2
+
+    @property
+    def nbytes(self):
+        """Bytes held by the encoded series and the row bitmap."""
+        present = self._present.nbytes if self._present is not None else 0
+        return present + sum(series.nbytes for series in self.series.values())
+
+    def data_version(self, years=None, year=None):
+        """Version of the rows of the `years` range and the single `year`; the whole file here."""
+        return self.version
+
+    def scan(self, countries=None, years=None, columns=None):
+        """Rows for `countries` (all if None) within the inclusive `years` range.
+
+        Only `columns` (every indicator if None) of the selected countries and
+        years are decoded.  Rows come out grouped by country in data order,
+        years ascending, with the dtypes of dashboard.loader.load_dataset.
+        """
+        columns = INDICATORS if columns is None else [c for c in columns if c not in (COUNTRY, YEAR)]
+        unknown = [c for c in columns if c not in self.series]
+        if unknown:
+            raise KeyError(f'Unknown columns: {unknown}')
+        first, last = self.year_bounds
+        lo, hi = first, last
+        if years is not None:
+            lo, hi = max(lo, years[0]), min(hi, years[1])
+        if countries is None:
+            codes = np.arange(len(self.countries), dtype=np.int64)
+        else:
+            codes = np.array(sorted({self._codes[c] for c in countries if c in self._codes}), dtype=np.int64)
+
+        if lo > hi or not len(codes):
+            data = {COUNTRY: np.empty(0, dtype=np.int64), YEAR: np.empty(0, dtype=np.int16)}
+            data.update({c: np.empty(0, dtype=np.float32) for c in columns})
+        else:
+            span = hi - lo + 1
+            data = {COUNTRY: np.repeat(codes, span), YEAR: np.tile(np.arange(lo, hi + 1, dtype=np.int16), len(codes))}
+            data.update({c: self.series[c].decode(codes, lo - first, hi - first).ravel() for c in columns})
+            if self._present is not None:
+                count = last - first + 1
+                rows = np.unpackbits(self._present[codes], axis=1, count=count)[:, lo - first:hi - first + 1]
+                rows = rows.ravel().astype(bool)
+                data = {c: values[rows] for c, values in data.items()}
+        return pd.DataFrame({**data, COUNTRY: pd.Categorical.from_codes(data[COUNTRY], dtype=self._country_dtype)},
+                            columns=[COUNTRY, YEAR] + columns)
+
+
+def load_series_query(path, columns=None):
+    from dashboard.query import ScanQuery
+
+    return ScanQuery(SeriesDataset.open(path), columns)
@@ -0,0 +1,153 @@
+"""Generate synthetic country-comparison datasets with the bundled CSV's schema.
+
+Usage: python -m dashboard.synthetic OUT.csv [--countries N] [--years FIRST:LAST]
+                                     [--seed S] [--missing RATE] [--no-snapshot]
+
+Every country gets a latent development level and size, and all indicators
+are derived from those plus a per-country trend and yearly noise, so the
+usual correlations hold (richer countries live longer, emit more CO2 per
+person, have less poverty, ...).  A fraction of the indicator cells is
+blanked out to exercise missing-value handling.  The same seed always
+produces the same CSV, byte for byte.
+
+Besides the CSV a Parquet snapshot is written next to it (see
+dashboard.ingest), so the loader can skip CSV parsing.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from dashboard.schema import COLUMNS, COUNTRY, INDICATORS, YEAR
+
+DEFAULT_COUNTRIES = 200
+DEFAULT_YEARS = (2000, 2023)
+DEFAULT_MISSING = 0.02
+
+
+def _country_names(n):
+    width = max(3, len(str(n)))
+    return [f'Nước {i + 1:0{width}d}' for i in range(n)]
+
+
+def generate(countries=DEFAULT_COUNTRIES, years=DEFAULT_YEARS, seed=0, missing=DEFAULT_MISSING):
+    """A dataset of `countries` x `years` rows (first and last year inclusive).
+
+    `missing` is the average share of blank indicator cells; the rate of
+    each column varies around it.
+    """
+    rng = np.random.default_rng(seed)
+    first, last = years
+    year = np.arange(first, last + 1)
+    n, m = countries, len(year)
+    # Years since the start, as a (1, years) row broadcast against (countries, 1)
+    t = (year - first)[None, :].astype(float)
+
+    def country(low, high):
+        return rng.uniform(low, high, (n, 1))
+
+    def noise(scale):
+        return rng.normal(0, scale, (n, m))
+
+    def walk(scale):
+        # Slowly drifting per-country deviation
+        return np.cumsum(rng.normal(0, scale, (n, m)), axis=1)
+
+    def share(values):
+        return np.clip(values, 0, 100)
+
+    # Latent development level in [0, 1] and log population in millions
+    dev = rng.beta(2, 2, (n, 1))
+    log_pop = rng.normal(np.log(30), 1.4, (n, 1))
+
+    growth = np.clip(2.2 - 2.0 * dev + noise(0.1) + walk(0.03), -0.8, 4)
+    population = np.exp(log_pop) * np.cumprod(1 + growth / 100, axis=1)
+    gdp_growth = 5.5 - 3.5 * dev + noise(1.5)
+    gdp_per_capita = np.exp(np.log(1200) + 3.9 * dev + country(-0.3, 0.3)) * np.cumprod(1 + gdp_growth / 100, axis=1)
+    gdp = gdp_per_capita * population * 1e6 / 1e12
+    inflation = np.clip(6 - 4 * dev + noise(1.2), -1, None)
+    urban = share(25 + 60 * dev + 0.3 * t + noise(1))
+    life = 58 + 24 * dev + 0.15 * t + country(-2, 2) + noise(0.3)
+    health = gdp_per_capita * (0.02 + 0.12 * dev) * (1 + noise(0.03))
+    doctors = np.clip(0.3 + 3.8 * dev + 0.02 * t + noise(0.1), 0.05, None)
+    literacy = share(55 + 45 * dev + 0.4 * t + noise(0.5))
+    education = np.clip(2.5 + 3 * dev + noise(0.3), 0.5, None)
+    # Adoption curves: developed countries adopt earlier
+    internet = share(100 / (1 + np.exp(-(t - (18 - 16 * dev)) / 3)) + noise(1))
+    smartphone = share(95 / (1 + np.exp(-(t - (22 - 14 * dev)) / 2.5)) + noise(1))
+    renewable = share(country(5, 60) + 0.5 * t + walk(0.5))
+    energy = population * (0.5 + 12 * dev) * (1 + 0.01 * t) * (1 + noise(0.02))
+    military_share = country(0.008, 0.04)
+    military = gdp * 1000 * military_share * (1 + noise(0.05))
+    soldiers = population * 1e6 * military_share / 8 * (1 + noise(0.03))
+    co2 = energy * (1 - renewable / 100) * country(0.7, 1.2) * (1 + noise(0.02))
+    forest = share(country(5, 65) - 0.1 * t + walk(0.1))
+    airports = np.exp(np.log(population) * 0.8 + 2 * dev + country(-1, 1)) * (1 + 0.005 * t)
+    roads = np.exp(np.log(population) * 0.9 + 9 + dev + country(-1, 1)) * (1 + 0.01 * t)
+    transit = share(country(8, 40) + noise(0.8))
+    hdi = np.clip(0.4 + 0.52 * dev + 0.003 * t + noise(0.005), 0, 1)
+    gender = np.clip(0.55 + 0.4 * dev + 0.002 * t + noise(0.01), 0, 1)
+    poverty = share(45 * (1 - dev) ** 2 * np.exp(-0.03 * t) + noise(0.8))
+    tourists = np.exp(np.log(population) * 0.5 + 2.5 * dev + country(-1.5, 1.5)) * (1 + 0.03 * t) * (1 + noise(0.05))
+    tourism = tourists * (0.4 + 2.5 * dev) * (1 + noise(0.05))
+    farmland = share(country(5, 65) - 0.05 * t + noise(0.3))
+    unemployment = share(country(2.5, 12) + walk(0.3))
+    labor = share(country(48, 72) + noise(0.8))
+    crime = np.exp(rng.normal(np.log(350), 0.6, (n, 1)) - 0.5 * dev) * (1 + noise(0.05))
+    corruption = np.clip(18 + 70 * dev + country(-8, 8) + noise(1.5), 0, 100)
+    press = np.clip(175 - 160 * dev + country(-20, 20) + noise(4), 1, 180)
+    turnout = share(country(45, 90) + noise(3))
+
+    values = [
+        gdp, gdp_per_capita, inflation, population, growth, urban, life, health,
+        doctors, literacy, education, internet, smartphone, energy, renewable,
+        military, soldiers, co2, forest, airports, roads, transit, hdi, gender,
+        poverty, tourists, tourism, farmland, unemployment, labor, crime,
+        corruption, press, turnout,
+    ]
+    data = {COUNTRY: np.repeat(_country_names(n), m), YEAR: np.tile(year, n)}
+    for col, column_values in zip(INDICATORS, values):
+        column_values = np.round(column_values.ravel(), 2)
+        rate = missing * rng.uniform(0.5, 1.5)
+        column_values[rng.random(column_values.size) < rate] = np.nan
+        data[col] = column_values
+    return pd.DataFrame(data, columns=COLUMNS)
+
+
+def write_dataset(path, countries=DEFAULT_COUNTRIES, years=DEFAULT_YEARS, seed=0,
+                  missing=DEFAULT_MISSING, snapshot=True):
+    """Write a generated dataset to `path` (CSV) and, unless disabled, its Parquet snapshot."""
+    df = generate(countries, years, seed, missing)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + '.tmp'
+    df.to_csv(tmp, index=False, encoding='utf-8-sig')
+    os.replace(tmp, path)
+    if snapshot:
+        from dashboard.ingest import write_snapshot
+
+        return path, write_snapshot(path)
+    return path, None
+
+
+def _year_span(value):
+    first, _, last = value.partition(':')
+    return int(first), int(last or first)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('output', help='CSV path to write')
+    parser.add_argument('--countries', type=int, default=DEFAULT_COUNTRIES)
+    parser.add_argument('--years', type=_year_span, default=DEFAULT_YEARS, help='FIRST:LAST, inclusive')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--missing', type=float, default=DEFAULT_MISSING, help='share of blank indicator cells')
+    parser.add_argument('--no-snapshot', dest='snapshot', action='store_false')
+    args = parser.parse_args()
+    for out in write_dataset(args.output, args.countries, args.years, args.seed, args.missing, args.snapshot):
+        if out:
+            print(f'wrote {out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+"""Page registry for the dashboard.
+
+Each page is a module exposing ``COLUMNS`` (the indicators it plots) and
+``render(query)``.  A page module is imported the first time it is
+selected and stays cached in ``sys.modules`` afterwards, so pages that are
+never opened cost nothing.
+"""
+import importlib
+
+# Menu label -> (module, sidebar icon), in menu order
+PAGES = {
+    "Trang chính": ('dashboard.views.home', "house-door-fill"),
+    "Kinh tế và dân số": ('dashboard.views.economy', "bar-chart-line-fill"),
+    "Xã hội và sức khỏe": ('dashboard.views.society', "person-heart"),
+    "Năng lượng, môi trường và cơ sở hạ tầng": ('dashboard.views.energy', "lightning-fill"),
+    "Quản trị": ('dashboard.views.governance', "buildings-fill"),
+    "Tương quan và độ trễ": ('dashboard.views.correlation', "grid-3x3-gap-fill"),
+}
+
+
+def load_page(name):
+    return importlib.import_module(PAGES[name][0])
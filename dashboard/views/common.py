@@ -0,0 +1,111 @@
+import os
+
+import streamlit as st
+
+from dashboard import figpool, profiling
+from dashboard.downsample import column_width, max_points
+from dashboard.sections import YEAR, YEAR_RANGE, SectionRuntime
+
+# Point budget per series of the year-range charts, which sit in the wide columns of st.columns([1, 2, 2])
+TREND_POINTS = max_points(column_width([1, 2, 2], 1))
+
+# Scatter charts with more points than this are drawn with WebGL (Scattergl) instead of SVG
+WEBGL_POINTS = int(os.environ.get('DASHBOARD_WEBGL_POINTS', 1000))
+
+color_palette = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#96EFFF', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
+
+
+# Updated chart layout configuration with better contrast
+def get_chart_layout():
+    return {
+        'plot_bgcolor': 'rgba(253, 245, 230, 0.7)',  # Custom plot background color (light)
+        'paper_bgcolor': 'rgba(253, 245, 230, 1)',   # Custom chart background color
+        'title': "", 
+        'xaxis_title_font': dict(color="#0d0d0d", weight="bold"),
+        'yaxis_title_font': dict(color="#0d0d0d", weight="bold"),
+        'xaxis': dict(
+            showgrid=True, 
+            gridcolor='rgba(0, 0, 0, 0.5)',  # Light grid lines
+            tickfont=dict(color='#696969'),  # Tick font color
+            title_font=dict(color='#696969')  # Axis title font color
+        ),
+        'yaxis': dict(
+            showgrid=True, 
+            gridcolor='rgba(0, 0, 0, 0.5)',  # Light grid lines
+            tickfont=dict(color='#696969'),  # Tick font color
+            title_font=dict(color='#696969')  # Axis title font color
+        ),
+        'legend': dict(
+            title=dict(
+                text='Quốc gia',  # Legend title
+                font=dict(color='#696969', weight="bold")  # Legend title styling
+            ),
+            font=dict(color='#696969'),  # Legend text color
+            bgcolor="rgba(253, 245, 230, 0.7)"  # Legend background color
+        ),
+        
+        'font': dict(
+            color='black'  # General text color
+        )
+    }
+
+
+# Pick SVG or WebGL for a px.scatter of `data`; marker sizes and outlines carry over to Scattergl
+def scatter_render_mode(data):
+    return 'webgl' if len(data) > WEBGL_POINTS else 'svg'
+
+
+# Build a chart section, reusing the previous render while the widgets it reads are unchanged.
+# The figure is keyed on the version of the years it shows, so adding a year keeps the others cached.
+# With profiling enabled, the chart's section is timed from here to its st.plotly_chart.
+def cached_chart(query, chart_id, build, reads):
+    profiling.section(chart_id)
+    runtime = SectionRuntime.for_session(st.session_state)
+    return runtime.figure(chart_id, reads, build, chart_version(query, runtime.inputs(reads)))
+
+
+def chart_version(query, inputs):
+    return query.data_version(inputs.get(YEAR_RANGE), inputs.get(YEAR))
+
+
+class ChartBatch:
+    """The charts of a page, declared up front so the missing ones build in parallel.
+
+    Every chart is added with a module-level builder taking the query and
+    plain keyword arguments, which is what a figpool worker can run.
+    prefetch() sends the charts no cache holds to the pool (when there is
+    one and more than one is missing); figure() then serves each chart
+    through cached_chart() like a page building it in place would.
+    """
+
+    def __init__(self, query, columns):
+        self.query = query
+        self.columns = columns
+        self._charts = {}
+        self._jobs = {}
+
+    def add(self, chart_id, build, reads, **params):
+        self._charts[chart_id] = (build, reads, params)
+
+    def prefetch(self):
+        runtime = SectionRuntime.for_session(st.session_state)
+        jobs = []
+        for chart_id, (build, reads, params) in self._charts.items():
+            inputs = runtime.inputs(reads)
+            version = chart_version(self.query, inputs)
+            key = runtime.missing(chart_id, reads, version)
+            if key is not None:
+                jobs.append((chart_id, key, version, inputs.get(YEAR_RANGE), inputs.get(YEAR), build, params))
+        # A single figure builds faster here than it travels to a worker and back
+        if len(jobs) < 2:
+            return
+        for chart_id, key, version, years, year, build, params in jobs:
+            future = figpool.submit(key, self.query.path, self.columns, version, years, year, build, params)
+            self._jobs[chart_id] = (key, future)
+
+    def figure(self, chart_id):
+        build, reads, params = self._charts[chart_id]
+        job = self._jobs.pop(chart_id, None)
+        if job is not None:
+            figpool.collect(*job)
+        return cached_chart(self.query, chart_id, lambda: build(self.query, **params), reads)
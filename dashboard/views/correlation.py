@@ -0,0 +1,88 @@
+import plotly.express as px
+import streamlit as st
+
+import dashboard.views.theme  # noqa: F401  registers the default Plotly template
+from dashboard.correlation import correlation_engine
+from dashboard.schema import INDICATORS
+from dashboard.sections import COUNTRIES, FOCUS_COUNTRY, LAG_X, LAG_Y, MAX_LAG, YEAR_RANGE
+from dashboard.views.common import cached_chart, get_chart_layout
+
+# Indicators plotted on this page; only these columns are read from the dataset
+COLUMNS = INDICATORS
+
+# Heatmap focus averaging the matrices of every selected country
+ALL_SELECTED = 'Trung bình các quốc gia đã chọn'
+
+
+def render(query):
+    st.markdown('''<div class="page-title">Tương quan giữa các chỉ số</div>''', unsafe_allow_html=True)
+
+    col1, col2 = st.columns((1, 1))
+    min_year, max_year = query.year_bounds
+
+    with col1:
+        selected_countries = st.multiselect("Chọn các quốc gia để so sánh", options=query.countries, default=query.countries, key=COUNTRIES)
+    with col2:
+        selected_year_range = st.slider("Chọn khoảng năm", min_value=min_year, max_value=max_year, value=(min_year, max_year), key=YEAR_RANGE)
+
+    col1, col2 = st.columns([1, 4])
+    with col1:
+        st.markdown('''<div class="custom1", style="height: 300px;">
+                        <h6><center>MA TRẬN TƯƠNG QUAN</center></h6>
+                        <p>Hệ số tương quan Pearson giữa từng cặp chỉ số, tính trên các năm trong khoảng đã chọn
+                           của một quốc gia, hoặc trung bình của các quốc gia đã chọn.</p></div>
+                    ''', unsafe_allow_html=True)
+        focus = st.selectbox("Quốc gia", options=[ALL_SELECTED] + list(selected_countries), key=FOCUS_COUNTRY)
+    with col2:
+        title = f'TƯƠNG QUAN GIỮA CÁC CHỈ SỐ TỪ NĂM {selected_year_range[0]} ĐẾN {selected_year_range[1]}'
+        st.markdown(f'''<div class="custom1", style="height: 75px;">
+                    <center><strong>{title}</strong></center>
+                    </div>
+                    ''', unsafe_allow_html=True)
+        if selected_countries:
+            def build_heatmap():
+                countries = selected_countries if focus == ALL_SELECTED else [focus]
+                matrix = correlation_engine(query).matrix(selected_year_range, countries)
+                fig = px.imshow(matrix, zmin=-1, zmax=1, aspect='auto',
+                                color_continuous_scale='RdBu_r',
+                                labels={'color': 'Hệ số tương quan'})
+                layout = get_chart_layout()
+                layout['xaxis'].update(showgrid=False, tickangle=45)
+                layout['yaxis'].update(showgrid=False)
+                layout.update(height=850, margin=dict(l=20, r=20, t=30, b=20))
+                fig.update_layout(**layout)
+                return fig
+            fig = cached_chart(query, 'correlation.heatmap', build_heatmap, reads=(COUNTRIES, YEAR_RANGE, FOCUS_COUNTRY))
+            st.plotly_chart(fig, use_container_width=True)
+
+    col3, col4 = st.columns([1, 4])
+    with col3:
+        st.markdown('''<div class="custom3", style="height: 300px;">
+                        <h6><center>TƯƠNG QUAN CÓ ĐỘ TRỄ</center></h6>
+                        <p>Tương quan giữa chỉ số dẫn trước năm t và chỉ số theo sau năm t + độ trễ.
+                           Độ trễ dương: chỉ số dẫn trước đi trước chỉ số theo sau.</p></div>
+                    ''', unsafe_allow_html=True)
+        lag_x = st.selectbox("Chỉ số dẫn trước", options=INDICATORS, index=INDICATORS.index('GDP (nghìn tỷ USD)'), key=LAG_X)
+        lag_y = st.selectbox("Chỉ số theo sau", options=INDICATORS, index=INDICATORS.index('Lượng phát thải CO2 (triệu tấn)'), key=LAG_Y)
+        max_lag = st.slider("Độ trễ tối đa (năm)", min_value=1, max_value=10, value=5, key=MAX_LAG)
+    with col4:
+        title = f'TƯƠNG QUAN CÓ ĐỘ TRỄ: {lag_x.upper()} VÀ {lag_y.upper()}'
+        st.markdown(f'''<div class="custom3", style="height: 75px;">
+                    <center><strong>{title}</strong></center>
+                    </div>
+                    ''', unsafe_allow_html=True)
+        if selected_countries:
+            def build_lag_chart():
+                lagged = correlation_engine(query).lagged(lag_x, lag_y, selected_year_range, selected_countries, max_lag)
+                lag_data = lagged.rename_axis(index='Quốc gia').reset_index().melt(
+                    id_vars='Quốc gia', var_name='Độ trễ (năm)', value_name='Hệ số tương quan')
+                fig = px.line(lag_data, x='Độ trễ (năm)', y='Hệ số tương quan', color='Quốc gia', markers=True)
+                fig.add_hline(y=0, line_width=1, line_dash='dash', line_color='DarkSlateGrey')
+                layout = get_chart_layout()
+                layout['yaxis'].update(range=[-1.05, 1.05])
+                layout.update(hovermode='x unified')
+                fig.update_layout(**layout)
+                return fig
+            fig = cached_chart(query, 'correlation.lag_line', build_lag_chart,
+                               reads=(COUNTRIES, YEAR_RANGE, LAG_X, LAG_Y, MAX_LAG))
+            st.plotly_chart(fig, use_container_width=True)
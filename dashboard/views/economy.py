@@ -0,0 +1,252 @@
+import plotly.express as px
+import streamlit as st
+
+import dashboard.views.theme  # noqa: F401  registers the default Plotly template
+from dashboard.downsample import downsample
+from dashboard.sections import COUNTRIES, YEAR, YEAR_RANGE
+from dashboard.views.common import TREND_POINTS, cached_chart, get_chart_layout, scatter_render_mode
+
+# Indicators plotted on this page; only these columns are read from the dataset
+COLUMNS = [
+    'GDP (nghìn tỷ USD)',
+    'Dân số (triệu người)',
+    'GDP bình quân đầu người (USD)',
+    'Tỷ lệ tham gia lực lượng lao động (%)',
+]
+
+
+def render(query):
+    st.markdown('''<div class="page-title">Kinh tế & Dân số</div>''', unsafe_allow_html=True)
+    
+    # Improved filters layout
+    slt1, slt2 = st.columns((1,1))
+    min_year, max_year = query.year_bounds
+
+    with slt1:
+        selected_countries = st.multiselect("Chọn các quốc gia để so sánh", options=query.countries, default=query.countries, key=COUNTRIES)
+    with slt2:
+        selected_year = st.selectbox("Chọn năm cụ thể", options=range(min_year, max_year + 1), index=max_year - min_year, key=YEAR)
+
+    selected_year_range = st.slider("Chọn khoảng năm", min_value=min_year, max_value=max_year, value=(min_year, max_year), key=YEAR_RANGE)
+
+    col1, col2, col3 = st.columns([1, 2, 2])
+    
+    with col1:
+        st.markdown('''<div class="custom3" style="height: 525px;">
+                        <h6><center>GDP VÀ DÂN SỐ</center></h6>
+                        <p>GDP và dân số là hai chỉ số thiết yếu, cung cấp cái nhìn toàn diện về tiềm lực kinh tế và quy mô dân số, phát triển của một quốc gia.</p>
+                    </div>
+                    ''', unsafe_allow_html=True)
+    with col2:
+        title = f"GDP CỦA CÁC QUỐC GIA TỪ NĂM {selected_year_range[0]} ĐẾN {selected_year_range[1]}"
+        st.markdown(f'''<div class="custom3", style="height: 75px;">
+                            <center><strong>{title}</strong></center>
+                        </div>
+                    ''', unsafe_allow_html=True)
+        if selected_countries:
+            def build_gdp_chart():
+                gdp_data = query.select(selected_countries, years=selected_year_range)
+                gdp_data = downsample(gdp_data, 'Năm', 'GDP (nghìn tỷ USD)', TREND_POINTS)
+            
+                fig = px.line(gdp_data, 
+                            x='Năm', 
+                            y='GDP (nghìn tỷ USD)', 
+                            color='Quốc gia',
+                            markers=True)
+
+                # Configure the logarithmic y-axis with better settings
+                fig.update_yaxes(
+                    type="log",
+                    title='GDP (Nghìn tỷ USD)',
+                    ticktext=['1', '2', '3', '4', '5', '10', '20', '30'],
+                    tickvals=[1, 2, 3, 4, 5, 10, 20, 30],
+                    range=[0, 1.5],  # log10 range for better visualization
+                    showgrid=True,
+                    gridwidth=1,
+                    gridcolor='rgba(128, 128, 128, 0.15)',
+                    showline=True,
+                    linewidth=1,
+                    linecolor='rgba(128, 128, 128, 0.4)'
+                )
+
+                # Improve the x-axis
+                fig.update_xaxes(
+                    title='Năm',
+                    dtick=5,  # Show Năm marks every 5 Năms
+                    gridcolor='rgba(128, 128, 128, 0.15)',
+                    gridwidth=1,
+                    showline=True,
+                    linewidth=1,
+                    linecolor='rgba(128, 128, 128, 0.4)'
+                )
+
+                # Get the base layout and update it with additional settings
+                layout = get_chart_layout()
+                layout.update(
+                    height=450,
+                    margin=dict(l=60, r=30, t=30, b=50),
+                    hovermode='x unified',
+                )
+
+                # Update layout with merged settings
+                fig.update_layout(**layout)
+
+                # Improve marker and line styling
+                fig.update_traces(
+                    marker=dict(
+                        size=6,  # Slightly smaller markers
+                        line=dict(width=1, color='DarkSlateGrey')
+                    ),
+                    line=dict(width=1),  # Slightly thinner lines
+                    hovertemplate='%{y:.1f} Nghìn Tỷ USD<extra></extra>'  # Simpler hover template
+                )
+                return fig
+            fig = cached_chart(query, 'economy.gdp_line', build_gdp_chart, reads=(COUNTRIES, YEAR_RANGE))
+            # Display the chart
+            st.plotly_chart(fig, use_container_width=True)
+    with col3:
+        title = f'DÂN SỐ CỦA CÁC QUỐC GIA TỪ NĂM {selected_year_range[0]} ĐẾN {selected_year_range[1]}'
+        st.markdown(f'''<div class="custom3", style="height: 75px;">
+                    <center><strong>{title}</strong></center>
+                    </div>
+                    ''', unsafe_allow_html=True)
+
+        if selected_countries:
+            def build_population_chart():
+                pop_data = query.select(selected_countries, years=selected_year_range)
+                pop_data = downsample(pop_data, 'Năm', 'Dân số (triệu người)', TREND_POINTS)
+            
+                fig = px.line(pop_data,
+                            x='Năm',
+                            y='Dân số (triệu người)',
+                            color='Quốc gia', 
+                            markers=True)
+
+                # Configure the logarithmic y-axis with better settings
+                fig.update_yaxes(
+                    type="log",
+                    title='Dân số (triệu người)',
+                    ticktext=['10', '20', '50', '100', '200', '500', '1000', '2000'],
+                    tickvals=[10, 20, 50, 100, 200, 500, 1000, 2000],
+                    range=[1, 3.3],  # log10 of 10 to 2000
+                    showgrid=True,
+                    gridwidth=1,
+                    gridcolor='rgba(128, 128, 128, 0.2)',
+                )
+
+                # Improve the x-axis
+                fig.update_xaxes(
+                    title='Năm',
+                    dtick=5,  # Show Năm marks every 5 Năms
+                    gridcolor='rgba(128, 128, 128, 0.2)',
+                    gridwidth=1,
+                )
+
+                # Get the base layout and update it with additional settings
+                layout = get_chart_layout()
+                layout.update(
+                    margin=dict(l=60, r=30, t=50, b=50),
+                    hovermode='x unified'
+                )
+
+                # Update layout with merged settings
+                fig.update_layout(**layout)
+
+                # Improve marker and line styling
+                fig.update_traces(
+                    marker=dict(
+                        size=6,
+                        line=dict(width=1, color='DarkSlateGrey')
+                    ),
+                    line=dict(width=1),
+                    hovertemplate='%{y:.0f} Triệu Người<extra></extra>'
+                )
+                return fig
+            fig = cached_chart(query, 'economy.population_line', build_population_chart, reads=(COUNTRIES, YEAR_RANGE))
+            # Display the chart
+            st.plotly_chart(fig, use_container_width=True)
+    
+    # Second row - Population metrics
+    col4, col5, col6 = st.columns([1, 2, 2])
+    
+    with col4:
+        st.markdown('''<div class="custom2", style="height: 525px;">
+                        <h6><center>CÁC MỐI TƯƠNG QUAN KINH TẾ VÀ DÂN SỐ</center></h6>
+                        <p>GDP bình quân đầu người và tỷ lệ tham gia lao động là hai yếu tố then chốt, không chỉ phản ánh mức độ phát triển kinh tế mà còn thể hiện sức khỏe và quy mô của thị trường lao động trong một quốc gia.</p>
+                    ''', unsafe_allow_html=True)
+    with col5:
+        title = f'DÂN SỐ VÀ GDP BÌNH QUÂN ĐẦU NGƯỜI THEO QUY MÔ GDP VÀO NĂM {selected_year}'
+        st.markdown(f'''<div class="custom2", style="height: 75px;">
+                    <center><strong>{title}</strong></center>
+                     </div>
+                    ''', unsafe_allow_html=True)
+        if selected_countries:
+            def build_gdp_per_capita_chart():
+                pop_gdp_data = query.select(selected_countries, year=selected_year,
+                                            columns=['Quốc gia', 'Dân số (triệu người)', 'GDP bình quân đầu người (USD)', 'GDP (nghìn tỷ USD)'],
+                                            valid=True)
+            
+                fig = px.scatter(pop_gdp_data,
+                               x='Dân số (triệu người)',
+                               y='GDP bình quân đầu người (USD)',
+                               size='GDP (nghìn tỷ USD)', 
+                               color='Quốc gia',
+                               hover_name='Quốc gia',
+                               size_max=30,
+                               render_mode=scatter_render_mode(pop_gdp_data))
+                    # Configure the logarithmic y-axis with better settings
+
+                fig.update_layout(
+                **get_chart_layout(),
+                annotations=[
+                    dict(
+                        xref='paper', yref='paper',
+                        x=0.5, y=1.15,  # Position at the top center of the chart
+                        showarrow=False,
+                        text="Kích thước bong bóng biểu thị quy mô GDP của các quốc gia",
+                        font=dict(size=16, color="DarkSlateGrey")
+                    )
+                ]
+                )
+                fig.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+                return fig
+            fig = cached_chart(query, 'economy.gdp_per_capita_scatter', build_gdp_per_capita_chart, reads=(COUNTRIES, YEAR))
+            st.plotly_chart(fig)
+    with col6:
+        title=f'DÂN SỐ VÀ TỶ LỆ THAM GIA LAO ĐỘNG THEO QUY MÔ GDP VÀO NĂM {selected_year}'
+        st.markdown(f'''<div class="custom2", style="height: 75px;">
+                    <center><strong>{title}</strong></center>
+                     </div>
+                    ''', unsafe_allow_html=True)
+        def build_labor_chart():
+            pop_gdp_data = query.select(selected_countries, year=selected_year,
+                                        columns=['Quốc gia', 'Dân số (triệu người)', 'Tỷ lệ tham gia lực lượng lao động (%)', 'GDP (nghìn tỷ USD)'],
+                                        valid=True)
+
+            fig = px.scatter(pop_gdp_data,
+                               x='Dân số (triệu người)',
+                               y='Tỷ lệ tham gia lực lượng lao động (%)',
+                               size='GDP (nghìn tỷ USD)', 
+                               color='Quốc gia',
+                               labels={'Dân số (triệu người)': 'Dân số (triệu người)',
+                                    'Tỷ lệ tham gia lực lượng lao động (%)': 'Tỷ lệ tham gia lao động (%)'},
+                               hover_name='Quốc gia',
+                               size_max=30,
+                               render_mode=scatter_render_mode(pop_gdp_data))
+
+            fig.update_layout(
+                **get_chart_layout(),
+                annotations=[
+                    dict(
+                        xref='paper', yref='paper',
+                        x=0.5, y=1.15,  # Position at the top center of the chart
+                        showarrow=False,
+                        text="Kích thước bong bóng biểu thị quy mô GDP của các quốc gia",
+                        font=dict(size=16, color="DarkSlateGrey")
+                    )
+                ]
+            )
+            fig.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+            return fig
+        fig = cached_chart(query, 'economy.labor_scatter', build_labor_chart, reads=(COUNTRIES, YEAR))
+        st.plotly_chart(fig)
@@ -0,0 +1,308 @@
+import plotly.express as px
+import streamlit as st
+
+import dashboard.views.theme  # noqa: F401  registers the default Plotly template
+from dashboard.downsample import downsample
+from dashboard.sections import COUNTRIES, YEAR, YEAR_RANGE
+from dashboard.views.common import TREND_POINTS, ChartBatch, get_chart_layout, scatter_render_mode
+
+# Indicators plotted on this page; only these columns are read from the dataset
+COLUMNS = [
+    'Tiêu thụ năng lượng (TWh)',
+    'Tỷ lệ năng lượng tái tạo (%)',
+    'Diện tích rừng che phủ (%)',
+    'Lượng phát thải CO2 (triệu tấn)',
+    'Dân số (triệu người)',
+    'Chiều dài mạng lưới đường bộ (km)',
+    'Sử dụng phương tiện công cộng (%)',
+    # Derived from the renewable share (see dashboard.derived)
+    'Tỉ lệ năng lượng không tái tạo (%)',
+]
+
+# Page-specific styles, emitted on every render
+PAGE_CSS = """       
+        <style>
+        .summary1{
+            background-color: #528B8B;
+            padding: 20px;
+        }
+        .summary2 {
+            background-color: #4682B4;
+            padding: 20px;
+        }       
+        .summary3{
+            background-color: #cd5c5c;
+            padding: 20px;
+        }
+        .custom1, .custom2, .custom3 {
+            padding: 20px;
+            height: 75px; /* Set the fixed height here */
+            overflow: hidden; /* Ensures text doesn't overflow */
+            text-align: center; /* Center-align the text */
+            display: flex;
+            justify-content: center;
+            align-items: center;
+        }
+        </style>
+    """
+
+
+def build_energy_chart(query, countries, years):
+    energy_data = query.select(countries, years=years)
+    # Stacked areas need the same years in every country
+    energy_data = downsample(energy_data, 'Năm', 'Tiêu thụ năng lượng (TWh)', TREND_POINTS, align=True)
+    fig = px.area(energy_data, 
+        x='Năm', y='Tiêu thụ năng lượng (TWh)', 
+        color='Quốc gia',
+        markers=True
+    )
+
+    fig.update_layout(
+        xaxis_title="Năm",
+        yaxis_title="Lượng tiêu thụ năng lượng (TWh)",
+        **get_chart_layout(),
+    )
+
+    fig.update_traces(
+        marker=dict(
+            size=6,
+            line=dict(
+                color='DarkSlateGrey',
+                width=1
+            )
+        )
+    )
+    return fig
+
+
+def build_renewable_chart(query, countries, year):
+    stacked_df = query.long_form('energy_share', year, countries)
+
+    # Create a stacked bar chart
+    fig_renewable = px.bar(
+        stacked_df, 
+        x='Quốc gia', 
+        y='Phần trăm', 
+        color='Loại năng lượng',  # Stack by 'Energy Type' to show renewable and non-renewable
+        color_discrete_map={
+            'Tỷ lệ năng lượng tái tạo (%)': '#7daed7',  # LimeGreen for renewable
+            'Tỉ lệ năng lượng không tái tạo (%)': '#478dff'  # OrangeRed for non-renewable
+        }
+    )
+
+    chart_layout = get_chart_layout()
+    chart_layout['legend']['title']['text'] = 'Loại năng lượng'  
+
+    fig_renewable.update_layout(
+        yaxis_title="Tỉ lệ (%)",
+        xaxis_title="Quốc gia",
+        **chart_layout,
+    )
+    return fig_renewable
+
+
+def build_forest_chart(query, countries, years):
+    df_forest = query.select(countries, years=years)
+    df_forest = downsample(df_forest, 'Năm', 'Diện tích rừng che phủ (%)', TREND_POINTS)
+
+    fig_forest = px.line(
+        df_forest,
+        x="Năm", 
+        y="Diện tích rừng che phủ (%)",
+        color="Quốc gia",
+        markers=True
+    )
+
+    fig_forest.update_layout(
+        xaxis_title="Năm",
+        yaxis_title="Độ che phủ rừng (%)",
+        **get_chart_layout(),
+    )
+    fig_forest.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig_forest
+
+
+def build_co2_chart(query, countries, year):
+    co2_data = query.select(countries, year=year,
+                            columns=['Quốc gia', 'Tiêu thụ năng lượng (TWh)', 'Lượng phát thải CO2 (triệu tấn)', 'Dân số (triệu người)'],
+                            valid=True)
+    fig_co2_ptr = px.scatter(
+        co2_data,
+        x="Tiêu thụ năng lượng (TWh)", y="Lượng phát thải CO2 (triệu tấn)",
+        size="Dân số (triệu người)", color="Quốc gia", hover_name="Quốc gia",
+        size_max=20,  # Control the max size of the bubbles
+        render_mode=scatter_render_mode(co2_data)
+    )
+
+    layout = get_chart_layout()
+    layout.update(
+        annotations=[
+            dict(
+                xref='paper', yref='paper',
+                x=0.5, y=1.15,  # Position at the top center of the chart
+                showarrow=False,
+                text="Kích thước bong bóng biểu thị quy mô dân số của các quốc gia",
+                font=dict(size=16, color="DarkSlateGrey")
+            )
+        ]
+    )
+
+    fig_co2_ptr.update_layout(
+        xaxis_title="Lượng tiêu thụ năng lượng (TWh)",
+        yaxis_title="Lượng phát thải CO2 (triệu tấn)",
+        **layout,
+    )
+    fig_co2_ptr.update_traces(
+        marker=dict(
+            line=dict(width=1, color='DarkSlateGrey')
+        )
+    )
+    return fig_co2_ptr
+
+
+def build_infra_chart(query, countries, year):
+    df_filtered = query.select(countries, year=year,
+                               columns=['Quốc gia', 'Chiều dài mạng lưới đường bộ (km)', 'Sử dụng phương tiện công cộng (%)', 'Lượng phát thải CO2 (triệu tấn)'],
+                               valid=True)
+
+    # Plot the merged infrastructure chart
+    fig_infra = px.scatter(df_filtered, 
+                            x="Chiều dài mạng lưới đường bộ (km)",  # Road network length
+                            y="Sử dụng phương tiện công cộng (%)",  # Number of airports
+                            size="Lượng phát thải CO2 (triệu tấn)",  # CO2 emissions
+                            color="Quốc gia",  # Countries
+                            hover_name="Quốc gia",  # Hover data
+                            title="Mạng lưới đường bộ và Số lượng sân bay với lượng phát thải CO2",
+                            render_mode=scatter_render_mode(df_filtered)
+                        )
+
+    layout = get_chart_layout()
+    layout.update(
+        annotations=[
+            dict(
+                xref='paper', yref='paper',
+                x=0.5, y=1.15,  # Position at the top center of the chart
+                showarrow=False,
+                text="Kích thước bong bóng biểu thị lượng phát thải CO2 của các quốc gia",
+                font=dict(size=16, color="DarkSlateGrey")
+            )
+        ]
+    )
+
+    # Customize chart layout
+    fig_infra.update_layout(
+        xaxis_title="Chiều dài mạng lưới đường bộ",  
+        yaxis_title="Tỉ lệ sử dụng phương tiện công cộng (%)",
+        **layout,
+    )
+
+    fig_infra.update_traces(
+        marker=dict(
+            line=dict(width=1, color='DarkSlateGrey')
+        )
+    )
+    return fig_infra
+
+
+def render(query):
+    st.markdown('''<div class="page-title">Năng lượng, Môi trường & Cơ sở hạ tầng</div>''', unsafe_allow_html=True)
+
+    # Custom CSS to style column
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+    # Sidebar for Quốc gia selection
+    col1, col2 = st.columns((1,1))
+    min_year, max_year = query.year_bounds
+
+    with col1:
+        selected_countries = st.multiselect("Chọn các quốc gia để so sánh", options=query.countries, default=query.countries, key=COUNTRIES)
+    with col2:
+        selected_year = st.selectbox("Chọn năm cụ thể", options=range(min_year, max_year + 1), index=max_year - min_year, key=YEAR)
+
+    selected_year_range = st.slider("Chọn khoảng năm", min_value=min_year, max_value=max_year, value=(min_year, max_year), key=YEAR_RANGE)
+    selected_years = selected_year_range
+    selected_year = selected_year
+
+    # The page's figures, built side by side when a figure pool is configured
+    charts = ChartBatch(query, COLUMNS)
+    charts.add('energy.consumption_area', build_energy_chart, reads=(COUNTRIES, YEAR_RANGE), countries=selected_countries, years=selected_years)
+    charts.add('energy.renewable_bar', build_renewable_chart, reads=(COUNTRIES, YEAR), countries=selected_countries, year=selected_year)
+    charts.add('energy.forest_line', build_forest_chart, reads=(COUNTRIES, YEAR_RANGE), countries=selected_countries, years=selected_years)
+    charts.add('energy.co2_scatter', build_co2_chart, reads=(COUNTRIES, YEAR), countries=selected_countries, year=selected_year)
+    charts.add('energy.infra_scatter', build_infra_chart, reads=(COUNTRIES, YEAR), countries=selected_countries, year=selected_year)
+    if selected_countries:
+        charts.prefetch()
+
+    # Main tab
+    col1, col2, col3 = st.columns([1, 2, 2])
+    with col1:
+        st.markdown('''<div class="summary1", style="height: 525px;">
+                        <h6><center>NĂNG LƯỢNG</center></h6>
+                        <p>Mặc dù tổng lượng tiêu thụ năng lượng của các quốc gia tương đối ổn định qua các năm, nhưng sự phụ thuộc vào năng lượng không tái tạo vẫn chiếm ưu thế, đặc biệt là ở các nước lớn như Mỹ, Nga và Ấn Độ. Việc thúc đẩy chuyển đổi sang năng lượng tái tạo vẫn còn là một thách thức lớn</p></div>
+                    ''', unsafe_allow_html=True)
+    with col2:
+        title =f'LƯỢNG TIÊU THỤ NĂNG LƯỢNG CỦA CÁC QUỐC GIA TỪ NĂM {selected_years[0]} ĐẾN {selected_years[1]}'
+        st.markdown(f'''<div class="custom1">
+                    <center><strong>{title}</strong></center>
+                    </div>
+                    ''', unsafe_allow_html=True)
+
+        if selected_countries:
+            fig = charts.figure('energy.consumption_area')
+            st.plotly_chart(fig)
+    with col3:
+        title=f'TỈ LỆ NĂNG LƯỢNG TÁI TẠO CỦA CÁC QUỐC GIA NĂM {selected_year}'
+        st.markdown(f'''<div class="custom1">
+                    <center><strong>{title}</strong></center>
+                    </div>
+                    ''', unsafe_allow_html=True)
+
+        if selected_countries:
+            fig_renewable = charts.figure('energy.renewable_bar')
+
+            st.plotly_chart(fig_renewable)
+
+    # Main tab
+    col4, col5, col6 = st.columns([1, 2, 2])
+    with col4:
+        st.markdown('''<div class="summary2", style="height: 525px;">
+                        <h6><center>MÔI TRƯỜNG</center></h6>
+                        <p>Độ che phủ rừng của các nước có xu hướng giữ nguyên qua các năm, nhưng tại các quốc gia có dân số lớn và tiêu thụ năng lượng cao như Trung Quốc và Ấn Độ, lượng phát thải CO2 vẫn ở mức rất cao, cho thấy mối tương quan rõ rệt giữa tăng trưởng năng lượng và tác động đến môi trường. Đặc biệt là Trung Quốc, nước đang phát triển lớn nhất thế giới, với tỉ lệ bao che phủ rừng thấp nhưng lượng phát thải khí CO2 rất lớn </p></div>
+                    ''', unsafe_allow_html=True)
+    with col5:
+        title = f'ĐỘ CHE PHỦ RỪNG CỦA CÁC QUỐC GIA TỪ NĂM {selected_years[0]} ĐẾN {selected_years[1]}'
+        st.markdown(f'''<div class="custom2">
+                    <center><strong>{title}</strong></center>
+                    </div>
+                    ''', unsafe_allow_html=True)
+
+        if selected_countries:
+            fig_forest = charts.figure('energy.forest_line')
+            st.plotly_chart(fig_forest)
+    with col6:
+        title = f'BIỂU ĐỒ THỂ HIỆN LƯỢNG PHÁT THẢI CO2 VÀ LƯỢNG TIÊU THỤ NĂNG LƯỢNG THEO DÂN SỐ NĂM {selected_year}'
+        st.markdown(f'''<div class="custom2">
+                    <center><strong>{title}</strong></center>
+                    </div>
+                    ''', unsafe_allow_html=True)
+
+        if selected_countries:
+            fig_co2_ptr = charts.figure('energy.co2_scatter')
+            st.plotly_chart(fig_co2_ptr)
+
+    #Main tab
+    col7, col8 = st.columns([1, 4])
+    with col7:
+        st.markdown('''<div class="summary3", style="height: 525px;">
+                        <h6><center>CƠ SỞ HẠ TẦNG</center></h6>
+                        <p>Việc đầu tư vào cơ sở hạ tầng được chú trọng đặc biệt là ở các nước lớn nhưng tỉ lệ sử dụng phương tiện công cộng lại ở mức thấp dẫn đến sự phát thải CO2 cao. Việc đầu tư vào cơ sở hạ tầng qua việc xây dựng các sân bay thu hút lượng lớn du khách nước ngoài mang lại doanh thu khá lớn cho hoạt động du lịch<p></div>
+                    ''', unsafe_allow_html=True)
+    with col8:
+        title = f'CHIỀU DÀI MẠNG LƯỚI ĐƯỜNG BỘ VÀ TỈ LỆ SỬ DỤNG PHƯƠNG TIỆN CÔNG CỘNG THEO LƯỢNG PHÁT THẢI CO2 NĂM {selected_year}'
+        st.markdown(f'''<div class="custom3">
+                    <center><strong>{title}</strong></center>
+                    </div>
+                    ''', unsafe_allow_html=True)
+        if selected_countries:
+            fig_infra = charts.figure('energy.infra_scatter')
+            st.plotly_chart(fig_infra)        
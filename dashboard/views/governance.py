@@ -0,0 +1,342 @@
+import plotly.express as px
+import streamlit as st
+
+import dashboard.views.theme  # noqa: F401  registers the default Plotly template
+from dashboard.downsample import downsample
+from dashboard.sections import COUNTRIES, YEAR, YEAR_RANGE
+from dashboard.views.common import TREND_POINTS, ChartBatch, get_chart_layout, scatter_render_mode
+
+# Indicators plotted on this page; only these columns are read from the dataset
+COLUMNS = [
+    'Tỷ lệ tội phạm (trên 100,000 người)',
+    'Tỷ lệ tham gia bầu cử (%)',
+    'Dân số (triệu người)',
+    'GDP (nghìn tỷ USD)',
+    'Chỉ số tự do báo chí',
+    'Chỉ số cảm nhận tham nhũng',
+]
+
+# Page-specific styles, emitted on every render
+PAGE_CSS = """
+        <style>
+        .custom-box {
+            padding: 20px;
+        }
+        .custom1 { background-color: #4B0082; }
+        .custom2 { background-color: #8B4513; }
+        .custom3 { background-color: #2F4F4F; }
+        .custom4 { background-color: #483D8B; }
+        .chart-title {
+            color: white;
+            text-align: center;
+            font-weight: bold;
+            margin-bottom: 10px;
+        }
+        </style>
+    """
+
+
+# Function to create line chart
+def create_line_chart(data, x_col, y_col, title, y_label):
+    fig = px.line(data, x=x_col, y=y_col, color='Quốc gia', 
+                  title=title,
+                  labels={y_col: y_label, x_col: 'Năm'},
+                  markers=True)
+    fig.update_layout(**get_chart_layout())
+
+    fig.update_yaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(128, 128, 128, 0.15)',
+        showline=True,
+        linewidth=1,
+        linecolor='rgba(128, 128, 128, 0.4)'
+    )
+
+    # Improve the x-axis
+    fig.update_xaxes(
+        gridcolor='rgba(128, 128, 128, 0.15)',
+        gridwidth=1,
+        showline=True,
+        linewidth=1,
+        linecolor='rgba(128, 128, 128, 0.4)'
+    )
+
+    return fig
+
+
+# Function to create bar chart
+def create_bar_chart(data, x_col, y_col, title, y_label):
+    fig = px.bar(data, x=x_col, y=y_col, color='Quốc gia', 
+                 title=title,
+                 labels={y_col: y_label, x_col: 'Năm'},
+                 barmode='group')
+    fig.update_yaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(128, 128, 128, 0.15)',
+        showline=True,
+        linewidth=1,
+        linecolor='rgba(128, 128, 128, 0.4)'
+    )
+
+    # Improve the x-axis
+    fig.update_xaxes(
+        gridcolor='rgba(128, 128, 128, 0.15)',
+        gridwidth=1,
+        showline=True,
+        linewidth=1,
+        linecolor='rgba(128, 128, 128, 0.4)'
+    )
+
+    fig.update_layout(**get_chart_layout())
+    fig.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig
+
+
+# Function to create scatter plot
+def create_scatter_plot(data, x_col, y_col, title, y_label):
+    fig = px.scatter(data, x=x_col, y=y_col, color='Quốc gia', 
+                     title=title,
+                     labels={y_col: y_label, x_col: 'Năm'},
+                     size_max=15,
+                     render_mode=scatter_render_mode(data))
+    fig.update_layout(**get_chart_layout())
+    return fig
+
+
+# Function to create box plot
+def create_box_plot(data, x_col, y_col, title, y_label):
+    fig = px.box(data, x=x_col, y=y_col, color='Quốc gia', 
+                 title=title,
+                 hover_name='Quốc gia',
+                 labels={y_col: y_label, x_col: 'Quốc gia'})
+
+    fig.update_yaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(128, 128, 128, 0.15)',
+        showline=True,
+        linewidth=1,
+        linecolor='rgba(128, 128, 128, 0.4)'
+    )
+
+    # Improve the x-axis
+    fig.update_xaxes(
+        gridcolor='rgba(128, 128, 128, 0.15)',
+        gridwidth=1,
+        showline=True,
+        linewidth=1,
+        linecolor='rgba(128, 128, 128, 0.4)'
+    )
+    fig.update_layout(**get_chart_layout())
+    fig.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig
+
+
+# Function to create bubble chart
+def create_bubble_chart(data, x_col, y_col, title, x_label, y_label):
+    fig = px.scatter(data, x=x_col, y=y_col, size='Dân số (triệu người)', color='Quốc gia',
+                     hover_name='Quốc gia', title=title,
+                     labels={x_col: x_label, y_col: y_label},
+                     size_max=40,
+                     render_mode=scatter_render_mode(data))
+
+    
+    fig.update_yaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(128, 128, 128, 0.15)',
+        showline=True,
+        linewidth=1,
+        linecolor='rgba(128, 128, 128, 0.4)'
+    )
+
+    # Improve the x-axis
+    fig.update_xaxes(
+        gridcolor='rgba(128, 128, 128, 0.15)',
+        gridwidth=1,
+        showline=True,
+        linewidth=1,
+        linecolor='rgba(128, 128, 128, 0.4)'
+    )
+    layout = get_chart_layout()
+    layout.update(
+                    annotations=[
+                    dict(
+                        xref='paper', yref='paper',
+                        x=0.5, y=1.15,  # Position at the top center of the chart
+                        showarrow=False,
+                        text="Kích thước bong bóng biểu thị quy mô dân số của các quốc gia",
+                        font=dict(size=16, color="DarkSlateGrey")
+                    )
+                ]
+    )
+    fig.update_layout(**layout)
+    fig.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig
+
+
+def build_trend_chart(query, countries, years, y_col, title, y_label, chart_type):
+    chart_data = query.select(countries, years=years,
+                              columns=['Quốc gia', 'Năm', y_col], valid=True)
+    if chart_type == 'line':
+        chart_data = downsample(chart_data, 'Năm', y_col, TREND_POINTS)
+        fig = create_line_chart(chart_data, 'Năm', y_col, title, y_label)
+    elif chart_type == 'bar':
+        fig = create_bar_chart(chart_data, 'Năm', y_col, title, y_label)
+    elif chart_type == 'scatter':
+        fig = create_scatter_plot(chart_data, 'Năm', y_col, title, y_label)
+    elif chart_type == 'box':
+        fig = create_box_plot(chart_data, 'Quốc gia', y_col, title, y_label)
+    return fig
+
+
+def select_latest_data(query, countries, years, year, y_col):
+    return query.select(countries, years=years, year=year,
+                        columns=['Quốc gia', 'Năm', y_col, 'Dân số (triệu người)', 'GDP (nghìn tỷ USD)', 'Chỉ số tự do báo chí', 'Chỉ số cảm nhận tham nhũng'],
+                        valid=True)
+
+
+def build_bubble_chart(query, countries, years, year, y_col, y_label):
+    return create_bubble_chart(select_latest_data(query, countries, years, year, y_col), y_col, 'GDP (nghìn tỷ USD)', 
+                               f"So sánh {y_label} và GDP (Năm {year})", 
+                               y_label, "GDP (Nghìn tỷ USD)")
+
+
+def build_press_chart(query, countries, years, year, y_col, title):
+    latest_data = select_latest_data(query, countries, years, year, y_col)
+    fig = px.scatter(latest_data, x='Chỉ số tự do báo chí', y=y_col, size='Dân số (triệu người)', color='Quốc gia',
+         hover_name='Quốc gia', title=title,
+         size_max=40,
+         render_mode=scatter_render_mode(latest_data))
+
+    
+    fig.update_yaxes(
+        showgrid=True,
+        gridwidth=1,
+        gridcolor='rgba(128, 128, 128, 0.15)',
+        showline=True,
+        linewidth=1,
+        dtick=10,
+        linecolor='rgba(128, 128, 128, 0.4)'
+    )
+
+    # Improve the x-axis
+    fig.update_xaxes(
+        gridcolor='rgba(128, 128, 128, 0.15)',
+        gridwidth=1,
+        showline=True,
+        linewidth=1,
+        dtick=20,
+        linecolor='rgba(128, 128, 128, 0.4)'
+    )
+    layout = get_chart_layout()
+    layout.update(
+        annotations=[
+        dict(
+            xref='paper', yref='paper',
+            x=0.5, y=1.15,  # Position at the top center of the chart
+            showarrow=False,
+            text="Kích thước bong bóng biểu thị quy mô dân số của các quốc gia",
+            font=dict(size=16, color="DarkSlateGrey")
+        )
+    ]
+    )
+    fig.update_layout(**layout)
+    fig.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig
+
+
+# Sections of the page, top to bottom: title, description, chart title, column, label, style class, chart type
+SECTIONS = [
+    # Crime Rate Section
+    (
+        "TỈ LỆ TỘI PHẠM",
+        "Tỉ lệ tội phạm qua các năm có xu hướng biến động khác nhau ở mỗi quốc gia. Một số nước có xu hướng giảm, trong khi các nước khác lại tăng. Tỉ lệ tội phạm có thể bị ảnh hưởng bởi nhiều yếu tố như kinh tế, xã hội, và hiệu quả của hệ thống pháp luật.",
+        "TỈ LỆ TỘI PHẠM QUA CÁC NĂM",
+        'Tỷ lệ tội phạm (trên 100,000 người)',
+        'Tỉ lệ tội phạm (trên 100,000 dân)',
+        "custom1",
+        "line"
+    ),
+    # Voting Participation Rate Section
+    (
+        "TỈ LỆ THAM GIA BẦU CỬ",
+        "Tỉ lệ tham gia bầu cử phản ánh mức độ tham gia của công dân trong quá trình dân chủ của một quốc gia. Tỉ lệ cao hơn thường được coi là dấu hiệu của sự tham gia tích cực của công dân trong quá trình chính trị.",
+        "TỈ LỆ THAM GIA BẦU CỬ THEO QUỐC GIA",
+        'Tỷ lệ tham gia bầu cử (%)',
+        'Tỉ lệ tham gia bầu cử (%)',
+        "custom2",
+        "box"
+    ),
+]
+
+
+def render(query):
+    st.markdown('''<div class="page-title">Quản trị</div>''', unsafe_allow_html=True)
+    
+    # Custom CSS to style columns
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+    # Improved filters layout
+    col1, col2 = st.columns((1,1))
+    min_year, max_year = query.year_bounds
+
+    with col1:
+        selected_countries = st.multiselect("Chọn các quốc gia để so sánh", options=query.countries, default=query.countries, key=COUNTRIES)
+    with col2:
+        selected_year = st.selectbox("Chọn năm cụ thể", options=range(min_year, max_year + 1), index=max_year - min_year, key=YEAR)
+
+    selected_year_range = st.slider("Chọn khoảng năm", min_value=min_year, max_value=max_year, value=(min_year, max_year), key=YEAR_RANGE)
+
+    # The figures of every section, built side by side when a figure pool is configured
+    charts = ChartBatch(query, COLUMNS)
+    for title, _, _, y_col, y_label, _, chart_type in SECTIONS:
+        charts.add(f'governance.{chart_type}.{y_col}', build_trend_chart, reads=(COUNTRIES, YEAR_RANGE),
+                   countries=selected_countries, years=selected_year_range,
+                   y_col=y_col, title=title, y_label=y_label, chart_type=chart_type)
+        if title == "TỈ LỆ TỘI PHẠM":
+            charts.add(f'governance.gdp_bubble.{y_col}', build_bubble_chart, reads=(COUNTRIES, YEAR_RANGE, YEAR),
+                       countries=selected_countries, years=selected_year_range, year=selected_year,
+                       y_col=y_col, y_label=y_label)
+        else:
+            charts.add(f'governance.press_bubble.{y_col}', build_press_chart, reads=(COUNTRIES, YEAR_RANGE, YEAR),
+                       countries=selected_countries, years=selected_year_range, year=selected_year,
+                       y_col=y_col, title=title)
+    if selected_countries:
+        charts.prefetch()
+
+    # Function to create section
+    def create_section(title, description, chart_title, y_col, y_label, custom_class, chart_type):
+        col1, col2, col3 = st.columns([1, 2, 2])
+        with col1:
+            st.markdown(f'''
+                <div class="custom-box {custom_class}", style="height: 525px;">
+                    <h6><center><strong>{title}</center></strong></h6>
+                    <p>{description}</p>
+                </div>
+            ''', unsafe_allow_html=True)
+        with col2:
+            chart_title = f'{chart_title.upper()} TỪ NĂM {selected_year_range[0]} ĐẾN {selected_year_range[1]}'
+            st.markdown(f'<div class="custom-box {custom_class}", style="height: 75px;"><center><strong>{chart_title}</center></strong></div>', unsafe_allow_html=True)
+            if selected_countries:
+                fig = charts.figure(f'governance.{chart_type}.{y_col}')
+                st.plotly_chart(fig)
+        with col3:
+            if selected_countries:
+                # Lấy năm gần đây nhất có dữ liệu
+                if title == "TỈ LỆ TỘI PHẠM":
+                    
+                    chart_title = f'{y_label.upper()} VÀ GDP THEO QUY MÔ DÂN SỐ NĂM {selected_year}'
+                    st.markdown(f'<div class="custom-box {custom_class}", style="height: 75px;"><center><strong> {chart_title} </center></strong></div>', unsafe_allow_html=True)
+                    
+                    fig_bubble = charts.figure(f'governance.gdp_bubble.{y_col}')
+                    st.plotly_chart(fig_bubble)
+                else:
+                    chart_title = f'{y_label.upper()} VÀ CHỈ SỐ TỰ DO BÁO CHÍ THEO QUY MÔ DÂN SỐ NĂM {selected_year}'
+                    st.markdown(f'<div class="custom-box {custom_class}", style="height: 75px;"><center><strong> {chart_title}</center></strong></div>', unsafe_allow_html=True)
+                    fig = charts.figure(f'governance.press_bubble.{y_col}')
+                    st.plotly_chart(fig)
+
+    for section in SECTIONS:
+        create_section(*section)
@@ -0,0 +1,225 @@
+import streamlit as st
+
+# Indicators plotted on this page; only these columns are read from the dataset
+COLUMNS = []
+
+# Page-specific styles, emitted on every render
+PAGE_CSS = """
+        <style>
+        .main {
+            padding: 2rem;
+            background-color: ##f0f2f6;
+        }
+        .title {
+            font-size: 3rem;
+            font-weight: bold;
+            color: #FFBD73;
+            text-align: center;
+            margin-bottom: 1rem;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.1);
+        }
+        .subtitle {
+            font-size: 1.5rem;
+            color: #FFBD73;
+            text-align: center;
+            font-weight: bold;
+            margin-bottom: 2rem;
+        }
+        .section-title {
+            font-size: 2rem;
+            font-weight: bold;
+            color: #96EFFF;
+            margin-top: 2rem;
+            margin-bottom: 1rem;
+            text-align: center;
+        }
+        .metric-card {
+            border: 2px solid #1f77b4;
+            border-radius: 10px;
+            padding: 20px;
+            text-align: center;
+            margin: 10px;
+            background-color: #fdf5e6;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            transition: transform 0.3s ease;
+        }
+        .metric-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 6px 8px rgba(0, 0, 0, 0.15);
+        }
+        .metric-value {
+            font-size: 28px;
+            font-weight: bold;
+            color: #15B392;
+        }
+        .metric-label {
+            font-size: 16px;
+            color: #555;
+            margin-top: 5px;
+        }
+        .info-box {
+            background-color: #fdf5e6;
+            border-radius: 10px;
+            padding: 20px;
+            margin: 10px 0;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            height: 100px;
+        }
+        .info-box h3 {
+            color: #1f77b4;
+            margin-bottom: 10px;
+        }
+        .info-box p {
+            font-size: 20px;
+            color: #333;
+            line-height: 1.6;
+            font-weight: bold;
+            text-wrap: balance;
+            text-align: center;
+            margin: 0;
+        }
+        .info-item {
+            font-size: 18px;
+            height: 50px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: #333;
+            border-radius: 10px;
+            background-color: #fdf5e6;
+            font-weight: bold;
+            margin-bottom: 10px;
+            text-align: center;
+        }
+        .tab-container {
+            display: flex;
+            flex-wrap: wrap;
+            justify-content: space-between;
+            margin-top: 20px;
+        }
+        .tab-description {
+            flex-basis: calc(50% - 10px);
+            background-color: #fdf5e6;
+            border-radius: 10px;
+            padding: 20px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
+            transition: transform 0.3s ease;
+        }
+        .tab-description:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.15);
+        }
+        .tab-title {
+            font-weight: bold;
+            color: #15B392;
+            font-size: 1.5rem;
+            text-align: center;
+            margin-bottom: 10px;
+        }
+        .tab-description p {
+            font-size: 16px;
+            color: #333;
+            text-align: center;
+            text-wrap: balance;
+            justify-content: center;
+            align-items: center;
+            line-height: 1.6;
+            font-weight: bold;
+        }
+        </style>
+        """
+
+
+def render(query):
+    # CSS styles for the main page
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+    st.markdown("<h1 class='title'>Bảng Điều Khiển Phân Tích Dữ Liệu Toàn Cầu</h1>", unsafe_allow_html=True)
+    st.markdown("<p class='subtitle'>Khám phá xu hướng kinh tế, xã hội và môi trường trên toàn cầu</p>", unsafe_allow_html=True)
+
+    # Dataset purpose
+    st.markdown("<h2 class='section-title'>Mục Đích của Bộ Dữ Liệu</h2>", unsafe_allow_html=True)
+    st.markdown(
+        """
+        <div class="info-box">
+            <p>Bộ dữ liệu này cung cấp một cái nhìn toàn diện về các chỉ số phát triển của các quốc gia trên toàn cầu. 
+            Nó bao gồm nhiều lĩnh vực như kinh tế, dân số, y tế, giáo dục, công nghệ, môi trường, và quản trị. 
+            </p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+    
+    col_purpose1, col_purpose2 = st.columns(2)
+    with col_purpose1:
+        st.markdown("<div class='info-item'>Hiểu rõ hơn về xu hướng phát triển toàn cầu</div>", unsafe_allow_html=True)
+        st.markdown("<div class='info-item'>So sánh các nước Trung Quốc, Ấn Độ, Canada, Úc, Mỹ, Nga</div>", unsafe_allow_html=True)
+    with col_purpose2:
+        st.markdown("<div class='info-item'>Phân tích mối quan hệ giữa các chỉ số khác nhau</div>", unsafe_allow_html=True)
+        st.markdown("<div class='info-item'>Cung cấp cơ sở dữ liệu cho việc hoạch định chính sách và nghiên cứu</div>", unsafe_allow_html=True)
+    
+    # Dataset overview
+    st.markdown("<h2 class='section-title'>Tổng Quan Bộ Dữ Liệu</h2>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns(3)
+    n_rows, n_cols = query.shape
+
+    with col1:
+        st.markdown(
+            f"""
+            <div class="metric-card">
+                <div class="metric-value">{len(query.countries)}</div>
+                <div class="metric-label" style="font-weight: bold">Quốc gia</div>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    with col2:
+        st.markdown(
+            f"""
+            <div class="metric-card">
+                <div class="metric-value">{query.year_bounds[0]} - {query.year_bounds[1]}</div>
+                <div class="metric-label" style="font-weight: bold">Phạm vi Năm</div>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+    with col3:
+        st.markdown(
+            f"""
+            <div class="metric-card">
+                <div class="metric-value">{n_rows * n_cols:,}</div>
+                <div class="metric-label" style="font-weight: bold">Điểm Dữ liệu</div>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )
+
+    # Explore Topics
+    st.markdown("<h2 class='section-title'>Khám Phá Các Chủ Đề</h2>", unsafe_allow_html=True)
+    st.markdown(
+        """
+        <div class="tab-container">
+            <div class="tab-description"">
+                <h3 class="tab-title">Kinh tế và dân số</h3>
+                <p>Phân tích chi tiết về GDP, GDP bình quân đầu người, lạm phát, dân số, và các chỉ số liên quan. Hiểu rõ về tăng trưởng kinh tế và biến động dân số của các quốc gia.</p>
+            </div>
+            <div class="tab-description">
+                <h3 class="tab-title">Xã hội và sức khỏe</h3>
+                <p>Khám phá các chỉ số về tuổi thọ, chi tiêu y tế, tỷ lệ bác sĩ-bệnh nhân, tỷ lệ biết chữ, và chỉ số phát triển con người. Đánh giá chất lượng cuộc sống và phúc lợi xã hội.</p>
+            </div>
+            <div class="tab-description" >
+                <h3 class="tab-title">Năng lượng, môi trường và cơ sở hạ tầng</h3>
+                <p>Phân tích tiêu thụ năng lượng, tỷ lệ năng lượng tái tạo, phát thải CO2, và cơ sở hạ tầng. Hiểu rõ về sự phát triển bền vững và thách thức môi trường.</p>
+            </div>
+            <div class="tab-description">
+                <h3 class="tab-title">Quản trị</h3>
+                <p>Đánh giá hiệu quả quản trị thông qua chỉ số cảm nhận tham nhũng, chỉ số tự do báo chí, và tỷ lệ tham gia bầu cử. Hiểu rõ về tình hình dân chủ và minh bạch trong quản lý nhà nước.</p>
+            </div>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
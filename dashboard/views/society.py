@@ -0,0 +1,207 @@
+import plotly.express as px
+import streamlit as st
+
+import dashboard.views.theme  # noqa: F401  registers the default Plotly template
+from dashboard.sections import COUNTRIES, YEAR
+from dashboard.views.common import cached_chart, color_palette, get_chart_layout, scatter_render_mode
+
+# Indicators plotted on this page; only these columns are read from the dataset
+COLUMNS = [
+    'Tuổi thọ (năm)',
+    'Tỷ lệ bác sĩ-bệnh nhân',
+    'Chi tiêu y tế bình quân đầu người (USD)',
+    'Tỷ lệ nghèo (%)',
+    'Tỷ lệ thất nghiệp (%)',
+    'GDP bình quân đầu người (USD)',
+]
+
+
+def render(query):
+    st.markdown('''<div class="page-title">Xã hội & Sức khoẻ</div>''', unsafe_allow_html=True)
+
+        # Improved filters layout
+    col1, col2 = st.columns((1,1))
+    min_year, max_year = query.year_bounds
+
+    with col1:
+        selected_countries = st.multiselect("Chọn các quốc gia để so sánh", options=query.countries, default=query.countries, key=COUNTRIES)
+    with col2:
+        selected_year = st.selectbox("Chọn năm cụ thể", options=range(min_year, max_year + 1), index=max_year - min_year, key=YEAR)
+
+    # Main tab
+    col1, col2, col3 = st.columns([1, 2, 2])
+    with col1:
+        st.markdown('''<div class="custom2", style="height: 525px;">
+                        <h6><center>TUỔI THỌ</center></h6>
+                        <p>Tuổi thọ qua các năm có xu hướng dao động xung quanh mốc ban đầu năm 2000. 
+                           Và đang có xu hướng giảm dần ở năm 2023.</p>
+                        <p>Các nước có tỉ lệ bác sĩ trên bệnh nhân và chi tiêu y tế bình quân đầu người cao 
+                            thường có tuổi thọ cao hơn các nước còn lại. </p></div>
+                    ''', unsafe_allow_html=True)  # Start of the
+    with col2:
+        title = f'TUỔI THỌ CỦA CÁC QUỐC GIA TỪ NĂM {min_year} ĐẾN {max_year}'
+        st.markdown(f'''<div class="custom2", style="height: 75px;">
+                    <center><strong>{title}</strong></center>
+                    </div>
+                    ''', unsafe_allow_html=True) 
+        if selected_countries:
+            def build_life_expectancy_chart():
+                hdi_data = query.select(selected_countries, columns=['Quốc gia', 'Năm', 'Tuổi thọ (năm)'], valid=True)
+                # Create a line chart for HDI using Plotly
+                fig = px.line(hdi_data, x='Năm', y='Tuổi thọ (năm)', color='Quốc gia', 
+                            title="Tuổi thọ (năm) Over Năms by Quốc gia",
+                            labels={'Tuổi thọ (năm)': 'Tuổi thọ (Năm)', 'Năm': 'Năm'},
+                            markers=True)
+
+                        # Get the base layout and update it with additional settings
+                layout = get_chart_layout()
+                layout.update(
+                    margin=dict(l=60, r=30, t=30, b=50),
+                    hovermode='x unified',
+                )
+
+                # Update layout with merged settings
+                fig.update_layout(**layout)
+
+                # Improve marker and line styling
+                fig.update_traces(
+                    marker=dict(
+                        size=6,  # Slightly smaller markers
+                        line=dict(width=1, color='DarkSlateGrey')
+                    ),
+                    line=dict(width=1),  # Slightly thinner lines
+                
+                )
+                return fig
+            fig = cached_chart(query, 'society.life_expectancy_line', build_life_expectancy_chart, reads=(COUNTRIES,))
+            st.plotly_chart(fig)
+    with col3: 
+        title = f'TỈ LỆ BÁC SĨ-BỆNH NHÂN VÀ TUỔI THỌ THEO CHI TIÊU CHĂM SÓC SỨC KHOẺ BÌNH QUÂN ĐẦU NGƯỜI NĂM {selected_year}'
+        st.markdown(f'''<div class="custom2", style="height: 75px;">
+                    <center><strong>{title}</strong></center>
+                     </div>
+                    ''', unsafe_allow_html=True)
+        
+        if selected_countries:
+            def build_doctor_chart():
+                #Create a bubble chart using Plotly
+                doctor_data = query.select(selected_countries, year=selected_year,
+                                           columns=['Quốc gia', 'Năm', 'Tỷ lệ bác sĩ-bệnh nhân', 'Tuổi thọ (năm)', 'Chi tiêu y tế bình quân đầu người (USD)'],
+                                           valid=True)
+                fig = px.scatter(doctor_data, 
+                        x='Tỷ lệ bác sĩ-bệnh nhân', 
+                        y='Tuổi thọ (năm)', 
+                        size='Chi tiêu y tế bình quân đầu người (USD)',  # Bubble size
+                        color='Quốc gia',  # Bubble color
+                        title='Life Expectancy vs Tỷ lệ bác sĩ-bệnh nhân (Bubble Chart)',
+                        labels={'Tỷ lệ bác sĩ-bệnh nhân': 'Tỉ lệ bác sĩ-bệnh nhân',
+                                'Tuổi thọ (năm)': 'Tuổi thọ (năm)'},
+                        size_max=40,
+                        hover_name="Quốc gia",
+                        hover_data=["Năm"],
+                        animation_group="Quốc gia",
+                        render_mode=scatter_render_mode(doctor_data)
+                )
+                layout = get_chart_layout()
+                layout.update(
+                    annotations=[
+                    dict(
+                        xref='paper', yref='paper',
+                        x=0.5, y=1.15,  # Position at the top center of the chart
+                        showarrow=False,
+                        text="Kích thước bong bóng biểu thị chi tiêu y tế bình quân đầu người của các quốc gia",
+                        font=dict(size=16, color="DarkSlateGrey")
+                    )
+                ]
+                )
+                fig.update_layout(**layout)
+                fig.update_traces(
+                    marker=dict(# Slightly smaller markers
+                        line=dict(width=1, color='DarkSlateGrey')
+                    ),
+                    line=dict(width=1), 
+                )
+                return fig
+            fig = cached_chart(query, 'society.doctor_scatter', build_doctor_chart, reads=(COUNTRIES, YEAR))
+            # Show the scatter plot
+            st.plotly_chart(fig)
+    
+    col4, col5, col6 = st.columns([1, 2, 2])
+    with col4:
+        st.markdown('''<div class="custom3", style="height: 525px;">
+                        <h6><center>TỈ LỆ HỘ NGHÈO</center></h6>
+                        <p>Tỉ lệ hộ nghèo, tỉ lệ thất nghiệp cho mức độ sống của người dân, và những thách thức mà nhà nước đang phải đối mặt.</p>
+                        <p>Các nước có GDP bình quân đầu người cao chưa chắc đã có tỉ lệ hộ nghèo thấp như: USA, Canada, Australia. 
+                        Cho thấy sự chênh lệch giai cấp trong các xã hội này là vô cùng lớn.</p></div>
+                    ''', unsafe_allow_html=True)
+    with col5:
+        title = f'TỈ LỆ HỘ NGHÈO VÀ DÂN SỐ CỦA CÁC QUỐC GIA NĂM {selected_year}'
+        st.markdown(f'''<div class="custom3", style="height: 75px;">
+                    <center><strong>{title}</strong></center>
+                    </div>
+                    ''', unsafe_allow_html=True)
+        if selected_countries:
+            def build_poverty_chart():
+                melted_data = query.long_form('poverty', selected_year, selected_countries)
+
+                # Create the grouped bar chart
+                fig = px.bar(melted_data, 
+                            x='Quốc gia', 
+                            y='Value (%)', 
+                            color='Metric',  # Color by 'Metric'
+                            barmode='group',  # Grouped bars
+                            labels={
+                                'Metric': 'Chỉ số',
+                                'Value (%)': 'Tỉ lệ (%)',
+                                'Quốc gia': 'Quốc gia',
+                            },
+                            color_discrete_map={
+                                'Thất nghiệp': color_palette[1],
+                                'Hộ nghèo': color_palette[0],  
+                            },
+                            hover_name = 'Metric',
+                            )
+                chart_layout = get_chart_layout()
+                chart_layout['legend']['title']['text'] = 'Chỉ số'  
+                fig.update_layout(**chart_layout)
+                return fig
+            fig = cached_chart(query, 'society.poverty_bar', build_poverty_chart, reads=(COUNTRIES, YEAR))
+
+            # Show the chart
+            st.plotly_chart(fig)
+    with col6:
+        title = f'TỈ LỆ HỘ NGHÈO VÀ GDP BÌNH QUÂN ĐẦU NGƯỜI CỦA CÁC QUỐC GIA NĂM {selected_year}'
+        st.markdown(f'''<div class="custom3", style="height: 75px;">
+                    <center><strong>{title}</strong></center>
+                     </div>
+                    ''', unsafe_allow_html=True) 
+        
+    # Scatter plot for Poverty-Rate vs GDP per Capita
+        if selected_countries:
+            def build_poverty_gdp_chart():
+                health_data = query.select(selected_countries, year=selected_year,
+                                           columns=['Quốc gia', 'Tỷ lệ nghèo (%)', 'GDP bình quân đầu người (USD)'],
+                                           valid=True)
+                # Create a scatter plot using Plotly
+                fig = px.scatter(health_data, x='Tỷ lệ nghèo (%)', y='GDP bình quân đầu người (USD)', 
+                            color='Quốc gia', 
+                            title=' Tỷ lệ nghèo (%) vs GDP bình quân đầu người (USD)',
+                            labels={'Tỷ lệ nghèo (%)': 'Tỉ lệ hộ nghèo (%)',
+                                    'GDP bình quân đầu người (USD)': 'GDP bình quân (in USD)'},
+                            size_max = 40,
+                            render_mode=scatter_render_mode(health_data))
+            
+                # Vietnamese translation for the legend title
+                fig.update_layout(**get_chart_layout())
+
+                fig.update_traces(
+                    marker=dict(# Slightly smaller markers
+                        size=10,
+                        line=dict(width=1, color='DarkSlateGrey')
+                    ),
+                    line=dict(width=1), 
+                )
+                return fig
+            fig = cached_chart(query, 'society.poverty_gdp_scatter', build_poverty_gdp_chart, reads=(COUNTRIES, YEAR))
+            # Show the scatter plot
+            st.plotly_chart(fig) 
@@ -0,0 +1,28 @@
+"""Plotly template shared by the chart pages.
+
+Importing this module registers the ``dashboard`` template and makes it
+the default for every figure built afterwards.  It replaces the template
+Streamlit installs, which embeds defaults for trace types these pages
+never draw (heatmaps, tables, waterfalls, ...) into every figure payload.
+
+The template carries the palette, so charts no longer pass
+``color_discrete_sequence``.  Backgrounds, grids, fonts and the legend
+stay in each figure's layout (get_chart_layout): with
+``theme="streamlit"`` the browser merges Streamlit's own styling over
+``layout.template.layout``, so only explicit layout values win over it.
+"""
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from dashboard.views.common import color_palette
+
+TEMPLATE = 'dashboard'
+
+pio.templates[TEMPLATE] = go.layout.Template(
+    layout=go.Layout(colorway=color_palette),
+    data=go.layout.template.Data(
+        # Streamlit's default: no marker outline unless a chart sets one
+        scatter=[go.Scatter(marker=dict(line=dict(width=0)))],
+    ),
+)
+pio.templates.default = TEMPLATE
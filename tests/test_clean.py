@@ -0,0 +1,90 @@
+"""Out-of-range policies of dashboard.clean and the validity bitmaps built on them."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard import clean
+from dashboard.schema import COUNTRY, YEAR
+
+SHARE = 'Tỷ lệ sử dụng Internet (%)'
+RATE = 'Tỷ lệ lạm phát (%)'
+GDP = 'GDP (nghìn tỷ USD)'
+
+
+def make_frame():
+    return pd.DataFrame({
+        COUNTRY: pd.Categorical(['A', 'A', 'B', 'B', 'C']),
+        YEAR: np.array([2000, 2001, 2000, 2001, 2000], dtype=np.int16),
+        SHARE: np.array([-5, 50, 120, np.nan, 100], dtype=np.float32),
+        RATE: np.array([-5, 50, 120, 3, np.nan], dtype=np.float32),
+        GDP: np.array([1, np.nan, 2, 3, 4], dtype=np.float32),
+    })
+
+
+def test_clamp(monkeypatch):
+    monkeypatch.setattr(clean, 'POLICY', 'clamp')
+    report = clean.Report()
+    frame = clean.clean(make_frame(), report)
+    np.testing.assert_array_equal(frame[SHARE], np.array([0, 50, 100, np.nan, 100], dtype=np.float32))
+    assert frame[SHARE].dtype == np.float32
+    # Rates that can be negative or above 100 are left alone
+    np.testing.assert_array_equal(frame[RATE], make_frame()[RATE])
+    assert report.out_of_range == {SHARE: 2}
+
+
+def test_flag(monkeypatch):
+    monkeypatch.setattr(clean, 'POLICY', 'flag')
+    report = clean.Report()
+    frame = clean.clean(make_frame(), report)
+    pd.testing.assert_frame_equal(frame, make_frame())
+    assert report.out_of_range == {SHARE: 2}
+    np.testing.assert_array_equal(clean.is_valid(frame[SHARE].to_numpy(), SHARE), [False, True, False, False, True])
+    np.testing.assert_array_equal(clean.is_valid(frame[RATE].to_numpy(), RATE), [True, True, True, True, False])
+
+
+def test_null(monkeypatch):
+    monkeypatch.setattr(clean, 'POLICY', 'null')
+    report = clean.Report()
+    frame = clean.clean(make_frame(), report)
+    np.testing.assert_array_equal(frame[SHARE], np.array([np.nan, 50, np.nan, np.nan, 100], dtype=np.float32))
+    assert frame[SHARE].dtype == np.float32
+    assert report.out_of_range == {SHARE: 2}
+    np.testing.assert_array_equal(clean.is_valid(frame[SHARE].to_numpy(), SHARE), [False, True, False, False, True])
+
+
+@pytest.mark.parametrize('policy', clean.POLICIES)
+def test_validity_bits(policy, monkeypatch):
+    monkeypatch.setattr(clean, 'POLICY', policy)
+    # More than 8 rows, so the bitmaps span several bytes
+    frame = pd.concat([make_frame()] * 4, ignore_index=True)
+    clean.clean(frame)
+    validity = clean.Validity.from_frame(frame)
+    assert SHARE in validity and GDP in validity and COUNTRY not in validity
+    positions = np.arange(len(frame))
+    for c in (SHARE, RATE, GDP):
+        np.testing.assert_array_equal(validity.bits(c, positions), clean.is_valid(frame[c].to_numpy(), c))
+    # Any subset of rows, in any order
+    positions = np.array([19, 3, 8, 0, 12])
+    np.testing.assert_array_equal(validity.bits(SHARE, positions), clean.is_valid(frame[SHARE].to_numpy()[positions], SHARE))
+
+
+@pytest.mark.parametrize('policy', clean.POLICIES)
+def test_valid_rows(policy, monkeypatch):
+    monkeypatch.setattr(clean, 'POLICY', policy)
+    frame = clean.clean(make_frame())
+    expected = np.ones(len(frame), dtype=bool)
+    for c in (SHARE, GDP):
+        expected &= clean.is_valid(frame[c].to_numpy(), c)
+    np.testing.assert_array_equal(clean.valid_rows(frame, [COUNTRY, YEAR, SHARE, GDP]), expected)
+    # Country and year are never checked
+    assert clean.valid_rows(frame, [COUNTRY, YEAR]).all()
+
+    # The same answer from the bitmaps, for rows picked out of the frame they were built from
+    validity = clean.Validity.from_frame(frame)
+    positions = np.array([4, 2, 0])
+    rows = frame.iloc[positions].reset_index(drop=True)
+    np.testing.assert_array_equal(clean.valid_rows(rows, [SHARE, GDP], validity, positions), expected[positions])
+    # Columns the bitmaps do not cover are checked on the values
+    rows['Tăng trưởng GDP (%)'] = np.array([np.nan, 1, 1], dtype=np.float32)
+    np.testing.assert_array_equal(clean.valid_rows(rows, [GDP, 'Tăng trưởng GDP (%)'], validity, positions),
+                                  [False, True, True])
@@ -0,0 +1,72 @@
+"""Growth and Indexed columns (dashboard.derived) agree across every query backend and the SQL source."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard import derived
+from dashboard.duckdb_backend import HAVE_DUCKDB
+from dashboard.partitioned import write_partitioned
+from dashboard.query import BACKENDS, load_query
+from dashboard.schema import COUNTRY, YEAR
+from dashboard.sources import SQLSource, write_table
+from dashboard.synthetic import write_dataset
+
+FIRST, LAST = 2000, 2009
+NAMES = [name for name, spec in derived.DERIVED.items() if isinstance(spec, (derived.Growth, derived.Indexed))]
+COLUMNS = [COUNTRY, YEAR] + NAMES + derived.dataset_columns(NAMES)
+
+SELECTIONS = [
+    {},
+    # The previous year of the first selected one is outside the range
+    {'years': (FIRST + 3, FIRST + 6)},
+    {'year': FIRST + 5},
+    {'year': FIRST},
+    {'years': (LAST - 2, LAST), 'countries': ['Nước 003', 'Nước 011', 'Nước 999']},
+    {'years': (FIRST + 2, LAST), 'year': FIRST + 4, 'countries': ['Nước 007']},
+]
+
+
+def queries(path, tmp_path):
+    """{name: query} of every backend over the dataset at `path`."""
+    parts = write_partitioned(path, str(tmp_path / 'data.parts'), block=4)
+    found = {}
+    for backend in BACKENDS:
+        if backend == 'duckdb' and not HAVE_DUCKDB:
+            continue
+        found[backend] = load_query(parts if backend == 'partitioned' else path, COLUMNS, backend)
+    url = f'sqlite:///{tmp_path / "data.db"}'
+    write_table(path, url)
+    found['sql'] = SQLSource.from_url(url).query(COLUMNS)
+    return found
+
+
+@pytest.mark.parametrize('base', [None, FIRST + 4, FIRST - 10, LAST + 3],
+                         ids=['first-year', 'inside', 'before-data', 'after-data'])
+def test_parity(base, tmp_path, monkeypatch):
+    monkeypatch.setattr(derived, 'BASE_YEAR', base)
+    # A fresh file per base year: the backends cache what they derive per file
+    path, _ = write_dataset(str(tmp_path / 'data.csv'), countries=12, years=(FIRST, LAST), seed=3,
+                            missing=0.1, snapshot=False)
+    found = queries(path, tmp_path)
+    expected = found.pop('pandas')
+    frame = expected.select(columns=COLUMNS)
+    assert frame[NAMES].notna().any().all() == (base is None or FIRST <= base <= LAST)
+    for selection in SELECTIONS:
+        want = expected.select(columns=COLUMNS, **selection)
+        for name, query in found.items():
+            got = query.select(columns=COLUMNS, **selection)
+            pd.testing.assert_frame_equal(got.reset_index(drop=True), want.reset_index(drop=True),
+                                          check_exact=True, check_categorical=False, obj=f'{name} {selection}')
+
+
+def test_growth_and_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(derived, 'BASE_YEAR', FIRST + 1)
+    path, _ = write_dataset(str(tmp_path / 'data.csv'), countries=3, years=(FIRST, LAST), seed=3,
+                            missing=0, snapshot=False)
+    frame = load_query(path, COLUMNS, 'pandas').select(columns=COLUMNS)
+    gdp = frame['GDP (nghìn tỷ USD)'].to_numpy(np.float64).reshape(3, -1)
+    growth = frame['Tăng trưởng GDP (%)'].to_numpy().reshape(3, -1)
+    index = frame['Chỉ số GDP (năm gốc = 100)'].to_numpy().reshape(3, -1)
+    assert np.isnan(growth[:, 0]).all()
+    np.testing.assert_allclose(growth[:, 1:], (gdp[:, 1:] / gdp[:, :-1] - 1) * 100, rtol=1e-5)
+    np.testing.assert_allclose(index, gdp / gdp[:, 1:2] * 100, rtol=1e-5)
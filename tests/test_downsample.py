@@ -0,0 +1,103 @@
+"""Point budgets of the year-range charts (dashboard.downsample)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.downsample import downsample, lttb_indices, minmax_indices
+
+
+def series_frame(values):
+    """Rows country by country, x ascending; `values` maps a country to its y values."""
+    return pd.DataFrame({
+        'Quốc gia': np.repeat(list(values), [len(v) for v in values.values()]),
+        'x': np.concatenate([np.arange(len(v)) for v in values.values()]),
+        'y': np.concatenate([np.asarray(v, dtype=float) for v in values.values()]),
+    })
+
+
+def lttb(y, n_out):
+    return lttb_indices(np.tile(np.arange(y.shape[1], dtype=float), (len(y), 1)), y, n_out)
+
+
+@pytest.mark.parametrize('reduce', [lttb, minmax_indices], ids=['lttb', 'minmax'])
+def test_indices(reduce):
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=(3, 200))
+    y[1] = 7
+    kept = reduce(y, 20)
+    assert kept.shape[0] == 3 and kept.shape[1] <= 20
+    for row in kept:
+        # Distinct positions, in order, within the series
+        assert (np.diff(row) > 0).all()
+        assert 0 <= row[0] and row[-1] < 200
+    # Within budget every position is kept
+    np.testing.assert_array_equal(reduce(y[:, :20], 20), np.tile(np.arange(20), (3, 1)))
+
+
+def test_lttb_keeps_ends():
+    y = np.random.default_rng(1).normal(size=(2, 100))
+    kept = lttb(y, 10)
+    assert kept.shape == (2, 10)
+    assert (kept[:, 0] == 0).all() and (kept[:, -1] == 99).all()
+
+
+def test_minmax_keeps_extremes():
+    y = np.random.default_rng(2).normal(size=(2, 100))
+    kept = minmax_indices(y, 10)
+    for row, values in zip(kept, y):
+        assert values.argmin() in row and values.argmax() in row
+
+
+def test_minmax_flat():
+    np.testing.assert_array_equal(minmax_indices(np.ones((1, 10)), 4), [[0, 4, 5, 9]])
+    # Only the flat bucket stands in its ends
+    y = np.array([[3, 3, 3, 3, 3, 1, 4, 1, 5, 9]], dtype=float)
+    np.testing.assert_array_equal(minmax_indices(y, 4), [[0, 4, 5, 9]])
+    y[0, 5:] = y[0, 5:][::-1]
+    np.testing.assert_array_equal(minmax_indices(y, 4), [[0, 4, 5, 7]])
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+def test_within_budget(method):
+    frame = series_frame({'A': [1, np.nan, 3], 'B': [4, 5, np.nan, 7]})
+    # Kept whole, missing values included
+    assert downsample(frame, 'x', 'y', 4, method=method) is frame
+    assert downsample(frame, 'x', 'y', 4, method=method, align=True) is frame
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+def test_drops_missing_values(method):
+    long = np.sin(np.arange(120) / 7)
+    long[[0, 5, 50, 119]] = np.nan
+    frame = series_frame({'A': long, 'B': [1, np.nan, 3], 'C': np.cos(np.arange(120) / 5)})
+    result = downsample(frame, 'x', 'y', 60, method=method)
+    assert result.index.is_monotonic_increasing and result.index.is_unique
+    counts = result.groupby('Quốc gia').size()
+    assert counts['A'] <= 60 and counts['C'] <= 60
+    # A short series keeps its missing value, a long one drops them
+    assert result[result['Quốc gia'] == 'B']['y'].isna().sum() == 1
+    assert result[result['Quốc gia'] == 'A']['y'].notna().all()
+    # Rows come from the frame unchanged
+    pd.testing.assert_frame_equal(result, frame.loc[result.index])
+
+
+def test_invalid_method():
+    frame = series_frame({'A': np.arange(100)})
+    with pytest.raises(ValueError, match='unknown downsampling method'):
+        downsample(frame, 'x', 'y', 10, method='mean')
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+def test_align(method):
+    rng = np.random.default_rng(3)
+    frame = series_frame({country: rng.normal(size=100).cumsum() for country in 'ABC'})
+    result = downsample(frame, 'x', 'y', 20, method=method, align=True)
+    kept = [set(group['x']) for _, group in result.groupby('Quốc gia')]
+    # The same x values in every series, chosen from the totals across series
+    assert kept[0] == kept[1] == kept[2]
+    assert len(kept[0]) <= 20
+    totals = frame.groupby('x')['y'].sum()
+    if method == 'minmax':
+        assert totals.idxmin() in kept[0] and totals.idxmax() in kept[0]
+    else:
+        assert {0, 99} <= kept[0]
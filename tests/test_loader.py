@@ -0,0 +1,54 @@
+"""Which file the loader serves for a CSV with a snapshot or shared file next to it (resolve_source)."""
+import os
+
+import pytest
+
+from dashboard.ingest import write_shared, write_snapshot
+from dashboard.loader import HAVE_PYARROW, resolve_source
+from dashboard.synthetic import write_dataset
+
+pytestmark = pytest.mark.skipif(not HAVE_PYARROW, reason='snapshots need pyarrow')
+
+
+@pytest.fixture(params=[write_snapshot, write_shared], ids=['snapshot', 'shared'])
+def written(request, tmp_path):
+    """(CSV path, path of its snapshot or shared file)."""
+    path, _ = write_dataset(str(tmp_path / 'data.csv'), countries=5, years=(2000, 2003), snapshot=False)
+    return path, request.param(path)
+
+
+def set_mtime(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_newer_snapshot(written):
+    path, candidate = written
+    set_mtime(path, os.stat(candidate).st_mtime_ns - 10**9)
+    assert resolve_source(path) == candidate
+
+
+def test_older_snapshot(written):
+    path, candidate = written
+    set_mtime(path, os.stat(candidate).st_mtime_ns + 10**9)
+    assert resolve_source(path) == path
+
+
+def test_edit_with_tied_mtime(written):
+    path, candidate = written
+    mtime = os.stat(candidate).st_mtime_ns
+    set_mtime(path, mtime)
+    assert resolve_source(path) == candidate
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('Nước mới,2004' + ',' * 34 + '\n')
+    set_mtime(path, mtime)
+    assert resolve_source(path) == path
+
+
+def test_edit_copied_in_with_older_mtime(written):
+    path, candidate = written
+    with open(path, encoding='utf-8-sig') as f:
+        text = f.read()
+    with open(path, 'w', encoding='utf-8-sig') as f:
+        f.write(text.replace('2003', '2004'))
+    set_mtime(path, os.stat(candidate).st_mtime_ns - 10**9)
+    assert resolve_source(path) == path
@@ -0,0 +1,30 @@
+"""Every page renders on a synthetic dataset with blank cells (dashboard.synthetic)."""
+import os
+from unittest import mock
+
+import pytest
+
+from dashboard.synthetic import write_dataset
+from dashboard.views import PAGES
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, 'final.py')
+
+
+@pytest.fixture(scope='module')
+def dataset(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('data') / 'synthetic.csv')
+    # Default missing rate: some bubble sizes and axis values are blank
+    write_dataset(path, snapshot=False)
+    return path
+
+
+@pytest.mark.parametrize('page', list(PAGES))
+def test_page_renders(page, dataset, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+
+    monkeypatch.setenv('DASHBOARD_DATA', dataset)
+    at = AppTest.from_file(APP, default_timeout=600)
+    with mock.patch('streamlit_option_menu.option_menu', return_value=page):
+        at.run()
+    assert not at.exception, at.exception[0].message if at.exception else None
@@ -0,0 +1,102 @@
+"""Appending new years to a partitioned dataset (dashboard.partitioned.append_partitioned)."""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.clean import read_frame
+from dashboard.partitioned import MANIFEST, PartitionedDataset, append_partitioned, write_partitioned
+from dashboard.schema import COUNTRY, YEAR
+from dashboard.synthetic import generate
+
+FIRST, LAST = 2000, 2006
+# Small blocks, so a year spans several fragments
+BLOCK = 4
+
+
+def write_csv(frame, path):
+    frame.to_csv(path, index=False, encoding='utf-8-sig')
+    return str(path)
+
+
+@pytest.fixture
+def csvs(tmp_path):
+    """The CSVs of the years before LAST, of LAST (with a country seen for the first time) and of both."""
+    frame = generate(countries=10, years=(FIRST, LAST), seed=1)
+    old = frame[frame[YEAR] < LAST]
+    new = frame[frame[YEAR] == LAST]
+    extra = new.iloc[:1].assign(**{COUNTRY: 'Nước mới'})
+    new = pd.concat([new, extra], ignore_index=True)
+    return (write_csv(old, tmp_path / 'old.csv'), write_csv(new, tmp_path / 'new.csv'),
+            write_csv(pd.concat([old, new], ignore_index=True), tmp_path / 'full.csv'))
+
+
+def test_append_equals_full_load(csvs, tmp_path):
+    old, new, full = csvs
+    appended = write_partitioned(old, str(tmp_path / 'appended.parts'), block=BLOCK)
+    assert append_partitioned(new, appended, block=BLOCK) == [LAST]
+    whole = write_partitioned(full, str(tmp_path / 'whole.parts'), block=BLOCK)
+
+    appended, whole = PartitionedDataset.open(appended), PartitionedDataset.open(whole)
+    assert appended.countries == whole.countries
+    assert appended.shape == whole.shape
+    assert appended.year_bounds == (FIRST, LAST)
+    for selection in [{}, {'years': (LAST - 2, LAST)}, {'years': (LAST, LAST)},
+                      {'countries': ['Nước mới', whole.countries[3]], 'years': (FIRST, LAST)}]:
+        pd.testing.assert_frame_equal(appended.scan(**selection), whole.scan(**selection), check_exact=True)
+
+    # And the same rows as reading the CSV in one go, grouped by country
+    frame = read_frame(full)
+    frame = frame.iloc[np.lexsort((frame[YEAR], frame[COUNTRY].cat.codes))].reset_index(drop=True)
+    frame[COUNTRY] = frame[COUNTRY].astype(pd.CategoricalDtype(appended.countries))
+    pd.testing.assert_frame_equal(appended.scan(), frame, check_exact=True)
+
+
+def test_duplicate_year_rejected(csvs, tmp_path):
+    old, new, _ = csvs
+    path = write_partitioned(old, str(tmp_path / 'data.parts'), block=BLOCK)
+    append_partitioned(new, path, block=BLOCK)
+    with open(os.path.join(path, MANIFEST), 'rb') as f:
+        manifest = f.read()
+    with pytest.raises(ValueError, match='already in the dataset'):
+        append_partitioned(new, path, block=BLOCK)
+    # A CSV with one year already there and one new is rejected whole
+    overlap = pd.read_csv(new, encoding='utf-8-sig')
+    overlap = pd.concat([overlap, overlap.assign(**{YEAR: LAST + 1})], ignore_index=True)
+    with pytest.raises(ValueError, match=r'already in the dataset: \[%d\]' % LAST):
+        append_partitioned(write_csv(overlap, tmp_path / 'overlap.csv'), path, block=BLOCK)
+    with open(os.path.join(path, MANIFEST), 'rb') as f:
+        assert f.read() == manifest
+
+
+def test_duplicate_rows_rejected(csvs, tmp_path):
+    old, new, _ = csvs
+    path = write_partitioned(old, str(tmp_path / 'data.parts'), block=BLOCK)
+    twice = pd.read_csv(new, encoding='utf-8-sig')
+    twice = pd.concat([twice, twice.iloc[:1]], ignore_index=True)
+    with pytest.raises(ValueError, match='repeats'):
+        append_partitioned(write_csv(twice, tmp_path / 'twice.csv'), path, block=BLOCK)
+
+
+def test_data_version(csvs, tmp_path):
+    old, new, _ = csvs
+    path = write_partitioned(old, str(tmp_path / 'data.parts'), block=BLOCK)
+    before = PartitionedDataset.open(path)
+    kept = [before.data_version(years=(FIRST, LAST - 1)), before.data_version(year=FIRST + 2),
+            before.data_version(years=(FIRST, FIRST + 1), year=LAST - 1)]
+    added = [before.data_version(year=LAST), before.data_version(years=(LAST - 1, LAST))]
+
+    append_partitioned(new, path, block=BLOCK)
+    after = PartitionedDataset.open(path)
+    assert after is not before
+    # Anything built from the years already there stays valid
+    assert [after.data_version(years=(FIRST, LAST - 1)), after.data_version(year=FIRST + 2),
+            after.data_version(years=(FIRST, FIRST + 1), year=LAST - 1)] == kept
+    # What reads the new year does not
+    assert after.data_version(year=LAST) != added[0]
+    assert after.data_version(years=(LAST - 1, LAST)) != added[1]
+    assert after.data_version() != before.data_version()
+    with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+        assert json.load(f)['appends'][0]['years'] == [LAST]
@@ -0,0 +1,148 @@
+"""The series store (dashboard.series) gives back exactly the frame it encoded, for any selection."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from dashboard.schema import COUNTRY, YEAR
+from dashboard.series import BLOCK, SeriesDataset
+
+GDP = 'GDP (nghìn tỷ USD)'
+RATE = 'Tỷ lệ lạm phát (%)'
+SHARE = 'Tỷ lệ sử dụng Internet (%)'
+F32 = np.finfo(np.float32)
+
+
+def make_frame(countries, years, values):
+    """Rows country by country, years ascending; `values` maps a column to a (country, year) grid."""
+    return pd.DataFrame({
+        COUNTRY: pd.Categorical(np.repeat(countries, len(years)), categories=countries),
+        YEAR: np.tile(np.asarray(years, dtype=np.int16), len(countries)),
+        **{c: np.asarray(grid, dtype=np.float32).ravel() for c, grid in values.items()},
+    })
+
+
+def expected(frame, countries, years, columns):
+    """The rows scan() should return, selected with pandas."""
+    keep = np.ones(len(frame), dtype=bool)
+    if countries is not None:
+        keep &= frame[COUNTRY].isin(countries).to_numpy()
+    if years is not None:
+        keep &= frame[YEAR].between(*years).to_numpy()
+    return frame.loc[keep, [COUNTRY, YEAR] + columns].reset_index(drop=True)
+
+
+def assert_scan(dataset, frame, countries=None, years=None, columns=None):
+    # The frames here hold a few indicators, so every column is asked for by name
+    columns = [c for c in frame.columns if c not in (COUNTRY, YEAR)] if columns is None else columns
+    result = dataset.scan(countries, years, columns)
+    want = expected(frame, countries, years, columns)
+    want[COUNTRY] = want[COUNTRY].astype(pd.CategoricalDtype(dataset.countries))
+    pd.testing.assert_frame_equal(result, want, check_exact=True)
+
+
+@pytest.fixture(scope='module')
+def walk():
+    """Random walks over 3 * BLOCK + 3 years: two decimals, negative and growing values, blank cells."""
+    rng = np.random.default_rng(0)
+    countries = ['A', 'B', 'C', 'D']
+    years = list(range(1990, 1990 + 3 * BLOCK + 3))
+    shape = (len(countries), len(years))
+    gdp = np.round(np.cumsum(rng.normal(0, 5, shape), axis=1), 2)
+    gdp[rng.random(shape) < 0.2] = np.nan
+    rate = np.round(rng.normal(0, 1000, shape), 1)
+    rate[1] = np.nan
+    frame = make_frame(countries, years, {GDP: gdp, RATE: rate})
+    return frame, SeriesDataset(frame)
+
+
+def test_round_trip(walk):
+    frame, dataset = walk
+    assert dataset.series[GDP].decimals == 2
+    assert_scan(dataset, frame)
+    assert_scan(dataset, frame, countries=['C', 'A', 'X'], columns=[RATE])
+
+
+def test_ranges_between_anchors(walk):
+    frame, dataset = walk
+    first, last = dataset.year_bounds
+    # Every range, including those starting and ending on either side of an anchor
+    for lo in range(first, last + 1):
+        for hi in range(lo, last + 1):
+            assert_scan(dataset, frame, countries=['B', 'D'], years=(lo, hi))
+    # Ranges reaching past the data, and empty ones
+    assert_scan(dataset, frame, years=(first - 5, first + BLOCK))
+    assert_scan(dataset, frame, years=(last - 1, last + 5))
+    assert_scan(dataset, frame, years=(last + 1, last + 5))
+    assert_scan(dataset, frame, countries=[])
+
+
+def test_all_nan():
+    years = list(range(2000, 2000 + 2 * BLOCK))
+    nan = np.full((2, len(years)), np.nan)
+    gdp = np.arange(2 * len(years), dtype=np.float32).reshape(2, -1)
+    gdp[0] = np.nan
+    frame = make_frame(['A', 'B'], years, {GDP: gdp, RATE: nan})
+    dataset = SeriesDataset(frame)
+    assert_scan(dataset, frame)
+    assert_scan(dataset, frame, years=(2003, 2011))
+
+
+def test_single_year():
+    frame = make_frame(['A', 'B', 'C'], [2015], {GDP: [[1.5], [np.nan], [-2.25]], RATE: [[np.nan]] * 3})
+    dataset = SeriesDataset(frame)
+    assert dataset.year_bounds == (2015, 2015)
+    assert_scan(dataset, frame)
+    assert_scan(dataset, frame, years=(2015, 2015))
+    assert_scan(dataset, frame, years=(2000, 2014))
+
+
+def test_single_year_selection(walk):
+    frame, dataset = walk
+    for year in range(dataset.year_bounds[0], dataset.year_bounds[1] + 1):
+        assert_scan(dataset, frame, years=(year, year), columns=[GDP])
+
+
+def test_negative_and_large_deltas():
+    years = list(range(2000, 2000 + 2 * BLOCK + 1))
+    swing = np.where(np.arange(len(years)) % 2, 2e9, -2e9)
+    grids = {
+        # Deltas of 4e9, wider than 32 bits
+        GDP: [swing, -swing],
+        # Falling every year, by ever more
+        RATE: [-np.cumsum(np.arange(len(years)) ** 3), np.full(len(years), -7.5)],
+        # Flat: deltas of 0 bits
+        SHARE: [np.full(len(years), 42), np.full(len(years), 0)],
+    }
+    frame = make_frame(['A', 'B'], years, grids)
+    dataset = SeriesDataset(frame)
+    assert dataset.series[GDP].decimals == 0 and dataset.series[GDP].widths.max() > 32
+    assert dataset.series[SHARE].widths.max() == 0
+    assert_scan(dataset, frame)
+    assert_scan(dataset, frame, years=(2003, 2012))
+
+
+def test_float32_edges():
+    years = list(range(2000, 2000 + BLOCK + 3))
+    edges = [F32.max, -F32.max, F32.tiny, F32.smallest_subnormal, -0.0, F32.eps, 1 / 3, 16777217]
+    values = np.resize(np.array(edges, dtype=np.float32), len(years))
+    frame = make_frame(['A', 'B'], years, {GDP: [values, values[::-1]], RATE: [[0.1] * len(years), [1e-6] * len(years)]})
+    dataset = SeriesDataset(frame)
+    # No number of decimals represents these exactly: kept as float32
+    assert dataset.series[GDP].decimals is None
+    assert dataset.series[RATE].decimals == 6
+    assert_scan(dataset, frame)
+    assert_scan(dataset, frame, years=(2001, 2009))
+    result = dataset.scan(['A'], columns=[GDP])[GDP].to_numpy()
+    np.testing.assert_array_equal(np.signbit(result), np.signbit(values))
+
+
+def test_missing_rows():
+    years = list(range(2000, 2000 + 2 * BLOCK))
+    frame = make_frame(['A', 'B', 'C'], years, {GDP: np.arange(3 * len(years)).reshape(3, -1) * 0.5})
+    # Country-years without a row at the start, in the middle and at the end
+    frame = frame.drop(index=[0, 1, 20, 21, 22, len(frame) - 1]).reset_index(drop=True)
+    dataset = SeriesDataset(frame)
+    assert dataset.shape == (len(frame), 3)
+    assert_scan(dataset, frame)
+    for lo, hi in [(2000, 2001), (2003, 2010), (2007, 2015)]:
+        assert_scan(dataset, frame, years=(lo, hi))